@@ -1,5 +1,7 @@
 """Multi-Armed Bandit algorithms for ranking model selection."""
 
+import math
+
 import numpy as np
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -7,17 +9,67 @@ from typing import Protocol
 import json
 from datetime import datetime, timezone
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; UCB1 falls back to the NumPy expression
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; SimulationResult.save falls back to json
+    orjson = None
+
 
 class RankingModel(Protocol):
     def predict(self, X: np.ndarray) -> np.ndarray: ...
 
 
-@dataclass
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _ucb_argmax(total_reward, pulls, c, log_total):
+        """Index of the arm with the highest UCB score, in a single pass."""
+        best_idx = 0
+        best_val = total_reward[0] / pulls[0] + c * np.sqrt(log_total / pulls[0])
+        for i in range(1, pulls.shape[0]):
+            val = total_reward[i] / pulls[i] + c * np.sqrt(log_total / pulls[i])
+            if val > best_val:
+                best_val = val
+                best_idx = i
+        return best_idx
+
+    @njit(cache=True, fastmath=True)
+    def _ucb_tuned_argmax(total_reward, sum_sq, pulls, log_total):
+        """Index of the arm with the highest UCB1-Tuned score, in a single pass."""
+        n = pulls[0]
+        mean = total_reward[0] / n
+        variance = sum_sq[0] / n - mean * mean + np.sqrt(2.0 * log_total / n)
+        best_idx = 0
+        best_val = mean + np.sqrt(log_total / n * min(0.25, variance))
+        for i in range(1, pulls.shape[0]):
+            n = pulls[i]
+            mean = total_reward[i] / n
+            variance = sum_sq[i] / n - mean * mean + np.sqrt(2.0 * log_total / n)
+            val = mean + np.sqrt(log_total / n * min(0.25, variance))
+            if val > best_val:
+                best_val = val
+                best_idx = i
+        return best_idx
+
+    # Compile at import so the first select_arm() doesn't pay the JIT latency.
+    _ucb_argmax(np.zeros(1), np.ones(1, dtype=np.int64), 1.0, 0.0)
+    _ucb_tuned_argmax(np.zeros(1), np.zeros(1), np.ones(1, dtype=np.int64), 0.0)
+else:
+    _ucb_argmax = None
+    _ucb_tuned_argmax = None
+
+
+@dataclass(slots=True, frozen=True)
 class ArmStats:
-    """Statistics for a single arm (model)."""
+    """Snapshot of the statistics for a single arm (model)."""
     name: str
     pulls: int = 0
     total_reward: float = 0.0
+    sum_sq: float = 0.0
 
     @property
     def mean_reward(self) -> float:
@@ -25,42 +77,102 @@ class ArmStats:
 
 
 class UCB1:
-    """Upper Confidence Bound algorithm for model selection."""
+    """Upper Confidence Bound algorithm for model selection.
+
+    Per-arm statistics are kept as parallel NumPy arrays indexed by position in
+    ``names`` so selection is a handful of vectorized calls instead of a Python
+    loop over arms.
+    """
 
     def __init__(self, arm_names: list[str], c: float = 2.0):
         self.c = c
-        self.arms = {name: ArmStats(name=name) for name in arm_names}
+        self.names: list[str] = list(arm_names)
+        self._idx: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        # Backing buffers grow by doubling; pulls/total_reward are views of the used prefix
+        self._pulls_buf = np.zeros(max(len(self.names), 4), dtype=np.int64)
+        self._reward_buf = np.zeros(max(len(self.names), 4), dtype=np.float64)
+        self._set_views()
         self.total_pulls = 0
+        # One-slot cache of log(total_pulls): (total_pulls it was computed for, value)
+        self._log_cache = (0, 0.0)
+
+    @property
+    def arms(self) -> dict[str, ArmStats]:
+        """Snapshot of the per-arm statistics."""
+        return {
+            name: ArmStats(name=name, pulls=int(self.pulls[i]), total_reward=float(self.total_reward[i]))
+            for i, name in enumerate(self.names)
+        }
+
+    def _set_views(self):
+        n = len(self.names)
+        self.pulls = self._pulls_buf[:n]
+        self.total_reward = self._reward_buf[:n]
+
+    def add_arm(self, name: str):
+        """Register a new arm with no observations."""
+        if name in self._idx:
+            return
+        n = len(self.names)
+        if n == self._pulls_buf.shape[0]:
+            # np.resize repeats the data to fill, so zero the new tail
+            self._pulls_buf = np.resize(self._pulls_buf, 2 * n)
+            self._reward_buf = np.resize(self._reward_buf, 2 * n)
+            self._pulls_buf[n:] = 0
+            self._reward_buf[n:] = 0.0
+        self._idx[name] = n
+        self.names.append(name)
+        self._set_views()
+
+    def set_arm(self, name: str, pulls: int, total_reward: float):
+        """Overwrite the statistics of an arm, keeping ``total_pulls`` consistent."""
+        i = self._idx[name]
+        self.total_pulls += pulls - int(self.pulls[i])
+        self.pulls[i] = pulls
+        self.total_reward[i] = total_reward
+
+    def _log_total_pulls(self) -> float:
+        """log(total_pulls), recomputed only when total_pulls changed since the last call."""
+        total, log_total = self._log_cache
+        if total != self.total_pulls:
+            log_total = math.log(self.total_pulls) if self.total_pulls >= 1 else 0.0
+            self._log_cache = (self.total_pulls, log_total)
+        return log_total
 
     def select_arm(self) -> str:
         """Select arm using UCB1 formula."""
         # First, try each arm once
-        for name, stats in self.arms.items():
-            if stats.pulls == 0:
-                return name
+        if not self.pulls.all():
+            return self.names[int(np.argmin(self.pulls))]
 
         # UCB1 selection
-        best_arm = None
-        best_ucb = -float('inf')
-
-        for name, stats in self.arms.items():
-            exploration = self.c * np.sqrt(np.log(self.total_pulls) / stats.pulls)
-            ucb = stats.mean_reward + exploration
-            if ucb > best_ucb:
-                best_ucb = ucb
-                best_arm = name
+        log_total = self._log_total_pulls()
+        if _ucb_argmax is not None:
+            return self.names[_ucb_argmax(self.total_reward, self.pulls, self.c, log_total)]
 
-        return best_arm
+        mean = self.total_reward / self.pulls
+        exploration = self.c * np.sqrt(log_total / self.pulls)
+        return self.names[int(np.argmax(mean + exploration))]
 
     def update(self, arm_name: str, reward: float):
         """Update arm statistics after receiving reward."""
-        self.arms[arm_name].pulls += 1
-        self.arms[arm_name].total_reward += reward
+        i = self._idx[arm_name]
+        self.pulls[i] += 1
+        self.total_reward[i] += reward
         self.total_pulls += 1
 
+    def snapshot_arrays(self) -> tuple[tuple[str, ...], np.ndarray, np.ndarray]:
+        """Return ``(names, pulls, total_reward)``.
+
+        The arrays are views of the bandit's own buffers, not copies; they are only
+        valid until the next ``add_arm``, ``update`` or ``set_arm``.
+        """
+        return tuple(self.names), self.pulls, self.total_reward
+
     def get_best_arm(self) -> str:
         """Return arm with highest mean reward."""
-        return max(self.arms.values(), key=lambda a: a.mean_reward).name
+        # Unpulled arms score 0.0, as ArmStats.mean_reward does
+        return self.names[int(np.argmax(self.total_reward / np.maximum(self.pulls, 1)))]
 
     def get_stats(self) -> dict:
         """Return current statistics for all arms."""
@@ -74,52 +186,158 @@ class UCB1:
         }
 
 
-class ThompsonSampling:
-    """Thompson Sampling for model selection (Beta-Bernoulli)."""
+class UCB1Tuned(UCB1):
+    """UCB1-Tuned (Auer et al., 2002): UCB1 with a variance-aware exploration bonus.
+
+    The bonus is ``sqrt(ln t / n_i * min(1/4, V_i))`` where
+    ``V_i = var_i + sqrt(2 ln t / n_i)`` and ``var_i`` is the empirical reward
+    variance of arm ``i``, tracked through a running sum of squared rewards.
+    Assumes rewards in [0, 1].
+    """
 
     def __init__(self, arm_names: list[str]):
+        self._sum_sq_buf = np.zeros(max(len(arm_names), 4), dtype=np.float64)
+        super().__init__(arm_names)
+
+    def _set_views(self):
+        super()._set_views()
+        self.sum_sq = self._sum_sq_buf[:len(self.names)]
+
+    @property
+    def arms(self) -> dict[str, ArmStats]:
+        """Snapshot of the per-arm statistics."""
+        return {
+            name: ArmStats(
+                name=name,
+                pulls=int(self.pulls[i]),
+                total_reward=float(self.total_reward[i]),
+                sum_sq=float(self.sum_sq[i]),
+            )
+            for i, name in enumerate(self.names)
+        }
+
+    def add_arm(self, name: str):
+        """Register a new arm with no observations."""
+        if name in self._idx:
+            return
+        n = len(self.names)
+        if n == self._sum_sq_buf.shape[0]:
+            self._sum_sq_buf = np.resize(self._sum_sq_buf, 2 * n)
+            self._sum_sq_buf[n:] = 0.0
+        super().add_arm(name)
+
+    def set_arm(self, name: str, pulls: int, total_reward: float, sum_sq: float | None = None):
+        """Overwrite the statistics of an arm.
+
+        ``sum_sq`` defaults to ``total_reward``, which is exact for 0/1 rewards.
+        """
+        super().set_arm(name, pulls, total_reward)
+        self.sum_sq[self._idx[name]] = total_reward if sum_sq is None else sum_sq
+
+    def select_arm(self) -> str:
+        """Select arm using the UCB1-Tuned formula."""
+        if not self.pulls.all():
+            return self.names[int(np.argmin(self.pulls))]
+
+        log_total = self._log_total_pulls()
+        if _ucb_tuned_argmax is not None:
+            return self.names[_ucb_tuned_argmax(self.total_reward, self.sum_sq, self.pulls, log_total)]
+
+        mean = self.total_reward / self.pulls
+        variance = self.sum_sq / self.pulls - mean * mean + np.sqrt(2.0 * log_total / self.pulls)
+        bonus = np.sqrt(log_total / self.pulls * np.minimum(0.25, variance))
+        return self.names[int(np.argmax(mean + bonus))]
+
+    def update(self, arm_name: str, reward: float):
+        """Update arm statistics after receiving reward."""
+        self.sum_sq[self._idx[arm_name]] += reward * reward
+        super().update(arm_name, reward)
+
+    def snapshot_arrays(self) -> tuple[tuple[str, ...], np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(names, pulls, total_reward, sum_sq)`` as views, like ``UCB1.snapshot_arrays``."""
+        return tuple(self.names), self.pulls, self.total_reward, self.sum_sq
+
+    def get_stats(self) -> dict:
+        """Return current statistics for all arms."""
+        return {
+            name: {
+                "pulls": stats.pulls,
+                "total_reward": stats.total_reward,
+                "sum_sq": stats.sum_sq,
+                "mean_reward": stats.mean_reward,
+            }
+            for name, stats in self.arms.items()
+        }
+
+
+class ThompsonSampling:
+    """Thompson Sampling for model selection (Beta-Bernoulli).
+
+    Posterior parameters are kept as parallel NumPy arrays indexed by position
+    in ``names`` so one vector draw samples every arm.
+    """
+
+    def __init__(self, arm_names: list[str], seed: int | None = None):
+        self.names: list[str] = list(arm_names)
+        self._idx: dict[str, int] = {name: i for i, name in enumerate(self.names)}
         # Beta prior: alpha=1, beta=1 (uniform)
-        self.arms = {name: {"alpha": 1.0, "beta": 1.0, "pulls": 0} for name in arm_names}
+        self.alpha = np.ones(len(self.names), dtype=np.float64)
+        self.beta = np.ones(len(self.names), dtype=np.float64)
+        self.pulls = np.zeros(len(self.names), dtype=np.int64)
         self.total_pulls = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def arms(self) -> dict[str, dict]:
+        """Snapshot of the per-arm posterior parameters."""
+        return {
+            name: {"alpha": float(self.alpha[i]), "beta": float(self.beta[i]), "pulls": int(self.pulls[i])}
+            for i, name in enumerate(self.names)
+        }
+
+    def add_arm(self, name: str):
+        """Register a new arm with a uniform prior."""
+        if name in self._idx:
+            return
+        self._idx[name] = len(self.names)
+        self.names.append(name)
+        self.alpha = np.append(self.alpha, 1.0)
+        self.beta = np.append(self.beta, 1.0)
+        self.pulls = np.append(self.pulls, 0)
 
     def select_arm(self) -> str:
         """Select arm by sampling from posterior."""
-        samples = {
-            name: np.random.beta(stats["alpha"], stats["beta"])
-            for name, stats in self.arms.items()
-        }
-        return max(samples, key=samples.get)
+        samples = self._rng.beta(self.alpha, self.beta)
+        return self.names[int(np.argmax(samples))]
 
     def update(self, arm_name: str, reward: float):
         """Update posterior with observed reward (0 or 1)."""
+        i = self._idx[arm_name]
         if reward > 0:
-            self.arms[arm_name]["alpha"] += 1
+            self.alpha[i] += 1
         else:
-            self.arms[arm_name]["beta"] += 1
-        self.arms[arm_name]["pulls"] += 1
+            self.beta[i] += 1
+        self.pulls[i] += 1
         self.total_pulls += 1
 
     def get_best_arm(self) -> str:
         """Return arm with highest expected reward."""
-        expected = {
-            name: stats["alpha"] / (stats["alpha"] + stats["beta"])
-            for name, stats in self.arms.items()
-        }
-        return max(expected, key=expected.get)
+        return self.names[int(np.argmax(self.alpha / (self.alpha + self.beta)))]
 
     def get_stats(self) -> dict:
+        expected = self.alpha / (self.alpha + self.beta)
         return {
             name: {
-                "pulls": stats["pulls"],
-                "alpha": stats["alpha"],
-                "beta": stats["beta"],
-                "expected_reward": stats["alpha"] / (stats["alpha"] + stats["beta"]),
+                "pulls": int(self.pulls[i]),
+                "alpha": float(self.alpha[i]),
+                "beta": float(self.beta[i]),
+                "expected_reward": float(expected[i]),
             }
-            for name, stats in self.arms.items()
+            for i, name in enumerate(self.names)
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     """Results from a MAB simulation."""
     algorithm: str
@@ -141,8 +359,11 @@ class SimulationResult:
             "cumulative_regret": self.cumulative_regret,
             "arm_stats": self.arm_stats,
         }
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
 
 
 class ModelBandit:
@@ -153,14 +374,17 @@ class ModelBandit:
         models: dict[str, RankingModel],
         algorithm: str = "ucb1",
         c: float = 2.0,
+        seed: int | None = None,
     ):
         self.models = models
         arm_names = list(models.keys())
 
         if algorithm == "ucb1":
             self.bandit = UCB1(arm_names, c=c)
+        elif algorithm == "ucb1-tuned":
+            self.bandit = UCB1Tuned(arm_names)
         elif algorithm == "thompson":
-            self.bandit = ThompsonSampling(arm_names)
+            self.bandit = ThompsonSampling(arm_names, seed=seed)
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
 
@@ -8,11 +8,12 @@ This demonstrates:
 2. Gossip-based statistics sharing between peers
 3. BitTorrent-based model distribution with hot-swap capability
 """
+import atexit
 import json
-import os
-from asyncio import run, sleep
+import struct
+import time
+from asyncio import get_running_loop, run, sleep
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 
 import libtorrent as lt
@@ -26,7 +27,7 @@ from ipv8.peer import Peer
 from ipv8.util import run_forever
 from ipv8_service import IPv8
 
-from mab import UCB1, ArmStats
+from mab import UCB1Tuned
 
 # Constants
 PEER1_PORT = 8090
@@ -36,7 +37,11 @@ BT_DOWNLOADER_PORT = 6881
 PEER_DISCOVERY_WAIT = 3
 GOSSIP_INTERVAL = 2.0
 SIMULATION_QUERIES = 100
+QUERY_INTERVAL = 10.0  # Seconds between query bursts
+QUERIES_PER_BURST = 20
 MODEL_ANNOUNCE_DELAY = 10  # Seconds before Peer 1 announces new model
+DOWNLOAD_TIMEOUT = 30  # Seconds to wait for a model download to finish
+UNIFORM_BLOCK_SIZE = 4096  # Click draws pre-sampled per refill
 
 # Simulated model rewards (probability of click@1 for each model)
 MODEL_REWARDS = {
@@ -49,14 +54,48 @@ MODEL_REWARDS = {
 NEW_MODEL_NAME = "SuperModel"
 NEW_MODEL_REWARD = 0.35  # 35% click rate - best model
 
+# Model files are tiny and every peer is on localhost, so skip discovery
+# subsystems (we connect to the seeder directly) and connect aggressively.
+LT_SETTINGS = {
+    "enable_dht": False,
+    "enable_lsd": False,
+    "enable_natpmp": False,
+    "enable_upnp": False,
+    "connection_speed": 200,
+    "min_reconnect_time": 1,
+    "peer_connect_timeout": 3,
+    # Downloads complete on torrent_finished_alert rather than status polling
+    "alert_mask": int(lt.alert.category_t.status_notification | lt.alert.category_t.error_notification),
+    # Disk cache knobs; libtorrent 2.x ignores these in favour of mmap I/O
+    "coalesce_reads": True,
+    "coalesce_writes": True,
+    "use_read_cache": True,
+    "cache_size": 2048,
+}
+
 LOG_FILE = Path(__file__).parent / "mab_demo.log"
 MODELS_DIR = Path(__file__).parent / "models"
 
 
+_log_fh = None
+# strftime only runs when the wall-clock second changes
+_log_second = -1
+_log_prefix = ""
+
+
 def log(message: str) -> None:
-    timestamp = datetime.now().strftime("[%H:%M:%S.%f")[:-3] + "]"
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(f"{timestamp} {message}\n")
+    global _log_fh, _log_second, _log_prefix
+    now = time.time()
+    second = int(now)
+    if second != _log_second:
+        _log_second = second
+        _log_prefix = time.strftime("[%H:%M:%S", time.localtime(second))
+    if _log_fh is None:
+        # Opened on first use so start_mab_demo() can remove the previous log first.
+        # Line buffered: every entry reaches the file at once, even if the process dies.
+        _log_fh = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+        atexit.register(_log_fh.close)
+    _log_fh.write(f"{_log_prefix}.{int((now - second) * 1000):03d}] {message}\n")
     print(message)
 
 
@@ -64,9 +103,39 @@ def log(message: str) -> None:
 class MABStatsMessage(DataClassPayload[10]):
     """Message containing MAB statistics from a peer."""
     sender_id: int
-    arm_names: str  # JSON-encoded list
-    pulls: str      # JSON-encoded list of pull counts
-    rewards: str    # JSON-encoded list of total rewards
+    names_blob: bytes  # Length-prefixed (<H) UTF-8 arm names
+    stats_blob: bytes  # Interleaved (<Qdd) pulls, total reward and sum of squared rewards per arm
+
+
+_NAME_LEN = struct.Struct("<H")
+_ARM_STATS = struct.Struct("<Qdd")
+# Same layout as _ARM_STATS, so the stats blob is written straight from the bandit arrays
+_ARM_STATS_DTYPE = np.dtype([("pulls", "<u8"), ("total_reward", "<f8"), ("sum_sq", "<f8")])
+
+
+def pack_stats(names, pulls: np.ndarray, rewards: np.ndarray, sum_sq: np.ndarray) -> tuple[bytes, bytes]:
+    """Encode per-arm statistics into the two MABStatsMessage blobs."""
+    encoded = [n.encode("utf-8") for n in names]
+    names_blob = b"".join(_NAME_LEN.pack(len(n)) + n for n in encoded)
+    stats = np.empty(len(encoded), dtype=_ARM_STATS_DTYPE)
+    stats["pulls"] = pulls
+    stats["total_reward"] = rewards
+    stats["sum_sq"] = sum_sq
+    return names_blob, stats.tobytes()
+
+
+def unpack_stats(names_blob: bytes, stats_blob: bytes) -> list[tuple[str, int, float, float]]:
+    """Decode the MABStatsMessage blobs into (name, pulls, total_reward, sum_sq) tuples."""
+    names = []
+    offset = 0
+    while offset < len(names_blob):
+        (length,) = _NAME_LEN.unpack_from(names_blob, offset)
+        offset += _NAME_LEN.size
+        names.append(names_blob[offset:offset + length].decode("utf-8"))
+        offset += length
+    if len(stats_blob) != len(names) * _ARM_STATS.size:
+        raise ValueError("MABStatsMessage stats do not match the number of arm names")
+    return [(name, *arm) for name, arm in zip(names, _ARM_STATS.iter_unpack(stats_blob))]
 
 
 @dataclass
@@ -80,7 +149,8 @@ class NewModelMessage(DataClassPayload[11]):
 
 class MABCommunity(Community):
     """Community that uses MAB to select ranking models and shares stats via gossip."""
-    community_id = os.urandom(20)
+    # Fixed so separately started processes join the same community: sha1(b"MABCommunity")
+    community_id = bytes.fromhex("28f5168822f7202febb8ac1a2b2fd8aedc80fe1e")
     _peer_counter = 0
 
     def __init__(self, settings: CommunitySettings) -> None:
@@ -90,22 +160,30 @@ class MABCommunity(Community):
 
         # Initialize MAB with base model names
         self.model_rewards = dict(MODEL_REWARDS)  # Local copy of known rewards
-        self.bandit = UCB1(list(self.model_rewards.keys()), c=2.0)
+        self.bandit = UCB1Tuned(list(self.model_rewards.keys()))
 
         # Track state
         self.queries_processed = 0
         self.lt_session = None
         self.announced_models = set()  # Models we've already announced
+        # Packed stats blobs from the last gossip round, keyed on (total_pulls, arm count)
+        self._stats_cache_key = None
+        self._stats_cache = (b"", b"")
+
+        # Simulated clicks consume a pre-drawn block of uniforms instead of one RNG call each
+        self._rng = np.random.default_rng()
+        self._uniforms = self._rng.random(UNIFORM_BLOCK_SIZE)
+        self._u_idx = 0
 
         # Assign peer ID
         MABCommunity._peer_counter += 1
         self.peer_id = MABCommunity._peer_counter
 
     def started(self) -> None:
-        log(f"[Peer {self.peer_id}] Started with MAB (UCB1), models: {list(self.model_rewards.keys())}")
+        log(f"[Peer {self.peer_id}] Started with MAB (UCB1-Tuned), models: {list(self.model_rewards.keys())}")
 
         # Start simulating queries
-        self.register_task("simulate_queries", self.simulate_query, interval=0.5, delay=1.0)
+        self.register_task("simulate_queries", self.simulate_queries, interval=QUERY_INTERVAL, delay=1.0)
 
         # Start gossiping stats
         self.register_task("gossip_stats", self.gossip_stats, interval=GOSSIP_INTERVAL, delay=PEER_DISCOVERY_WAIT)
@@ -152,6 +230,12 @@ class MABCommunity(Community):
 
         self.announced_models.add(NEW_MODEL_NAME)
 
+    def _get_lt_session(self, port: int) -> lt.session:
+        """Return this peer's libtorrent session, creating it on first use."""
+        if self.lt_session is None:
+            self.lt_session = lt.session({**LT_SETTINGS, 'listen_interfaces': f'0.0.0.0:{port}'})
+        return self.lt_session
+
     def create_torrent_and_seed(self, file_path: Path, port: int) -> str:
         """Create torrent for file and start seeding. Returns magnet URI."""
         fs = lt.file_storage()
@@ -164,8 +248,8 @@ class MABCommunity(Community):
         info_hash = torrent_info.info_hashes().v1
         magnet_uri = f"magnet:?xt=urn:btih:{info_hash}&dn={file_path.name}"
 
-        self.lt_session = lt.session({'listen_interfaces': f'0.0.0.0:{port}'})
-        self.lt_session.add_torrent({'ti': torrent_info, 'save_path': str(file_path.parent)})
+        # Seeding needs no handle, so don't block the event loop waiting for one
+        self._get_lt_session(port).async_add_torrent({'ti': torrent_info, 'save_path': str(file_path.parent)})
         log(f"[Peer {self.peer_id}] Seeding {file_path.name} on port {port}")
 
         return magnet_uri
@@ -195,26 +279,16 @@ class MABCommunity(Community):
         """Download model via BitTorrent and add to MAB."""
         log(f"[Peer {self.peer_id}] Downloading model {model_name} via BitTorrent...")
 
-        # Initialize downloader session
-        self.lt_session = lt.session({'listen_interfaces': f'0.0.0.0:{BT_DOWNLOADER_PORT}'})
+        session = self._get_lt_session(BT_DOWNLOADER_PORT)
 
         params = lt.parse_magnet_uri(magnet_uri)
         MODELS_DIR.mkdir(exist_ok=True)
         params.save_path = str(MODELS_DIR)
 
-        handle = self.lt_session.add_torrent(params)
+        handle = session.add_torrent(params)
         handle.connect_peer((seeder_host, seeder_port))
 
-        # Wait for download
-        for i in range(30):  # 30 second timeout
-            status = handle.status()
-            if status.is_finished or status.progress >= 1.0:
-                break
-            log(f"[Peer {self.peer_id}] Download progress: {status.progress*100:.1f}%")
-            await sleep(1)
-
-        if not handle.status().is_finished:
-            log(f"[Peer {self.peer_id}] Download timeout!")
+        if not await self._wait_for_download(session, handle, DOWNLOAD_TIMEOUT):
             return
 
         log(f"[Peer {self.peer_id}] Download complete!")
@@ -237,29 +311,61 @@ class MABCommunity(Community):
         log(f"[Peer {self.peer_id}] Active models: {list(self.model_rewards.keys())}")
         log(f"{'='*60}\n")
 
+    async def _wait_for_download(self, session: lt.session, handle: lt.torrent_handle, timeout: float) -> bool:
+        """Wait for the torrent_finished_alert of ``handle``. Returns whether the download finished."""
+        loop = get_running_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            # wait_for_alert blocks, so park it on an executor thread
+            alert = await loop.run_in_executor(None, session.wait_for_alert, int(min(remaining, 1.0) * 1000))
+            if alert is None:
+                continue
+            for alert in session.pop_alerts():
+                if isinstance(alert, lt.torrent_finished_alert) and alert.handle == handle:
+                    return True
+                if isinstance(alert, lt.torrent_error_alert) and alert.handle == handle:
+                    log(f"[Peer {self.peer_id}] Download failed: {alert.message()}")
+                    return False
+
+        log(f"[Peer {self.peer_id}] Download timeout!")
+        return False
+
     def add_model(self, name: str, reward_prob: float) -> None:
         """Add a new model to the MAB."""
         if name in self.model_rewards:
             return
 
         self.model_rewards[name] = reward_prob
-        self.bandit.arms[name] = ArmStats(name=name)
+        self.bandit.add_arm(name)
         log(f"[Peer {self.peer_id}] Added model {name} to MAB (reward_prob={reward_prob})")
 
-    async def simulate_query(self) -> None:
-        """Simulate a search query and update MAB based on simulated click."""
+    def _next_uniform(self) -> float:
+        """Return the next pre-drawn U[0, 1) sample, refilling the block when exhausted."""
+        if self._u_idx == UNIFORM_BLOCK_SIZE:
+            self._rng.random(out=self._uniforms)
+            self._u_idx = 0
+        u = self._uniforms[self._u_idx]
+        self._u_idx += 1
+        return u
+
+    async def simulate_queries(self) -> None:
+        """Simulate a burst of queries, so the event loop wakes once per burst rather than per query."""
+        for _ in range(min(QUERIES_PER_BURST, SIMULATION_QUERIES - self.queries_processed)):
+            self.simulate_query()
+
         if self.queries_processed >= SIMULATION_QUERIES:
             self.cancel_pending_task("simulate_queries")
             log(f"[Peer {self.peer_id}] Finished {SIMULATION_QUERIES} queries")
             self.print_final_stats()
-            return
 
+    def simulate_query(self) -> None:
+        """Simulate a search query and update MAB based on simulated click."""
         # Select model using MAB
         selected_arm = self.bandit.select_arm()
 
         # Simulate reward (Bernoulli with model's true probability)
         true_prob = self.model_rewards.get(selected_arm, 0.2)
-        reward = 1.0 if np.random.random() < true_prob else 0.0
+        reward = 1.0 if self._next_uniform() < true_prob else 0.0
 
         # Update bandit
         self.bandit.update(selected_arm, reward)
@@ -277,17 +383,13 @@ class MABCommunity(Community):
         if not peers:
             return
 
-        stats = self.bandit.get_stats()
-        names = list(stats.keys())
-        pulls = [stats[n]["pulls"] for n in names]
-        rewards = [stats[n]["total_reward"] for n in names]
-
-        msg = MABStatsMessage(
-            sender_id=self.peer_id,
-            arm_names=json.dumps(names),
-            pulls=json.dumps(pulls),
-            rewards=json.dumps(rewards),
-        )
+        key = (self.bandit.total_pulls, len(self.bandit.names))
+        if key != self._stats_cache_key:
+            self._stats_cache = pack_stats(*self.bandit.snapshot_arrays())
+            self._stats_cache_key = key
+
+        names_blob, stats_blob = self._stats_cache
+        msg = MABStatsMessage(sender_id=self.peer_id, names_blob=names_blob, stats_blob=stats_blob)
 
         for peer in peers:
             self.ez_send(peer, msg)
@@ -295,23 +397,22 @@ class MABCommunity(Community):
     @lazy_wrapper(MABStatsMessage)
     def on_mab_stats(self, peer: Peer, payload: MABStatsMessage) -> None:
         """Receive and merge MAB statistics from another peer."""
-        names = json.loads(payload.arm_names)
-        pulls = json.loads(payload.pulls)
-        rewards = json.loads(payload.rewards)
+        try:
+            remote_stats = unpack_stats(payload.names_blob, payload.stats_blob)
+        except (struct.error, UnicodeDecodeError, ValueError) as e:
+            log(f"[Peer {self.peer_id}] Dropping malformed stats from Peer {payload.sender_id}: {e}")
+            return
 
         merged = False
-        for name, remote_pulls, remote_reward in zip(names, pulls, rewards):
-            if name not in self.bandit.arms:
+        local_arms = self.bandit.arms
+        for name, remote_pulls, remote_reward, remote_sum_sq in remote_stats:
+            if name not in local_arms:
                 # Unknown model - request it from peer
                 log(f"[Peer {self.peer_id}] Peer {payload.sender_id} has unknown model: {name}")
                 continue
 
-            local_stats = self.bandit.arms[name]
-            if remote_pulls > local_stats.pulls:
-                diff_pulls = remote_pulls - local_stats.pulls
-                local_stats.pulls = remote_pulls
-                local_stats.total_reward = remote_reward
-                self.bandit.total_pulls += diff_pulls
+            if remote_pulls > local_arms[name].pulls:
+                self.bandit.set_arm(name, remote_pulls, remote_reward, remote_sum_sq)
                 merged = True
 
         if merged:
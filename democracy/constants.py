@@ -3,7 +3,12 @@ from typing import Final
 
 # Community configuration constants
 COMMUNITY_ID: Final[bytes] = hashlib.sha1(b"DemocracyCommunity").digest()
+# Every this many announcement rounds the full inventory is re-sent to every peer
+FULL_INVENTORY_ANNOUNCE_ROUNDS: Final[int] = 10
 
 ISSUE_THRESHOLD: Final[int] = 9
 
+# Maximum number of bytes of the SQLite database file memory-mapped for reads
+SQLITE_MMAP_SIZE: Final[int] = 256 * 1024 * 1024
+
 FUNDING_PROTOCOL_LABEL: Final[bytes] =  b"superorganism-funding-v1"
@@ -3,11 +3,12 @@ from __future__ import annotations
 import hashlib
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from uuid import UUID, uuid4
 
 from bitcoin.utils import validate_psbt_base64, validate_txid
 from democracy.constants import FUNDING_PROTOCOL_LABEL
+from democracy.models.utils import utc_now
 
 
 def _length_prefix(value: bytes) -> bytes:
@@ -39,7 +40,7 @@ class FundingCampaign:
     asking_price_sats: int
     deadline_height: int | None
     id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=utc_now)
 
     def __post_init__(self) -> None:
         normalized_payout_address: str | None = None
@@ -145,7 +146,7 @@ class FundingPledge:
     value_sats: int
     signed_pledge_psbt: str
     id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=utc_now)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "txid", validate_txid(self.txid))
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from democracy.models.issue import Issue
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueWithVotes:
     """
     Represents an issue along with its associated vote count.
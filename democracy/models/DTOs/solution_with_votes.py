@@ -4,7 +4,7 @@ from democracy.models.issue import Issue
 from democracy.models.solution import Solution
 
 
-@dataclass
+@dataclass(slots=True)
 class SolutionWithVotes:
     """
     Represents a solution along with its associated vote count.
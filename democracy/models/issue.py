@@ -1,12 +1,12 @@
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict
 from uuid import uuid4, UUID
 
-from democracy.models.utils import parse_datetime
+from democracy.models.utils import parse_datetime, utc_now
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Issue:
     """
     Represents an issue with its details.
@@ -22,7 +22,7 @@ class Issue:
     creator_id: UUID
     description: str = ""
     id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=utc_now)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Issue":
@@ -49,8 +49,10 @@ class Issue:
 
         :return: A dictionary representation of the Issue instance.
         """
-        d = self.__dict__.copy()
-        d["creator_id"] = str(self.creator_id)
-        d["id"] = str(self.id)
-        d["created_at"] = self.created_at.isoformat()
-        return d
\ No newline at end of file
+        return {
+            "title": self.title,
+            "creator_id": str(self.creator_id),
+            "description": self.description,
+            "id": str(self.id),
+            "created_at": self.created_at.isoformat(),
+        }
\ No newline at end of file
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict
 from uuid import uuid4, UUID
 
-from democracy.models.utils import parse_datetime
+from democracy.models.utils import parse_datetime, utc_now
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IssueVote:
     """
     Represents a vote cast by a voter on an issue.
@@ -22,7 +22,7 @@ class IssueVote:
     voter_id: UUID
     issue_id: UUID
     id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=utc_now)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> IssueVote:
@@ -52,9 +52,9 @@ class IssueVote:
 
         :return: A dictionary representation of the IssueVote instance.
         """
-        d = self.__dict__.copy()
-        d["id"] = str(self.id)
-        d["voter_id"] = str(self.voter_id)
-        d["issue_id"] = str(self.issue_id)
-        d["created_at"] = self.created_at.isoformat()
-        return d
\ No newline at end of file
+        return {
+            "voter_id": str(self.voter_id),
+            "issue_id": str(self.issue_id),
+            "id": str(self.id),
+            "created_at": self.created_at.isoformat(),
+        }
\ No newline at end of file
@@ -3,7 +3,7 @@ from uuid import uuid4, UUID
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """
     Represents a person with a unique identifier.
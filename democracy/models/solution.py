@@ -3,21 +3,21 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict
 from uuid import uuid4, UUID
 
-from democracy.models.utils import parse_datetime
+from democracy.models.utils import parse_datetime, utc_now
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Solution:
     title: str
     description: str
     creator_id: UUID
     issue_id: UUID
     id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=utc_now)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> Solution:
@@ -36,12 +36,14 @@ class Solution:
         return Solution(**data)
 
     def to_dict(self) -> Dict[str, Any]:
-        d = self.__dict__.copy()
-        d["id"] = str(self.id)
-        d["creator_id"] = str(self.creator_id)
-        d["issue_id"] = str(self.issue_id)
-        d["created_at"] = self.created_at.isoformat()
-        return d
+        return {
+            "title": self.title,
+            "description": self.description,
+            "creator_id": str(self.creator_id),
+            "issue_id": str(self.issue_id),
+            "id": str(self.id),
+            "created_at": self.created_at.isoformat(),
+        }
 
     def compute_hash(self) -> str:
         """
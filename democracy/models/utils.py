@@ -1,6 +1,13 @@
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 
+_UTC = timezone.utc
+
+# Default factory for creation timestamps; a partial calls datetime.now directly instead
+# of going through an extra Python-level lambda frame.
+utc_now = partial(datetime.now, _UTC)
+
 
 def parse_datetime(value: Any) -> datetime:
     """
@@ -10,16 +17,17 @@ def parse_datetime(value: Any) -> datetime:
     :param value: The input value to parse.
     :return: A datetime object in UTC.
     """
-    if value is None:
-        raise ValueError("Cannot parse 'None' as datetime")
-    if isinstance(value, (int, float)):
-        return datetime.fromtimestamp(value, timezone.utc)
+    # Messages and stored rows carry ISO strings, so that case is checked first.
     if isinstance(value, str):
         try:
             return datetime.fromisoformat(value)
         except ValueError:
             try:
-                return datetime.fromtimestamp(float(value), timezone.utc)
+                return datetime.fromtimestamp(float(value), _UTC)
             except Exception:
                 raise ValueError(f"Cannot parse string '{value}' as datetime")
+    if value is None:
+        raise ValueError("Cannot parse 'None' as datetime")
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, _UTC)
     raise ValueError(f"Cannot parse '{value}' as datetime")
@@ -6,21 +6,33 @@ from typing import Any, Iterable, Optional, Protocol, Set, runtime_checkable
 
 from ipv8.community import Community, CommunitySettings
 from ipv8.lazy_community import lazy_wrapper
-from ipv8.messaging.serialization import Payload
+from ipv8.messaging.serialization import PackError, Payload
 from ipv8.peer import Peer
 
-from democracy.constants import COMMUNITY_ID
+from democracy.constants import COMMUNITY_ID, FULL_INVENTORY_ANNOUNCE_ROUNDS
 from democracy.network.community_settings import (
     DataChangedCallback,
     DemocracyCommunitySettings,
 )
-from democracy.network.messages.base_message import BaseMessage
+from democracy.network.messages.base_message import (
+    BaseMessage,
+    compile_message_schema,
+)
 from democracy.network.messages.gossip_messages import (
     GossipItem,
     IHaveMessage,
     IWantMessage,
     batch_gossip_items,
 )
+from democracy.network.messages.object_batch_message import (
+    ObjectBatchMessage,
+    ObjectBatchSupportMessage,
+    batch_object_entries,
+    decode_object_entry,
+    encode_object_entry,
+    max_object_batch_bytes,
+    object_entry_fits_batch,
+)
 from democracy.network.object_type import ObjectType
 from democracy.network.replication import (
     ReplicationHandler,
@@ -89,9 +101,30 @@ class DemocracyCommunity(Community):
         self._replication_handlers = replication_handlers
         self._handlers_by_type = handlers_by_type
         self._handlers_by_model_cls = handlers_by_model_cls
+        # Items known to be stored locally, so duplicate gossip is answered without a
+        # repository query. Rebuilt from the repository on every inventory announcement.
+        self._known_items: Set[GossipItem] = set()
+        # Items already announced to each connected peer since its last full announcement
+        self._announced_to: dict[Peer, Set[GossipItem]] = {}
+        self._announce_round = 0
+        # Connected peers, dropped whenever the network reports a peer change and rebuilt
+        # on every announcement tick (services are registered after on_peer_added fires).
+        self._peers_cache: Optional[list[Peer]] = None
+        # Peers that announced they understand object batches. Every other peer is
+        # answered with one object message per requested object.
+        self._object_batch_peers: Set[Peer] = set()
+        self._max_object_batch_bytes = max_object_batch_bytes(
+            len(self.my_peer.public_key.key_to_bin()),
+            self.my_peer.key.get_signature_length(),
+        )
+        self.network.add_peer_observer(self)
 
         self.add_message_handler(IHaveMessage, self.on_ihave_message)
         self.add_message_handler(IWantMessage, self.on_iwant_message)
+        self.add_message_handler(ObjectBatchMessage, self.on_object_batch_message)
+        self.add_message_handler(
+            ObjectBatchSupportMessage, self.on_object_batch_support_message
+        )
 
         for handler in self._replication_handlers:
             self._register_object_message_handler(handler)
@@ -106,6 +139,8 @@ class DemocracyCommunity(Community):
         The generated handler wraps the object-specific message class and forwards
         received objects to the shared object handling logic, together with the
         corresponding object type.
+        The message schema is compiled first, so incoming messages can be unpacked
+        before this peer has sent one.
 
         :param handler: Replication handler describing the object type and message class
                         to register.
@@ -120,10 +155,52 @@ class DemocracyCommunity(Community):
         ) -> None:
             inner_self._handle_object_message(peer, payload, handler.object_type)
 
+        compile_message_schema(handler.message_cls)
         self.add_message_handler(
             handler.message_cls, on_message.__get__(self, type(self))
         )
 
+    async def unload(self) -> None:
+        """
+        Stop observing the peer network and unload the community.
+
+        :return: None
+        """
+        self.network.remove_peer_observer(self)
+        await super().unload()
+
+    def on_peer_added(self, peer: Peer) -> None:
+        """
+        Invalidate the connected peer cache when a peer joins the network.
+
+        :param peer: Peer that was added.
+        :return: None
+        """
+        self._peers_cache = None
+
+    def on_peer_removed(self, peer: Peer) -> None:
+        """
+        Invalidate the connected peer cache when a peer leaves the network.
+
+        The peer's object batch support is forgotten too, since it may come back running
+        a different build.
+
+        :param peer: Peer that was removed.
+        :return: None
+        """
+        self._peers_cache = None
+        self._object_batch_peers.discard(peer)
+
+    def _connected_peers(self) -> list[Peer]:
+        """
+        Return the peers connected to this community, using the cached list if valid.
+
+        :return: Connected peers.
+        """
+        if self._peers_cache is None:
+            self._peers_cache = self.get_peers()
+        return self._peers_cache
+
     def on_start(self) -> None:
         """
         Start the periodic inventory announcement task.
@@ -143,15 +220,43 @@ class DemocracyCommunity(Community):
 
     async def _announce_full_inventory(self) -> None:
         """
-        Announce all locally known object identifiers to connected peers.
+        Announce locally known object identifiers to connected peers.
 
         This method is used by the periodic communication task. It builds the current
-        local inventory and sends it as IHAVE messages, allowing peers to request any
-        missing objects with IWANT.
+        local inventory and sends each peer, as IHAVE messages, only the items it has not
+        been told about yet, allowing peers to request any missing objects with IWANT.
+        Every FULL_INVENTORY_ANNOUNCE_ROUNDS rounds the whole inventory is re-sent, so
+        peers that lost an IHAVE still converge.
 
         :return: None
         """
-        self._announce_inventory(self._get_local_inventory())
+        inventory = self._get_local_inventory()
+        full_round = self._announce_round % FULL_INVENTORY_ANNOUNCE_ROUNDS == 0
+        self._announce_round += 1
+
+        # Rebuilding the mapping from the current peers forgets peers that left.
+        self._peers_cache = self.get_peers()
+        self._announced_to = {
+            peer: set() if full_round else self._announced_to.get(peer, set())
+            for peer in self._peers_cache
+        }
+        # Peers in the same state get identical batches; sign each distinct one once.
+        packets: dict[tuple[GossipItem, ...], bytes] = {}
+        for peer, announced in self._announced_to.items():
+            pending = [item for item in inventory if item not in announced]
+            if pending:
+                logger.debug(
+                    f"{self.my_peer}: Announcing {len(pending)} items to peer {peer}."
+                )
+            for batch in batch_gossip_items(pending):
+                key = tuple(batch)
+                packet = packets.get(key)
+                if packet is None:
+                    payload = IHaveMessage.from_items(batch)
+                    packet = self.ezr_pack(payload.msg_id, payload)
+                    packets[key] = packet
+                self.endpoint.send(peer.address, packet)
+            announced.update(pending)
 
     @staticmethod
     def _brief(payload: object) -> str:
@@ -184,6 +289,9 @@ class DemocracyCommunity(Community):
         """
         Send a payload to all connected peers, except the peers that should be skipped.
 
+        The payload is serialized and signed once and the same packet is sent to every
+        recipient.
+
         :param payload: Message payload to send.
         :param skip_peers: Optional set of peers that should not receive the payload.
         :return: None
@@ -191,11 +299,17 @@ class DemocracyCommunity(Community):
         if skip_peers is None:
             skip_peers = set()
 
-        for peer in self.get_peers():
-            if peer in skip_peers:
-                continue
+        peers = [peer for peer in self._connected_peers() if peer not in skip_peers]
+        if not peers:
+            return
 
-            self._send_to_peer(peer, payload)
+        # The signed packet is identical for every recipient, so build it only once.
+        logger.debug(
+            f"{self.my_peer}: Sending {self._brief(payload)} to {len(peers)} peers."
+        )
+        packet = self.ezr_pack(payload.msg_id, payload)
+        for peer in peers:
+            self.endpoint.send(peer.address, packet)
 
     def _send_to_peer(self, peer: Peer, payload: Payload) -> None:
         """
@@ -214,17 +328,19 @@ class DemocracyCommunity(Community):
         """
         Build an inventory of all democracy objects stored locally.
 
-        Each replicated model is converted into a gossip item containing its object type
-        and identifier. The resulting inventory can be announced to peers using IHAVE
-        messages.
+        Only the identifiers of replicated objects are read from the repository, each
+        becoming a gossip item containing its object type and identifier. The resulting
+        inventory can be announced to peers using IHAVE messages.
 
         :return: Gossip items for all locally known replicated objects.
         """
-        return [
-            handler.build_item(model)
+        items = [
+            item
             for handler in self._replication_handlers
-            for model in handler.get_all_models()
+            for item in handler.get_all_items()
         ]
+        self._known_items = set(items)
+        return items
 
     def _announce_inventory(
         self,
@@ -241,12 +357,17 @@ class DemocracyCommunity(Community):
         :param skip_peers: Optional set of peers that should not receive the announcement.
         :return: None
         """
+        items = list(items)
         for batch in batch_gossip_items(items):
             self._multicast(
                 IHaveMessage.from_items(batch),
                 skip_peers=skip_peers,
             )
 
+        for peer, announced in self._announced_to.items():
+            if skip_peers is None or peer not in skip_peers:
+                announced.update(items)
+
     def broadcast_created_model(
         self,
         model: Any,
@@ -277,29 +398,34 @@ class DemocracyCommunity(Community):
         """
         Check whether a gossip item refers to an object stored locally.
 
-        Unknown object types are treated as missing.
+        Unknown object types are treated as missing. Items already seen as stored are
+        answered from memory; otherwise the repository is queried.
 
         :param item: Gossip item to check.
         :return: True if the referenced object is known locally, False otherwise.
         """
+        if item in self._known_items:
+            return True
+
         handler = self._handlers_by_type.get(item.object_type)
         if handler is None:
             return False
 
-        return handler.get_stored_model(item) is not None
+        if handler.get_stored_model(item) is None:
+            return False
+        self._known_items.add(item)
+        return True
 
-    def _send_object(self, peer: Peer, item: GossipItem) -> None:
+    def _build_object_message(self, item: GossipItem) -> Optional[BaseMessage[Any]]:
         """
-        Send the full object referenced by a gossip item to a peer.
+        Build the full object message for the object referenced by a gossip item.
 
         The method resolves the appropriate replication handler, retrieves the locally
-        stored model, converts it to its object message, and sends it to the requesting
-        peer. If the object type is unknown or the object is not stored locally, no
-        message is sent.
+        stored model, and converts it to its object message. If the object type is unknown
+        or the object is not stored locally, no message is built.
 
-        :param peer: Peer that requested the object.
         :param item: Gossip item identifying the requested object.
-        :return: None
+        :return: Object message, or None if the object cannot be sent.
         """
         handler = self._handlers_by_type.get(item.object_type)
         if handler is None:
@@ -307,7 +433,7 @@ class DemocracyCommunity(Community):
                 f"{self.my_peer}: Cannot send requested object "
                 f"{item.object_type}:{item.object_uuid} because its type is unknown."
             )
-            return
+            return None
 
         stored_model = handler.get_stored_model(item)
         if stored_model is None:
@@ -315,9 +441,44 @@ class DemocracyCommunity(Community):
                 f"{self.my_peer}: Cannot send requested object "
                 f"{item.object_type}:{item.object_uuid} because it is not stored locally."
             )
-            return
+            return None
+
+        return handler.build_message(stored_model)
+
+    def _send_objects(self, peer: Peer, items: Iterable[GossipItem]) -> None:
+        """
+        Send the full objects referenced by gossip items to a peer.
+
+        If the peer announced object batch support, the objects are grouped into as few
+        object batch messages as fit in one packet each, so many small objects cost one
+        packet and one signature instead of one each. Objects too large for a batch, and
+        all objects for peers without batch support, are sent as individual object
+        messages. Unknown or missing objects are skipped.
 
-        self._send_to_peer(peer, handler.build_message(stored_model))
+        :param peer: Peer that requested the objects.
+        :param items: Gossip items identifying the requested objects.
+        :return: None
+        """
+        batches_supported = peer in self._object_batch_peers
+        entries: list[bytes] = []
+        for item in items:
+            message = self._build_object_message(item)
+            if message is None:
+                continue
+
+            if batches_supported:
+                entry = encode_object_entry(
+                    item.object_type,
+                    self.serializer.pack_serializable(message),
+                )
+                if object_entry_fits_batch(entry, self._max_object_batch_bytes):
+                    entries.append(entry)
+                    continue
+
+            self._send_to_peer(peer, message)
+
+        for batch in batch_object_entries(entries, self._max_object_batch_bytes):
+            self._send_to_peer(peer, ObjectBatchMessage(batch))
 
     @lazy_wrapper(IHaveMessage)
     def on_ihave_message(self, peer: Peer, payload: IHaveMessage) -> None:
@@ -346,6 +507,9 @@ class DemocracyCommunity(Community):
             logger.debug(f"{self.my_peer}: No unknown objects in IHAVE.")
             return
 
+        # Announced before every request round, so a responder that restarted or saw the
+        # peer reconnect learns again that it may answer with object batches.
+        self._send_to_peer(peer, ObjectBatchSupportMessage())
         for batch in batch_gossip_items(missing_items):
             self._send_to_peer(
                 peer,
@@ -369,8 +533,86 @@ class DemocracyCommunity(Community):
             f"{self.my_peer}: Received {self._brief(payload)} from peer {peer}."
         )
 
-        for item in payload.decode_items():
-            self._send_object(peer, item)
+        self._send_objects(peer, payload.decode_items())
+
+    @lazy_wrapper(ObjectBatchSupportMessage)
+    def on_object_batch_support_message(
+        self,
+        peer: Peer,
+        payload: ObjectBatchSupportMessage,
+    ) -> None:
+        """
+        Handle an incoming object batch capability message from a peer.
+
+        The peer is remembered as understanding object batches, so its IWANT requests are
+        answered with object batch messages from now on.
+
+        :param peer: Peer that announced object batch support.
+        :param payload: Received object batch capability message.
+        :return: None
+        """
+        logger.debug(
+            f"{self.my_peer}: Received {self._brief(payload)} from peer {peer}."
+        )
+        self._object_batch_peers.add(peer)
+
+    @lazy_wrapper(ObjectBatchMessage)
+    def on_object_batch_message(self, peer: Peer, payload: ObjectBatchMessage) -> None:
+        """
+        Handle an incoming object batch message from a peer.
+
+        Each entry is unpacked with the message class of its object type and stored as if
+        it had arrived as a separate object message. Malformed entries and entries of
+        unknown object types are skipped. The whole batch is stored in one repository
+        transaction, and the newly stored objects trigger a single data change callback
+        and a single IHAVE announcement. Stored objects are only marked as known once
+        the transaction has committed.
+
+        :param peer: Peer that sent the object batch.
+        :param payload: Received object batch message.
+        :return: None
+        """
+        logger.debug(
+            f"{self.my_peer}: Received {self._brief(payload)} from peer {peer}."
+        )
+
+        stored_items: list[GossipItem] = []
+        with self.repository.transaction():
+            for entry in payload.entries:
+                try:
+                    object_type, packed_message = decode_object_entry(entry)
+                except ValueError:
+                    logger.debug(
+                        f"{self.my_peer}: Skipping malformed object batch entry."
+                    )
+                    continue
+
+                handler = self._handlers_by_type.get(object_type)
+                if handler is None:
+                    logger.debug(
+                        f"{self.my_peer}: Skipping object batch entry of unhandled type "
+                        f"{object_type}."
+                    )
+                    continue
+
+                try:
+                    message, _ = self.serializer.unpack_serializable(
+                        handler.message_cls, packed_message
+                    )
+                except PackError:
+                    logger.debug(
+                        f"{self.my_peer}: Skipping undecodable {object_type} batch entry."
+                    )
+                    continue
+
+                item = self._store_object(message, object_type)
+                if item is not None:
+                    stored_items.append(item)
+
+        self._known_items.update(stored_items)
+        if stored_items:
+            self.data_changed()
+            self._announce_inventory(stored_items, skip_peers={peer})
 
     def _handle_object_message(
         self,
@@ -381,39 +623,68 @@ class DemocracyCommunity(Community):
         """
         Handle an incoming full object message from a peer.
 
-        The payload is converted to its model representation and passed to the replication
-        handler for the corresponding object type. Newly stored objects trigger the data
-        change callback and are announced to other peers with IHAVE. Objects that are
-        already known or rejected by the repository are not propagated further.
+        The object is stored through its replication handler. A newly stored object
+        triggers the data change callback and is announced to other peers with IHAVE.
+        Objects that are already known or rejected by the repository are not propagated
+        further.
 
         :param peer: Peer that sent the object message.
         :param payload: Received full object message.
         :param object_type: Type of democracy object contained in the message.
         :return: None
-        :raises ValueError: If the replication handler returns an unexpected store status.
         """
         logger.debug(f"{self.my_peer}: Received {payload.brief()} from peer {peer}.")
 
+        item = self._store_object(payload, object_type)
+        if item is not None:
+            self._known_items.add(item)
+            self.data_changed()
+            self._announce_inventory([item], skip_peers={peer})
+
+    def _store_object(
+        self,
+        payload: BaseMessage[Any],
+        object_type: ObjectType,
+    ) -> Optional[GossipItem]:
+        """
+        Store a full object received from a peer.
+
+        The payload is converted to its model representation and passed to the replication
+        handler for the corresponding object type. Payloads that cannot be converted to a
+        model are skipped. The caller marks the returned item as known once the write is
+        committed.
+
+        :param payload: Received full object message.
+        :param object_type: Type of democracy object contained in the message.
+        :return: The gossip item of the object if it was newly stored, otherwise None.
+        :raises ValueError: If the replication handler returns an unexpected store status.
+        """
         handler = self._handlers_by_type[object_type]
-        model = payload.to_model()
+        try:
+            model = payload.to_model()
+        except (TypeError, ValueError):
+            logger.debug(f"{self.my_peer}: Skipping invalid {payload.brief()}.")
+            return None
+
         item = handler.build_item(model)
-        store_status = handler.store_remote(model)
+        if item in self._known_items:
+            store_status = StoreStatus.ALREADY_PRESENT
+        else:
+            store_status = handler.store_remote(model)
 
         if store_status is StoreStatus.ALREADY_PRESENT:
             logger.debug(
                 f"{self.my_peer}: Already knew about {payload.brief()}. "
                 f"Nothing updated."
             )
-            return
+            return None
 
         if store_status is StoreStatus.REJECTED:
             logger.debug(f"{self.my_peer}: Rejected {payload.brief()}.")
-            return
+            return None
 
         if store_status is StoreStatus.STORED:
-            self.data_changed()
-            self._announce_inventory([item], skip_peers={peer})
-            return
+            return item
 
         msg = f"Unexpected store status: {store_status}."
         raise ValueError(msg)
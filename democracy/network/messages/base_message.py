@@ -1,12 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Type, TypeVar
+from typing import Any, Generic, Type, TypeVar
 from uuid import UUID
 
-from ipv8.messaging.payload_dataclass import DataClassPayload
+from ipv8.messaging.payload_dataclass import DataClassPayload, convert_to_payload
 
 TModel = TypeVar("TModel")
 TMsg = TypeVar("TMsg", bound="BaseMessage")
 
+
+def _new_compiled_message(cls: type, *args: Any, **kwargs: Any) -> Any:
+    """Allocate a message instance whose class schema is already compiled."""
+    return object.__new__(cls)
+
+
+def compile_message_schema(message_cls: type[DataClassPayload]) -> None:
+    """
+    Build the ipv8 serialization schema of a dataclass message class.
+
+    DataClassPayload only derives its schema when an instance is created, but incoming
+    messages are unpacked before any instance exists. The community compiles every
+    message class it handles before registering its handler.
+
+    DataClassPayload also re-derives the schema (type hints and code generation) on
+    every instantiation. Once compiled, the class gets a plain ``__new__`` so building a
+    message from a model no longer repeats that work.
+    """
+    convert_to_payload(message_cls, msg_id=getattr(message_cls, "msg_id", None))
+    # Mirrors DataClassPayload(WID).__new__ of pyipv8 3.1.0 (pinned in requirements.txt)
+    # minus the per-call convert_to_payload(). Re-check on upgrade; the round-trip
+    # tests in tests/unit/democracy/test_base_message.py compare against ipv8's own.
+    message_cls.__new__ = staticmethod(_new_compiled_message)  # type: ignore[assignment]
+
+
 class BaseMessage(DataClassPayload, ABC, Generic[TModel]):
     @property
     @abstractmethod
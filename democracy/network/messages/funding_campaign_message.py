@@ -66,15 +66,3 @@ class FundingCampaignMessage(DataClassPayload[5], BaseMessage[FundingCampaign]):
             deadline_height=campaign.deadline_height or 0,
             created_at=campaign.created_at.isoformat(),
         )
-
-
-# Force schema generation once on import.
-_ = FundingCampaignMessage(
-    id="00000000-0000-0000-0000-000000000000",
-    solution_id="00000000-0000-0000-0000-000000000000",
-    solution_hash="0" * 64,
-    developer_payout_address="bcrt1qexampleaddress",
-    asking_price_sats=1,
-    deadline_height=1,
-    created_at="1970-01-01T00:00:00+00:00",
-)
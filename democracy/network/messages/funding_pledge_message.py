@@ -65,16 +65,3 @@ class FundingPledgeMessage(DataClassPayload[6], BaseMessage[FundingPledge]):
             signed_pledge_psbt=pledge.signed_pledge_psbt,
             created_at=pledge.created_at.isoformat(),
         )
-
-
-# Force schema generation once on import.
-_ = FundingPledgeMessage(
-    id="00000000-0000-0000-0000-000000000000",
-    campaign_id="00000000-0000-0000-0000-000000000000",
-    pledger_id="00000000-0000-0000-0000-000000000000",
-    txid="0" * 64,
-    vout=0,
-    value_sats=1,
-    signed_pledge_psbt="cHNidP8BAAoCAAAAAQ==",
-    created_at="1970-01-01T00:00:00+00:00",
-)
@@ -4,6 +4,7 @@ import logging
 from collections.abc import Iterator
 from dataclasses import dataclass
 from math import ceil
+from operator import attrgetter
 from typing import Iterable
 from uuid import UUID
 
@@ -18,6 +19,10 @@ _OBJECT_ID_BITS = 128
 _BITS_PER_ITEM = _OBJECT_TYPE_BITS + _OBJECT_ID_BITS
 MAX_GOSSIP_ITEMS_BLOB_BYTES = 1300
 
+# Canonical sort key: object type, then UUID as an integer. ObjectType is an IntEnum, so
+# it orders like its integer value.
+_canonical_order = attrgetter("object_type", "object_uuid.int")
+
 
 @dataclass(frozen=True)
 class GossipItem:
@@ -58,13 +63,7 @@ def _canonicalize_items(items: Iterable[GossipItem]) -> list[GossipItem]:
     :param items: Gossip items to deduplicate and sort.
     :return: Canonical list of unique gossip items.
     """
-    return sorted(
-        _deduplicate_items(items),
-        key=lambda gossip_item: (
-            int(gossip_item.object_type),
-            gossip_item.object_uuid.int,
-        ),
-    )
+    return sorted(_deduplicate_items(items), key=_canonical_order)
 
 
 def _encoded_size_for_item_count(item_count: int) -> int:
@@ -53,6 +53,3 @@ class IssueMessage(DataClassPayload[1], BaseMessage[Issue]):
             id=str(issue.id),
             created_at=issue.created_at.isoformat(),
         )
-
-# Force schema generation once on import
-_ = IssueMessage(title="", creator_id="", description="", id="", created_at="")
\ No newline at end of file
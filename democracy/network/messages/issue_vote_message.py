@@ -49,6 +49,3 @@ class IssueVoteMessage(DataClassPayload[2], BaseMessage[IssueVote]):
             id=str(vote.id),
             created_at=vote.created_at.isoformat(),
         )
-
-# Force schema generation once on import
-_ = IssueVoteMessage(id="", voter_id="", issue_id="", created_at="")
\ No newline at end of file
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Iterable
+
+from ipv8.messaging.lazy_payload import VariablePayload, vp_compile
+
+from democracy.network.object_type import ObjectType
+
+# Largest UDP payload that fits a 1500-byte Ethernet MTU over IPv4 without fragmenting.
+MAX_PACKET_BYTES = 1472
+MAX_OBJECT_BATCH_ENTRIES = 255
+
+# Signed IPv8 packet overhead besides the public key and signature: the 22-byte community
+# prefix, the one-byte message id and the two-byte public key length.
+_SIGNED_PACKET_HEADER_BYTES = 22 + 1 + 2
+
+# Wire overhead of the entries list: a one-byte entry count, then a two-byte length
+# prefix per entry.
+_LIST_HEADER_BYTES = 1
+_ENTRY_HEADER_BYTES = 2
+
+
+def max_object_batch_bytes(public_key_bytes: int, signature_bytes: int) -> int:
+    """
+    Calculate the largest object batch payload that fits in one signed packet.
+
+    The budget is the maximum packet size minus the IPv8 header, the sender's serialized
+    public key and its signature, which are added when the batch is signed and sent.
+
+    :param public_key_bytes: Length of the sender's serialized public key.
+    :param signature_bytes: Length of the sender's signatures.
+    :return: Maximum serialized object batch payload size in bytes.
+    """
+    return (
+        MAX_PACKET_BYTES
+        - _SIGNED_PACKET_HEADER_BYTES
+        - public_key_bytes
+        - signature_bytes
+    )
+
+
+# Budget for the curve25519 peer keys used by the democracy app: a 74-byte serialized
+# public key and 64-byte signatures.
+MAX_OBJECT_BATCH_BYTES = max_object_batch_bytes(74, 64)
+
+
+def encode_object_entry(object_type: ObjectType, packed_message: bytes) -> bytes:
+    """
+    Encode one serialized object message as an object batch entry.
+
+    The entry is the object type as a single byte followed by the serialized object
+    message, so the receiver knows which message class to unpack it with.
+
+    :param object_type: Type of the object carried by the message.
+    :param packed_message: Serialized object message.
+    :return: Encoded batch entry.
+    """
+    return bytes((int(object_type),)) + packed_message
+
+
+def decode_object_entry(entry: bytes) -> tuple[ObjectType, bytes]:
+    """
+    Decode an object batch entry into its object type and serialized object message.
+
+    :param entry: Encoded batch entry.
+    :return: Object type and serialized object message.
+    :raises ValueError: If the entry is empty or has an unknown object type value.
+    """
+    if not entry:
+        msg = "Object batch entry is empty."
+        raise ValueError(msg)
+    return ObjectType(entry[0]), bytes(entry[1:])
+
+
+def object_entry_fits_batch(entry: bytes, max_batch_bytes: int | None = None) -> bool:
+    """
+    Check whether an encoded object entry fits in an object batch message on its own.
+
+    :param entry: Encoded batch entry.
+    :param max_batch_bytes: Size limit of one batch, MAX_OBJECT_BATCH_BYTES by default.
+    :return: True if a batch holding only this entry stays within the size limit.
+    """
+    if max_batch_bytes is None:
+        max_batch_bytes = MAX_OBJECT_BATCH_BYTES
+    return _LIST_HEADER_BYTES + _ENTRY_HEADER_BYTES + len(entry) <= max_batch_bytes
+
+
+def batch_object_entries(
+    entries: Iterable[bytes],
+    max_batch_bytes: int | None = None,
+) -> Iterator[list[bytes]]:
+    """
+    Group encoded object entries into batches that fit in one object batch message.
+
+    Entries are kept in order and added to the current batch until the encoded batch would
+    exceed the size limit or the entry count limit. An entry that is larger than the size
+    limit on its own is sent in a batch of its own.
+
+    :param entries: Encoded object entries to batch.
+    :param max_batch_bytes: Size limit of one batch, MAX_OBJECT_BATCH_BYTES by default.
+    :return: Iterator yielding batches of entries.
+    """
+    if max_batch_bytes is None:
+        max_batch_bytes = MAX_OBJECT_BATCH_BYTES
+
+    batch: list[bytes] = []
+    batch_size = _LIST_HEADER_BYTES
+    for entry in entries:
+        entry_size = _ENTRY_HEADER_BYTES + len(entry)
+        if batch and (
+            batch_size + entry_size > max_batch_bytes
+            or len(batch) >= MAX_OBJECT_BATCH_ENTRIES
+        ):
+            yield batch
+            batch = []
+            batch_size = _LIST_HEADER_BYTES
+        batch.append(entry)
+        batch_size += entry_size
+
+    if batch:
+        yield batch
+
+
+@vp_compile
+class ObjectBatchMessage(VariablePayload):
+    """
+    Bulk object message.
+
+    This message carries several full objects, each as an encoded batch entry, so a
+    peer answering an IWANT sends one packet for many small objects instead of one
+    packet per object.
+    """
+
+    msg_id = 9
+    format_list = ["varlenH-list"]
+    names = ["entries"]
+
+    def brief(self) -> str:
+        """Return a short human-readable description."""
+        entry_label = "entry" if len(self.entries) == 1 else "entries"
+        return f"OBJECTS({len(self.entries)} {entry_label})"
+
+
+@vp_compile
+class ObjectBatchSupportMessage(VariablePayload):
+    """
+    Object batch capability message.
+
+    A peer sends this before its IWANT requests to announce that it understands object
+    batch messages, so the receiver may answer with batches instead of one object message
+    per object. Peers that do not know this message drop it and keep receiving
+    individual object messages.
+    """
+
+    msg_id = 10
+    format_list: list[str] = []
+    names: list[str] = []
+
+    def brief(self) -> str:
+        """Return a short human-readable description."""
+        return "OBJECTS_SUPPORTED"
@@ -57,6 +57,3 @@ class SolutionMessage(DataClassPayload[3], BaseMessage[Solution]):
             id=str(solution.id),
             created_at=solution.created_at.isoformat(),
         )
-
-# Force schema generation once on import
-_ = SolutionMessage(title="", description="", creator_id="", issue_id="", id="", created_at="")
\ No newline at end of file
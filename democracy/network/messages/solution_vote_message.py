@@ -49,6 +49,3 @@ class SolutionVoteMessage(DataClassPayload[4], BaseMessage[SolutionVote]):
             id=str(vote.id),
             created_at=vote.created_at.isoformat(),
         )
-
-# Force schema generation once on import
-_ = SolutionVoteMessage(id="", voter_id="", solution_id="", created_at="")
\ No newline at end of file
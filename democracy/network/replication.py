@@ -58,6 +58,7 @@ class ReplicationHandler(Generic[TModel]):
         model_cls: type[TModel],
         message_cls: type[BaseMessage[TModel]],
         get_all_models: Callable[[], list[TModel]],
+        get_all_ids: Callable[[], list[UUID]],
         get_one: Callable[[UUID], TModel | None],
         add_one: Callable[[TModel], None],
     ) -> None:
@@ -68,6 +69,8 @@ class ReplicationHandler(Generic[TModel]):
         :param model_cls: Model class used for this object type.
         :param message_cls: Message class used to send this object type.
         :param get_all_models: Function returning all stored models of this type.
+        :param get_all_ids: Function returning the UUIDs of all stored models of this
+                            type.
         :param get_one: Function returning one stored model by UUID.
         :param add_one: Function storing one model in the local repository.
         """
@@ -75,6 +78,7 @@ class ReplicationHandler(Generic[TModel]):
         self.model_cls = model_cls
         self.message_cls = message_cls
         self._get_all_models = get_all_models
+        self._get_all_ids = get_all_ids
         self._get_one = get_one
         self._add_one = add_one
 
@@ -86,6 +90,19 @@ class ReplicationHandler(Generic[TModel]):
         """
         return self._get_all_models()
 
+    def get_all_items(self) -> list[GossipItem]:
+        """
+        Return gossip item references for all locally stored models of this type.
+
+        Only identifiers are read from the repository, not the full models.
+
+        :return: List of gossip items.
+        """
+        return [
+            GossipItem(object_type=self.object_type, object_uuid=object_uuid)
+            for object_uuid in self._get_all_ids()
+        ]
+
     def build_item(self, model: TModel) -> GossipItem:
         """
         Build a gossip item reference for a model.
@@ -156,6 +173,7 @@ class VoteReplicationHandler(ReplicationHandler[TVoteModel], Generic[TVoteModel]
         model_cls: type[TVoteModel],
         message_cls: type[BaseMessage[TVoteModel]],
         get_all_models: Callable[[], list[TVoteModel]],
+        get_all_ids: Callable[[], list[UUID]],
         get_one: Callable[[UUID], TVoteModel | None],
         add_one: Callable[[TVoteModel], None],
         record_vote: Callable[[TVoteModel], VoteRecordResult],
@@ -167,6 +185,7 @@ class VoteReplicationHandler(ReplicationHandler[TVoteModel], Generic[TVoteModel]
         :param model_cls: Vote model class used for this object type.
         :param message_cls: Message class used to send this vote type.
         :param get_all_models: Function returning all stored votes of this type.
+        :param get_all_ids: Function returning the UUIDs of all stored votes of this type.
         :param get_one: Function returning one stored vote by UUID.
         :param add_one: Function storing one vote in the local repository.
         :param record_vote: Function that records a vote while enforcing vote-specific
@@ -178,6 +197,7 @@ class VoteReplicationHandler(ReplicationHandler[TVoteModel], Generic[TVoteModel]
             model_cls=model_cls,
             message_cls=message_cls,
             get_all_models=get_all_models,
+            get_all_ids=get_all_ids,
             get_one=get_one,
             add_one=add_one,
         )
@@ -226,6 +246,7 @@ def build_replication_handlers(
         model_cls=Issue,
         message_cls=IssueMessage,
         get_all_models=repository.get_all_issues,
+        get_all_ids=repository.get_all_issue_ids,
         get_one=repository.get_issue,
         add_one=repository.add_issue,
     )
@@ -234,6 +255,7 @@ def build_replication_handlers(
         model_cls=IssueVote,
         message_cls=IssueVoteMessage,
         get_all_models=repository.get_all_issue_votes,
+        get_all_ids=repository.get_all_issue_vote_ids,
         get_one=repository.get_issue_vote,
         add_one=repository.add_issue_vote,
         record_vote=repository.record_issue_vote,
@@ -243,6 +265,7 @@ def build_replication_handlers(
         model_cls=Solution,
         message_cls=SolutionMessage,
         get_all_models=repository.get_all_solutions,
+        get_all_ids=repository.get_all_solution_ids,
         get_one=repository.get_solution,
         add_one=repository.add_solution,
     )
@@ -251,6 +274,7 @@ def build_replication_handlers(
         model_cls=SolutionVote,
         message_cls=SolutionVoteMessage,
         get_all_models=repository.get_all_solution_votes,
+        get_all_ids=repository.get_all_solution_vote_ids,
         get_one=repository.get_solution_vote,
         add_one=repository.add_solution_vote,
         record_vote=repository.record_solution_vote,
@@ -260,6 +284,7 @@ def build_replication_handlers(
         model_cls=FundingCampaign,
         message_cls=FundingCampaignMessage,
         get_all_models=repository.get_all_campaigns,
+        get_all_ids=repository.get_all_campaign_ids,
         get_one=repository.get_campaign,
         add_one=repository.add_campaign,
     )
@@ -268,6 +293,7 @@ def build_replication_handlers(
         model_cls=FundingPledge,
         message_cls=FundingPledgeMessage,
         get_all_models=repository.get_all_pledges,
+        get_all_ids=repository.get_all_pledge_ids,
         get_one=repository.get_pledge,
         add_one=repository.add_pledge,
     )
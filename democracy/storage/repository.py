@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional, Protocol
+from typing import ContextManager, List, Optional, Protocol
 from uuid import UUID
 
 from democracy.funding.models import FundingCampaign, FundingPledge
@@ -132,6 +132,20 @@ class DemocracySyncRepository(ClosableRepository, Protocol):
 
     def add_pledge(self, pledge: FundingPledge) -> None: ...
 
+    def get_all_issue_ids(self) -> List[UUID]: ...
+
+    def get_all_issue_vote_ids(self) -> List[UUID]: ...
+
+    def get_all_solution_ids(self) -> List[UUID]: ...
+
+    def get_all_solution_vote_ids(self) -> List[UUID]: ...
+
+    def get_all_campaign_ids(self) -> List[UUID]: ...
+
+    def get_all_pledge_ids(self) -> List[UUID]: ...
+
+    def transaction(self) -> ContextManager[None]: ...
+
 
 class DemocracyAppRepository(
     DemocracyReadRepository,
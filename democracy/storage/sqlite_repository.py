@@ -3,11 +3,13 @@ from __future__ import annotations
 import hashlib
 import sqlite3
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 from uuid import UUID
 
+from democracy.constants import SQLITE_MMAP_SIZE
 from democracy.funding.models import FundingCampaign, FundingPledge
 from democracy.models.DTOs.issue_with_votes import IssueWithVotes
 from democracy.models.DTOs.solution_with_votes import SolutionWithVotes
@@ -43,6 +45,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
 
         self._connection = sqlite3.connect(str(database_path))
         self._connection.row_factory = sqlite3.Row
+        self._in_transaction = False
 
         self._enable_pragmas()
         self._create_schema()
@@ -59,6 +62,13 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         """
         self._connection.execute("PRAGMA foreign_keys = ON;")
         self._connection.execute("PRAGMA journal_mode = WAL;")
+        # In WAL mode, NORMAL keeps every commit atomic but only syncs the log on
+        # checkpoints instead of on each commit. A power loss can drop the latest
+        # commits, which peers replicate back, but never corrupts the database.
+        self._connection.execute("PRAGMA synchronous = NORMAL;")
+        # Reads are served from a memory map of the database file instead of being
+        # copied through the page cache into SQLite's own buffers.
+        self._connection.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE};")
 
     def _create_schema(self) -> None:
         """
@@ -162,14 +172,22 @@ class SQLiteDemocracyRepository(DemocracyRepository):
                     UNIQUE(campaign_id, txid, vout)
                 );
 
+                CREATE INDEX IF NOT EXISTS idx_issues_created_at
+                    ON issues(created_at);
+
                 CREATE INDEX IF NOT EXISTS idx_issue_votes_issue_id
                     ON issue_votes(issue_id);
 
                 CREATE INDEX IF NOT EXISTS idx_issue_votes_voter_issue
                     ON issue_votes(voter_id, issue_id);
 
-                CREATE INDEX IF NOT EXISTS idx_solutions_issue_id
-                    ON solutions(issue_id);
+                DROP INDEX IF EXISTS idx_solutions_issue_id;
+
+                CREATE INDEX IF NOT EXISTS idx_solutions_created_at
+                    ON solutions(created_at);
+
+                CREATE INDEX IF NOT EXISTS idx_solutions_issue_created_at
+                    ON solutions(issue_id, created_at);
 
                 CREATE INDEX IF NOT EXISTS idx_solution_votes_solution_id
                     ON solution_votes(solution_id);
@@ -187,6 +205,57 @@ class SQLiteDemocracyRepository(DemocracyRepository):
                     ON funding_pledges(txid, vout);
                 """)
 
+    # ------------------------------------------------------------------
+    # Transactions
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Commit all writes made inside the block together, in a single transaction.
+
+        Each write inside the block still succeeds or fails on its own: a write that
+        raises is rolled back without undoing the other writes of the block. Nested
+        blocks join the outermost one.
+
+        :return: Context manager for the transaction.
+        """
+        if self._in_transaction:
+            yield
+            return
+
+        self._in_transaction = True
+        try:
+            with self._connection:
+                self._connection.execute("BEGIN;")
+                yield
+        finally:
+            self._in_transaction = False
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        """
+        Run the statements of one write method atomically.
+
+        Outside a transaction block the write is committed on its own; inside one it
+        runs in a savepoint that is released into the surrounding transaction.
+
+        :return: Context manager for the write.
+        """
+        if not self._in_transaction:
+            with self._connection:
+                yield
+            return
+
+        self._connection.execute("SAVEPOINT write;")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK TO write;")
+            self._connection.execute("RELEASE write;")
+            raise
+        self._connection.execute("RELEASE write;")
+
     # ------------------------------------------------------------------
     # Content-addressed descriptions
     # ------------------------------------------------------------------
@@ -293,13 +362,14 @@ class SQLiteDemocracyRepository(DemocracyRepository):
                 issues.creator_id,
                 content_objects.text_content AS description,
                 issues.created_at,
-                COUNT(issue_votes.id) AS vote_count
+                (
+                    SELECT COUNT(*)
+                    FROM issue_votes
+                    WHERE issue_votes.issue_id = issues.id
+                ) AS vote_count
             FROM issues
             JOIN content_objects
                 ON content_objects.hash = issues.description_hash
-            LEFT JOIN issue_votes
-                ON issue_votes.issue_id = issues.id
-            GROUP BY issues.id
             ORDER BY issues.created_at DESC;
             """).fetchall()
 
@@ -326,14 +396,15 @@ class SQLiteDemocracyRepository(DemocracyRepository):
                 issues.creator_id,
                 content_objects.text_content AS description,
                 issues.created_at,
-                COUNT(issue_votes.id) AS vote_count
+                (
+                    SELECT COUNT(*)
+                    FROM issue_votes
+                    WHERE issue_votes.issue_id = issues.id
+                ) AS vote_count
             FROM issues
             JOIN content_objects
                 ON content_objects.hash = issues.description_hash
-            LEFT JOIN issue_votes
-                ON issue_votes.issue_id = issues.id
-            WHERE issues.id = ?
-            GROUP BY issues.id;
+            WHERE issues.id = ?;
             """,
             (str(issue_id),),
         ).fetchone()
@@ -360,13 +431,14 @@ class SQLiteDemocracyRepository(DemocracyRepository):
                 solutions.creator_id,
                 content_objects.text_content AS description,
                 solutions.created_at,
-                COUNT(solution_votes.id) AS vote_count
+                (
+                    SELECT COUNT(*)
+                    FROM solution_votes
+                    WHERE solution_votes.solution_id = solutions.id
+                ) AS vote_count
             FROM solutions
             JOIN content_objects
                 ON content_objects.hash = solutions.description_hash
-            LEFT JOIN solution_votes
-                ON solution_votes.solution_id = solutions.id
-            GROUP BY solutions.id
             ORDER BY solutions.created_at DESC;
             """).fetchall()
 
@@ -394,14 +466,15 @@ class SQLiteDemocracyRepository(DemocracyRepository):
                 solutions.creator_id,
                 content_objects.text_content AS description,
                 solutions.created_at,
-                COUNT(solution_votes.id) AS vote_count
+                (
+                    SELECT COUNT(*)
+                    FROM solution_votes
+                    WHERE solution_votes.solution_id = solutions.id
+                ) AS vote_count
             FROM solutions
             JOIN content_objects
                 ON content_objects.hash = solutions.description_hash
-            LEFT JOIN solution_votes
-                ON solution_votes.solution_id = solutions.id
-            WHERE solutions.id = ?
-            GROUP BY solutions.id;
+            WHERE solutions.id = ?;
             """,
             (str(solution_id),),
         ).fetchone()
@@ -432,14 +505,15 @@ class SQLiteDemocracyRepository(DemocracyRepository):
                 solutions.creator_id,
                 content_objects.text_content AS description,
                 solutions.created_at,
-                COUNT(solution_votes.id) AS vote_count
+                (
+                    SELECT COUNT(*)
+                    FROM solution_votes
+                    WHERE solution_votes.solution_id = solutions.id
+                ) AS vote_count
             FROM solutions
             JOIN content_objects
                 ON content_objects.hash = solutions.description_hash
-            LEFT JOIN solution_votes
-                ON solution_votes.solution_id = solutions.id
             WHERE solutions.issue_id = ?
-            GROUP BY solutions.id
             ORDER BY solutions.created_at DESC;
             """,
             (str(issue_id),),
@@ -466,7 +540,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :raises sqlite3.IntegrityError: If the issue ID already exists or
             referenced constraints fail.
         """
-        with self._connection:
+        with self._write():
             description_hash = self._store_text_content(issue.description)
 
             self._connection.execute(
@@ -498,7 +572,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :raises sqlite3.IntegrityError: If the vote is duplicate or the issue
             does not exist.
         """
-        with self._connection:
+        with self._write():
             self._connection.execute(
                 """
                 INSERT INTO issue_votes (
@@ -527,12 +601,30 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :raises sqlite3.IntegrityError: If the issue does not exist or another
             integrity constraint fails.
         """
-        try:
-            self.add_issue_vote(vote)
-        except sqlite3.IntegrityError as exc:
-            if self._is_duplicate_issue_vote_error(exc):
-                return VoteRecordResult.ALREADY_VOTED
-            raise
+        # ON CONFLICT turns a duplicate vote into a single probe of the
+        # UNIQUE(issue_id, voter_id) index instead of a raised and inspected error.
+        with self._write():
+            cursor = self._connection.execute(
+                """
+                INSERT INTO issue_votes (
+                    id,
+                    issue_id,
+                    voter_id,
+                    created_at
+                )
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (issue_id, voter_id) DO NOTHING;
+                """,
+                (
+                    str(vote.id),
+                    str(vote.issue_id),
+                    str(vote.voter_id),
+                    self._datetime_to_storage(vote.created_at),
+                ),
+            )
+
+        if cursor.rowcount == 0:
+            return VoteRecordResult.ALREADY_VOTED
 
         return VoteRecordResult.CREATED
 
@@ -545,7 +637,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :raises sqlite3.IntegrityError: If the solution ID already exists or
             the parent issue does not exist.
         """
-        with self._connection:
+        with self._write():
             description_hash = self._store_text_content(solution.description)
 
             self._connection.execute(
@@ -579,7 +671,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :raises sqlite3.IntegrityError: If the vote is duplicate or the solution
             does not exist.
         """
-        with self._connection:
+        with self._write():
             self._connection.execute(
                 """
                 INSERT INTO solution_votes (
@@ -608,12 +700,30 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :raises sqlite3.IntegrityError: If the solution does not exist or
             another integrity constraint fails.
         """
-        try:
-            self.add_solution_vote(vote)
-        except sqlite3.IntegrityError as exc:
-            if self._is_duplicate_solution_vote_error(exc):
-                return VoteRecordResult.ALREADY_VOTED
-            raise
+        # ON CONFLICT turns a duplicate vote into a single probe of the
+        # UNIQUE(solution_id, voter_id) index instead of a raised and inspected error.
+        with self._write():
+            cursor = self._connection.execute(
+                """
+                INSERT INTO solution_votes (
+                    id,
+                    solution_id,
+                    voter_id,
+                    created_at
+                )
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (solution_id, voter_id) DO NOTHING;
+                """,
+                (
+                    str(vote.id),
+                    str(vote.solution_id),
+                    str(vote.voter_id),
+                    self._datetime_to_storage(vote.created_at),
+                ),
+            )
+
+        if cursor.rowcount == 0:
+            return VoteRecordResult.ALREADY_VOTED
 
         return VoteRecordResult.CREATED
 
@@ -683,12 +793,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         if row is None:
             return None
 
-        return IssueVote(
-            id=UUID(row["id"]),
-            issue_id=UUID(row["issue_id"]),
-            voter_id=UUID(row["voter_id"]),
-            created_at=self._datetime_from_storage(row["created_at"]),
-        )
+        return self._row_to_issue_vote(row)
 
     def get_all_issue_votes(self) -> List[IssueVote]:
         rows = self._connection.execute("""
@@ -697,15 +802,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
             ORDER BY created_at DESC;
             """).fetchall()
 
-        return [
-            IssueVote(
-                id=UUID(row["id"]),
-                issue_id=UUID(row["issue_id"]),
-                voter_id=UUID(row["voter_id"]),
-                created_at=self._datetime_from_storage(row["created_at"]),
-            )
-            for row in rows
-        ]
+        return [self._row_to_issue_vote(row) for row in rows]
 
     def get_solution(self, solution_id: UUID) -> Optional[Solution]:
         """
@@ -771,12 +868,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         if row is None:
             return None
 
-        return SolutionVote(
-            id=UUID(row["id"]),
-            solution_id=UUID(row["solution_id"]),
-            voter_id=UUID(row["voter_id"]),
-            created_at=self._datetime_from_storage(row["created_at"]),
-        )
+        return self._row_to_solution_vote(row)
 
     def get_all_solution_votes(self) -> List[SolutionVote]:
         rows = self._connection.execute("""
@@ -785,15 +877,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
             ORDER BY created_at DESC;
             """).fetchall()
 
-        return [
-            SolutionVote(
-                id=UUID(row["id"]),
-                solution_id=UUID(row["solution_id"]),
-                voter_id=UUID(row["voter_id"]),
-                created_at=self._datetime_from_storage(row["created_at"]),
-            )
-            for row in rows
-        ]
+        return [self._row_to_solution_vote(row) for row in rows]
 
     # ------------------------------------------------------------------
     # Additional storage operations
@@ -807,7 +891,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :param issue: The new issue data.
         :return: True if the issue was replaced, otherwise False.
         """
-        with self._connection:
+        with self._write():
             description_hash = self._store_text_content(issue.description)
 
             cursor = self._connection.execute(
@@ -842,7 +926,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :param issue_id: The ID of the issue to delete.
         :return: True if the issue was deleted, otherwise False.
         """
-        with self._connection:
+        with self._write():
             cursor = self._connection.execute(
                 """
                 DELETE FROM issues
@@ -861,7 +945,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :param solution: The new solution data.
         :return: True if the solution was replaced, otherwise False.
         """
-        with self._connection:
+        with self._write():
             description_hash = self._store_text_content(solution.description)
 
             cursor = self._connection.execute(
@@ -898,7 +982,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :param solution_id: The ID of the solution to delete.
         :return: True if the solution was deleted, otherwise False.
         """
-        with self._connection:
+        with self._write():
             cursor = self._connection.execute(
                 """
                 DELETE FROM solutions
@@ -949,7 +1033,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :raises sqlite3.IntegrityError: If the campaign ID already exists, if a campaign
             already exists for the solution, or if the referenced solution does not exist.
         """
-        with self._connection:
+        with self._write():
             self._connection.execute(
                 """
                 INSERT INTO funding_campaigns (
@@ -1047,7 +1131,7 @@ class SQLiteDemocracyRepository(DemocracyRepository):
             outpoint was already pledged for the campaign, or if the campaign does not
             exist.
         """
-        with self._connection:
+        with self._write():
             self._connection.execute(
                 """
                 INSERT INTO funding_pledges (
@@ -1131,6 +1215,71 @@ class SQLiteDemocracyRepository(DemocracyRepository):
 
         return [self._row_to_pledge(row) for row in rows]
 
+    # ------------------------------------------------------------------
+    # Replication inventory
+    # ------------------------------------------------------------------
+
+    def _get_all_ids(self, table: str) -> List[UUID]:
+        """
+        Retrieve the IDs of all rows in a table.
+
+        Only the primary key column is read, so announcing the local inventory does not
+        load descriptions or other payload columns.
+
+        :param table: Name of the table to read.
+        :return: List of row IDs.
+        """
+        rows = self._connection.execute(f"SELECT id FROM {table};").fetchall()
+        return [UUID(row["id"]) for row in rows]
+
+    def get_all_issue_ids(self) -> List[UUID]:
+        """
+        Retrieve the IDs of all issues.
+
+        :return: List of issue IDs.
+        """
+        return self._get_all_ids("issues")
+
+    def get_all_issue_vote_ids(self) -> List[UUID]:
+        """
+        Retrieve the IDs of all issue votes.
+
+        :return: List of issue vote IDs.
+        """
+        return self._get_all_ids("issue_votes")
+
+    def get_all_solution_ids(self) -> List[UUID]:
+        """
+        Retrieve the IDs of all solutions.
+
+        :return: List of solution IDs.
+        """
+        return self._get_all_ids("solutions")
+
+    def get_all_solution_vote_ids(self) -> List[UUID]:
+        """
+        Retrieve the IDs of all solution votes.
+
+        :return: List of solution vote IDs.
+        """
+        return self._get_all_ids("solution_votes")
+
+    def get_all_campaign_ids(self) -> List[UUID]:
+        """
+        Retrieve the IDs of all funding campaigns.
+
+        :return: List of funding campaign IDs.
+        """
+        return self._get_all_ids("funding_campaigns")
+
+    def get_all_pledge_ids(self) -> List[UUID]:
+        """
+        Retrieve the IDs of all funding pledges.
+
+        :return: List of funding pledge IDs.
+        """
+        return self._get_all_ids("funding_pledges")
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -1143,24 +1292,6 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         """
         self._connection.close()
 
-    @staticmethod
-    def _is_duplicate_issue_vote_error(error: sqlite3.IntegrityError) -> bool:
-        message = str(error)
-        return (
-            "UNIQUE constraint failed" in message
-            and "issue_votes.issue_id" in message
-            and "issue_votes.voter_id" in message
-        )
-
-    @staticmethod
-    def _is_duplicate_solution_vote_error(error: sqlite3.IntegrityError) -> bool:
-        message = str(error)
-        return (
-            "UNIQUE constraint failed" in message
-            and "solution_votes.solution_id" in message
-            and "solution_votes.voter_id" in message
-        )
-
     # ------------------------------------------------------------------
     # Row mapping
     # ------------------------------------------------------------------
@@ -1173,14 +1304,14 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :param row: SQLite row.
         :return: Issue instance.
         """
+        # Row converters run once per loaded row, so they pass fields positionally
+        # (in dataclass field order) rather than through keyword matching.
         return Issue(
-            id=UUID(row["id"]),
-            title=row["title"],
-            creator_id=UUID(row["creator_id"]),
-            description=row["description"],
-            created_at=SQLiteDemocracyRepository._datetime_from_storage(
-                row["created_at"]
-            ),
+            row["title"],
+            UUID(row["creator_id"]),
+            row["description"],
+            UUID(row["id"]),
+            SQLiteDemocracyRepository._datetime_from_storage(row["created_at"]),
         )
 
     @staticmethod
@@ -1192,14 +1323,42 @@ class SQLiteDemocracyRepository(DemocracyRepository):
         :return: Solution instance.
         """
         return Solution(
-            id=UUID(row["id"]),
-            issue_id=UUID(row["issue_id"]),
-            title=row["title"],
-            creator_id=UUID(row["creator_id"]),
-            description=row["description"],
-            created_at=SQLiteDemocracyRepository._datetime_from_storage(
-                row["created_at"]
-            ),
+            row["title"],
+            row["description"],
+            UUID(row["creator_id"]),
+            UUID(row["issue_id"]),
+            UUID(row["id"]),
+            SQLiteDemocracyRepository._datetime_from_storage(row["created_at"]),
+        )
+
+    @staticmethod
+    def _row_to_issue_vote(row: sqlite3.Row) -> IssueVote:
+        """
+        Convert a SQLite row to an IssueVote model.
+
+        :param row: SQLite row.
+        :return: IssueVote instance.
+        """
+        return IssueVote(
+            UUID(row["voter_id"]),
+            UUID(row["issue_id"]),
+            UUID(row["id"]),
+            SQLiteDemocracyRepository._datetime_from_storage(row["created_at"]),
+        )
+
+    @staticmethod
+    def _row_to_solution_vote(row: sqlite3.Row) -> SolutionVote:
+        """
+        Convert a SQLite row to a SolutionVote model.
+
+        :param row: SQLite row.
+        :return: SolutionVote instance.
+        """
+        return SolutionVote(
+            UUID(row["voter_id"]),
+            UUID(row["solution_id"]),
+            UUID(row["id"]),
+            SQLiteDemocracyRepository._datetime_from_storage(row["created_at"]),
         )
 
     @staticmethod
@@ -81,6 +81,8 @@ class Config:
 
     # SporeStack / VPS identity
     SPORESTACK_TOKEN_FILE: Path = DATA_DIR / "sporestack_token"
+    # Touched once startup has finished; the deployer polls for it after launching
+    READY_FILE: Path = DATA_DIR / "orchestrator.ready"
     SPORESTACK_BASE_URL: str = os.getenv("MYCELIUM_SPORESTACK_BASE_URL", "https://api.sporestack.com").rstrip("/")
 
     # Sim-mode overrides (production: all unset → no behavioural change)
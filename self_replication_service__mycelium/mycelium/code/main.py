@@ -8,6 +8,7 @@ import sys
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import modules.core.event_logger as event_logger
 import modules.monitoring.node_monitor as node_monitor
@@ -52,6 +53,7 @@ class Orchestrator:
         self.announcer = LiberationAnnouncer(self.seedbox)
         self.executor = ThreadPoolExecutor(max_workers=2)
         self._tasks: list = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # set once run() starts
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self) -> None:
@@ -174,8 +176,7 @@ class Orchestrator:
                 disk_threshold=Config.DISK_THRESHOLD,
                 cookies_file=Config.COOKIES_FILE,
             )
-            loop = asyncio.get_event_loop()
-            count = await loop.run_in_executor(self.executor, downloader.download_until_threshold)
+            count = await self._loop.run_in_executor(self.executor, downloader.download_until_threshold)
             logger.info("Content download finished: %d files downloaded", count)
         except ContentDownloaderError as e:
             logger.error("Content download failed: %s", e)
@@ -183,9 +184,8 @@ class Orchestrator:
             logger.error("Unexpected content download error: %s", e, exc_info=True)
 
     async def initialize_seedbox(self) -> bool:
-        loop = asyncio.get_event_loop()
         try:
-            await loop.run_in_executor(
+            await self._loop.run_in_executor(
                 self.executor,
                 self.seedbox.initialize
             )
@@ -199,9 +199,8 @@ class Orchestrator:
             return False
 
     async def run_seedbox_loop(self) -> None:
-        loop = asyncio.get_event_loop()
         try:
-            await loop.run_in_executor(
+            await self._loop.run_in_executor(
                 self.executor,
                 self.seedbox.run_status_loop,
                 Config.SEEDBOX_STATUS_INTERVAL
@@ -244,13 +243,15 @@ class Orchestrator:
 
     async def run_seedbox_info_announcer(self) -> None:
         logger.info("Waiting for community to initialize...")
-        # Wait until the announcer has initialized the community
-        wait_count = 0
-        while self.running and self.announcer.community is None:
-            wait_count += 1
-            if wait_count % 10 == 0:
-                logger.info("Still waiting for community... (%ds)", wait_count)
-            await asyncio.sleep(1)
+        # Wait until the announcer signals the community is up; shutdown cancels this task
+        waited = 0
+        while self.running:
+            try:
+                await asyncio.wait_for(self.announcer.community_ready.wait(), timeout=10)
+                break
+            except asyncio.TimeoutError:
+                waited += 10
+                logger.info("Still waiting for community... (%ds)", waited)
 
         if not self.running:
             logger.info("Orchestrator stopped before community init")
@@ -264,6 +265,7 @@ class Orchestrator:
 
     async def run(self) -> None:
         self.running = True
+        self._loop = asyncio.get_running_loop()
         logger.info("Orchestrator starting")
         logger.info("Repository: %s", Config.REPO_URL)
         logger.info("Branch: %s", Config.REPO_BRANCH)
@@ -333,6 +335,7 @@ def main() -> int:
             "version": _get_version(),
         })
         orchestrator = Orchestrator()
+        Config.READY_FILE.touch()
         asyncio.run(orchestrator.run())
         return Config.EXIT_SUCCESS
     except KeyboardInterrupt:
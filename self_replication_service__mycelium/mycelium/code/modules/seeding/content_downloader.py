@@ -14,6 +14,8 @@ from utils import setup_logger
 logger = setup_logger(__name__, log_file=Config.LOG_DIR / "orchestrator.log", level=Config.LOG_LEVEL)
 
 VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+# One video ID per line in the IDs file; surrounding whitespace is ignored
+_VIDEO_ID_LINE_RE = re.compile(rb"^[ \t]*([A-Za-z0-9_-]{11})[ \t\r]*$", re.MULTILINE)
 
 
 class ContentDownloaderError(Exception):
@@ -103,12 +105,11 @@ class ContentDownloader:
 
     def download_until_threshold(self) -> int:
         try:
-            text = self.video_ids_file.read_text()
+            data = self.video_ids_file.read_bytes()
         except FileNotFoundError:
             raise ContentDownloaderError(f"Video IDs file not found: {self.video_ids_file}")
 
-        all_ids = [line.strip() for line in text.splitlines() if line.strip()]
-        all_ids = [vid for vid in all_ids if VIDEO_ID_PATTERN.match(vid)]
+        all_ids = [m.group(1).decode() for m in _VIDEO_ID_LINE_RE.finditer(data)]
         logger.info("Loaded %d video IDs from %s", len(all_ids), self.video_ids_file)
 
         if not all_ids:
@@ -70,6 +70,8 @@ class LiberationAnnouncer:
         self.key_file = key_file or str(Config.DATA_DIR / "liberation_key.pem")
         self.ipv8: Optional[IPv8] = None
         self.community: Optional[LiberationCommunity] = None
+        # Set once the community is found and its callbacks are wired
+        self.community_ready = asyncio.Event()
 
         self._start_time: float = time.time()
         self._cached_public_ip: Optional[str] = None
@@ -126,6 +128,7 @@ class LiberationAnnouncer:
         else:
             logger.info("Sim mode (no seedbox) — skipping new-peer content burst callback")
 
+        self.community_ready.set()
         logger.info("LiberationCommunity is running")
         logger.info("Community ID: %s", self.community.community_id.hex())
         logger.info("My peer ID: %s...", self.community.my_peer.mid.hex()[:16])
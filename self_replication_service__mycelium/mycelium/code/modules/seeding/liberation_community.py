@@ -6,6 +6,7 @@ enabling health checkers to discover and monitor them.
 """
 
 import asyncio
+import logging
 import time
 from dataclasses import dataclass
 from hashlib import sha1
@@ -19,6 +20,9 @@ from ipv8.peer import Peer
 from config import Config
 
 
+_COMMUNITY_ID = sha1(b"liberation_community").digest()
+
+
 @dataclass
 class LiberatedContentPayload(DataClassPayload[1]):
     url: str
@@ -41,11 +45,15 @@ class SeedboxInfoPayload(DataClassPayload[2]):
     vps_days_remaining: int
 
 
+def _noop_content_callback(peer: Peer, payload: LiberatedContentPayload) -> None:
+    pass
+
+
 class LiberationCommunity(Community):
     """Seedboxes broadcast to this community; health checkers listen to discover torrents."""
 
     # Same community ID as SwarmHealth-Checker to enable discovery
-    community_id = sha1(b"liberation_community").digest()
+    community_id = _COMMUNITY_ID
 
     def __init__(self, settings: CommunitySettings) -> None:
         super().__init__(settings)
@@ -53,7 +61,10 @@ class LiberationCommunity(Community):
         # Gossip dedup: btc_address -> unix timestamp of last forward
         self._last_forwarded_whoami: Dict[str, float] = {}
 
-        self.on_content_received_callback: Optional[Callable[[Peer, LiberatedContentPayload], None]] = None
+        # Short hex labels for log lines, computed once per peer mid
+        self._peer_label_cache: Dict[bytes, str] = {}
+
+        self.on_content_received_callback: Callable[[Peer, LiberatedContentPayload], None] = _noop_content_callback
         self._on_new_peer_callback: Optional[Callable] = None
         self.on_seedbox_info_callback: Optional[Callable[[Peer, SeedboxInfoPayload], None]] = None
 
@@ -66,17 +77,26 @@ class LiberationCommunity(Community):
     def started(self) -> None:
         self.logger.info("LiberationCommunity started")
 
+    def _label(self, mid: bytes) -> str:
+        label = self._peer_label_cache.get(mid)
+        if label is None:
+            label = mid.hex()[:16]
+            self._peer_label_cache[mid] = label
+        return label
+
     def broadcast_content(self, payload: LiberatedContentPayload) -> int:
         peers = self.get_peers()
         if not peers:
             return 0
+        # The signed packet is identical for every peer, so build it only once
+        packet = self.ezr_pack(payload.msg_id, payload)
         sent = 0
         for peer in peers:
             try:
-                self.ez_send(peer, payload)
+                self.endpoint.send(peer.address, packet)
                 sent += 1
             except Exception as e:
-                self.logger.warning("Failed to send to peer %s: %s", peer.mid.hex()[:16], e)
+                self.logger.warning("Failed to send to peer %s: %s", self._label(peer.mid), e)
         return sent
 
     def set_new_peer_callback(self, callback: Callable) -> None:
@@ -90,14 +110,14 @@ class LiberationCommunity(Community):
 
     @lazy_wrapper(LiberatedContentPayload)
     def on_liberated_content(self, peer: Peer, payload: LiberatedContentPayload) -> None:
-        self.logger.info("Received content from peer %s: %s",
-                        peer.mid.hex()[:16], payload.url[:60] if payload.url else "unknown")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Received content from peer %s: %s",
+                             self._label(peer.mid), payload.url[:60] if payload.url else "unknown")
 
-        if self.on_content_received_callback:
-            try:
-                self.on_content_received_callback(peer, payload)
-            except Exception as e:
-                self.logger.error("Error in content received callback: %s", e)
+        try:
+            self.on_content_received_callback(peer, payload)
+        except Exception as e:
+            self.logger.error("Error in content received callback: %s", e)
 
     def set_content_received_callback(
         self,
@@ -119,7 +139,7 @@ class LiberationCommunity(Community):
                 sent_count += 1
             except Exception as e:
                 self.logger.warning("Failed to send seedbox info to peer %s: %s",
-                                   peer.mid.hex()[:16], e)
+                                   self._label(peer.mid), e)
 
         if sent_count > 0:
             self.logger.info("Broadcasted seedbox info to %d peer(s)", sent_count)
@@ -143,7 +163,7 @@ class LiberationCommunity(Community):
                         self.ez_send(other_peer, payload)
                     except Exception as e:
                         self.logger.warning("Failed to forward WHOAMI to %s: %s",
-                                            other_peer.mid.hex()[:16], e)
+                                            self._label(other_peer.mid), e)
 
     def set_seedbox_info_callback(
         self,
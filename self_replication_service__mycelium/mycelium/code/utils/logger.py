@@ -6,6 +6,14 @@ from typing import Optional
 
 from config import Config
 
+# The formatter never prints thread or process fields, so skip collecting them on every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Log directories already created by this process
+_created_log_dirs: set[Path] = set()
+
 
 def setup_logger(
     name: str,
@@ -29,7 +37,9 @@ def setup_logger(
     logger.addHandler(console_handler)
 
     if log_file:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        if log_file.parent not in _created_log_dirs:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            _created_log_dirs.add(log_file.parent)
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=Config.LOG_MAX_BYTES,
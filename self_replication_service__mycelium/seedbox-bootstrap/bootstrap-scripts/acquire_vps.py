@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # make lib/ importable
 
 from lib.config import CFG
+from lib.files import write_file_atomic
 from lib.deployer import generate_ssh_keypair
 from lib.provisioner import SporeStackClient, SporeStackError
 
@@ -54,9 +55,7 @@ def get_or_create_ssh_key(key_path: Path) -> tuple[str, str]:
 
 def save_server_info(info: dict) -> None:
     """Save server info for use by deploy_seedbox.py."""
-    SERVER_INFO_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(SERVER_INFO_FILE, "w") as f:
-        json.dump(info, f, indent=2)
+    write_file_atomic(SERVER_INFO_FILE, json.dumps(info, indent=2), mode=0o644)
     logger.info(f"Server info saved to {SERVER_INFO_FILE}")
 
 
@@ -6,7 +6,9 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # make lib/ importable
@@ -28,10 +30,14 @@ SPORESTACK_TOKEN_FILE = CFG["token_file"]
 DEFAULT_SSH_KEY_PATH = CFG["ssh_key_path"]
 DEFAULT_VIDEO_IDS_FILE = Path(__file__).parent.parent / "yt-cc-dataset-id-extraction" / "cc_video_ids.txt"
 DEFAULT_COOKIES_FILE = Path(__file__).parent.parent / "yt_cookies.txt"
+MAX_PARALLEL_DEPLOYS = 32
 
+# bitcoinlib's wallet database is not safe to use from several deploy threads at once
+_wallet_lock = threading.Lock()
 
-def load_server_info() -> dict | None:
-    """Load saved server info from file."""
+
+def load_server_info() -> dict | list | None:
+    """Load saved server info from file: one server object, or a list of them."""
     if not SERVER_INFO_FILE.exists():
         return None
 
@@ -75,10 +81,11 @@ def generate_vps_wallet() -> tuple[str, str]:
     """
     Generate a fresh btc wallet
     """
-    wallet = BitcoinWallet(f"vps-deploy-{int(time.time())}")
-    mnemonic = wallet.create_new()
-    address = wallet.get_receiving_address()
-    wallet.delete()
+    with _wallet_lock:
+        wallet = BitcoinWallet(f"vps-deploy-{time.time_ns()}")
+        mnemonic = wallet.create_new()
+        address = wallet.get_receiving_address()
+        wallet.delete()
     return mnemonic, address
 
 
@@ -87,14 +94,16 @@ def deploy(
     ssh_port: int = 22,
     ssh_key_path: str = None,
     default_btc_address: str = None,
+    stream_logs: bool = True,
+    compress: bool = True,
 ) -> None:
-    """Deploy mycelium to server."""
+    """Deploy mycelium to server, then optionally replace this process with a log tail."""
     key_path = ssh_key_path or str(DEFAULT_SSH_KEY_PATH)
     deployer = Deployer(key_path)
 
     try:
         logger.info(f"Connecting to {host}:{ssh_port}...")
-        deployer.connect(host, port=ssh_port, retry_count=5, retry_delay=10)
+        deployer.connect(host, port=ssh_port, retry_count=5, retry_delay=10, compress=compress)
 
         if deployer.wallet_initialized():
             logger.info("Existing wallet on VPS — skipping wallet generation")
@@ -151,10 +160,11 @@ def deploy(
         print("=" * 60)
         ssh_host = f"{host}" if ":" in host else host
         print(f"SSH: ssh -i {key_path} root@{ssh_host}")
-        print()
-        print("Streaming orchestrator logs (Ctrl+C to exit)...")
-        print("=" * 60)
-        print()
+        if stream_logs:
+            print()
+            print("Streaming orchestrator logs (Ctrl+C to exit)...")
+            print("=" * 60)
+            print()
 
     except DeployerError as e:
         logger.error(f"Deployment error: {e}")
@@ -162,70 +172,131 @@ def deploy(
     finally:
         deployer.disconnect()
 
-    # Stream logs - this replaces the Python process
-    known_hosts = str(Path.home() / ".mycelium" / "known_hosts")
+    if not stream_logs:
+        return
+
+    # Stream logs - this replaces the Python process, reusing the multiplexed master connection
     ssh_host = f"{host}" if ":" in host else host
     os.execvp("ssh", [
-        "ssh", "-i", key_path,
-        "-o", "StrictHostKeyChecking=yes",
-        "-o", f"UserKnownHostsFile={known_hosts}",
+        "ssh", *deployer.ssh_options(),
         f"root@{ssh_host}",
         "tail", "-f", "/root/logs/orchestrator.log"
     ])
 
 
+def deploy_many(
+    targets: list[tuple[str, int, str | None]],
+    default_btc_address: str,
+    compress: bool = True,
+) -> dict:
+    """Deploy to several hosts in parallel. Returns {host: exception} for failed hosts."""
+    failures = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DEPLOYS, len(targets))) as pool:
+        futures = {
+            pool.submit(
+                deploy,
+                host=host,
+                ssh_port=ssh_port,
+                ssh_key_path=ssh_key,
+                default_btc_address=default_btc_address,
+                stream_logs=False,
+                compress=compress,
+            ): host
+            for host, ssh_port, ssh_key in targets
+        }
+        for future in as_completed(futures):
+            host = futures[future]
+            try:
+                future.result()
+                logger.info(f"[{host}] deployment succeeded")
+            except Exception as e:
+                logger.error(f"[{host}] deployment failed: {e}")
+                failures[host] = e
+    return failures
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Deploy mycelium to a VPS",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Server info is loaded from ~/.mycelium/server.json (created by acquire_vps.py).
-Use --host to override or deploy to any server.
+The file may hold a single server object or a list of them; several servers are
+deployed in parallel. Use --host (repeatable) to override or deploy to any server.
 
 Examples:
-  python bootstrap-scripts/deploy_seedbox.py                     # Deploy to saved server
+  python bootstrap-scripts/deploy_seedbox.py                     # Deploy to saved server(s)
   python bootstrap-scripts/deploy_seedbox.py --host 95.179.1.1   # Deploy to specific IP
+  python bootstrap-scripts/deploy_seedbox.py --host 95.179.1.1 --host 95.179.1.2 --tail 95.179.1.1
         """
     )
 
-    parser.add_argument("--host", help="Server IP address (overrides saved server info)")
+    parser.add_argument("--host", action="append", help="Server IP address, repeatable (overrides saved server info)")
     parser.add_argument("--port", type=int, default=22, help="SSH port (default: 22)")
     parser.add_argument("--ssh-key", help=f"SSH key path (default: {DEFAULT_SSH_KEY_PATH})")
+    parser.add_argument("--no-compress", action="store_true", help="Disable SSH transport compression")
+    parser.add_argument("--tail", metavar="HOST", help="After a multi-host deploy, stream this host's logs")
 
     args = parser.parse_args()
 
-    host = args.host
-    ssh_port = args.port
-    ssh_key = args.ssh_key
-
-    if not host:
+    if args.host:
+        targets = [(host, args.port, args.ssh_key) for host in args.host]
+    else:
         info = load_server_info()
-        if info:
-            host = info.get("host") or info.get("ipv4")
-            ssh_port = info.get("ssh_port", ssh_port)
-            ssh_key = ssh_key or info.get("ssh_key_path")
-            logger.info(f"Using saved server: {host}:{ssh_port}")
-        else:
+        if not info:
             logger.error(f"No server info found at {SERVER_INFO_FILE}")
             logger.error("Run 'python bootstrap-scripts/acquire_vps.py' first, or specify --host")
             sys.exit(1)
+        servers = info if isinstance(info, list) else [info]
+        targets = [
+            (
+                server.get("host") or server.get("ipv4"),
+                server.get("ssh_port", args.port),
+                args.ssh_key or server.get("ssh_key_path"),
+            )
+            for server in servers
+        ]
+        for host, ssh_port, _ in targets:
+            logger.info(f"Using saved server: {host}:{ssh_port}")
 
     default_btc_address = load_default_btc_address()
     if not default_btc_address:
         logger.error("No default BTC address — create a local wallet with: python bootstrap-scripts/wallet.py create mycelium")
         sys.exit(1)
 
-    try:
-        deploy(
-            host=host,
-            ssh_port=ssh_port,
-            ssh_key_path=ssh_key,
-            default_btc_address=default_btc_address,
-        )
-    except Exception as e:
-        logger.error(f"Deployment failed: {e}")
+    if len(targets) == 1:
+        host, ssh_port, ssh_key = targets[0]
+        try:
+            deploy(
+                host=host,
+                ssh_port=ssh_port,
+                ssh_key_path=ssh_key,
+                default_btc_address=default_btc_address,
+                compress=not args.no_compress,
+            )
+        except Exception as e:
+            logger.error(f"Deployment failed: {e}")
+            sys.exit(1)
+        return
+
+    failures = deploy_many(targets, default_btc_address, compress=not args.no_compress)
+    if failures:
+        logger.error(f"Deployment failed on {len(failures)}/{len(targets)} hosts: {', '.join(failures)}")
         sys.exit(1)
 
+    if args.tail:
+        _, ssh_port, ssh_key = next(
+            (target for target in targets if target[0] == args.tail),
+            (args.tail, args.port, args.ssh_key),
+        )
+        deployer = Deployer(ssh_key or str(DEFAULT_SSH_KEY_PATH))
+        deployer.port = ssh_port
+        os.execvp("ssh", [
+            "ssh", *deployer.ssh_options(),
+            f"root@{args.tail}",
+            "tail", "-f", "/root/logs/orchestrator.log"
+        ])
+
 
 if __name__ == "__main__":
     main()
@@ -3,15 +3,18 @@
 
 import logging
 import os
+import random
 import sys
 import time
+from decimal import Decimal
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # make lib/ importable
 
 from lib.config import CFG
+from lib.files import write_file_atomic
 from lib.provisioner import SporeStackClient, SporeStackError
-from lib.wallet import BitcoinWallet, InsufficientFundsError, WalletError
+from lib.wallet import SATOSHIS_PER_BTC, BitcoinWallet, InsufficientFundsError, WalletError, parse_bitcoin_uri
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,27 +23,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 TOKEN_FILE = CFG["token_file"]
-
-
-def parse_bitcoin_uri(payment_uri: str) -> tuple[str, float] | None:
-    """Parse a bitcoin: URI and return (address, amount_btc) or None if invalid."""
-    if not payment_uri.startswith("bitcoin:"):
-        return None
-
-    parts = payment_uri[8:].split("?")
-    address = parts[0]
-    amount_btc = None
-
-    if len(parts) > 1:
-        for param in parts[1].split("&"):
-            if param.startswith("amount="):
-                amount_btc = float(param[7:])
-                break
-
-    if not address or not amount_btc:
-        return None
-
-    return address, amount_btc
+# Balance polling starts at the initial interval and backs off towards the max; confirmations take minutes
+CONFIRMATION_POLL_INITIAL = 30
+CONFIRMATION_POLL_MAX = 120
 
 
 def prompt_for_token() -> str:
@@ -59,9 +44,7 @@ def prompt_for_token() -> str:
 
 
 def save_token(token: str) -> None:
-    TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-    TOKEN_FILE.write_text(token)
-    TOKEN_FILE.chmod(0o600)
+    write_file_atomic(TOKEN_FILE, token, mode=0o600)
     logger.info(f"Token saved to {TOKEN_FILE}")
 
 
@@ -92,7 +75,11 @@ def get_or_create_token() -> str:
 def check_wallet_balance(wallet: BitcoinWallet) -> int:
     print("\nScanning blockchain for wallet updates...")
     wallet.scan()
+    return report_wallet_balance(wallet)
 
+
+def report_wallet_balance(wallet: BitcoinWallet) -> int:
+    """Print the balance from the last scan; send() already deducted any payment made since."""
     balance_sat = wallet.get_balance_satoshis()
     balance_btc = wallet.get_balance_btc()
 
@@ -133,12 +120,11 @@ def create_and_pay_invoice(
         logger.error(f"Could not parse invoice: {response}")
         return None
 
-    address, amount_btc = parsed
-    amount_sat = int(amount_btc * 100_000_000)
+    address, amount_sat = parsed
 
     print(f"\nInvoice created:")
     print(f"  Address: {address}")
-    print(f"  Amount:  {amount_sat:,} satoshis ({amount_btc:.8f} BTC)")
+    print(f"  Amount:  {amount_sat:,} satoshis ({Decimal(amount_sat) / SATOSHIS_PER_BTC:.8f} BTC)")
     print(f"  Value:   ${dollars}")
 
     wallet_balance = wallet.get_balance_satoshis()
@@ -175,7 +161,7 @@ def wait_for_confirmation(client: SporeStackClient, initial_balance: int, timeou
     print("SporeStack typically credits after 1-3 Bitcoin confirmations.")
 
     start_time = time.time()
-    check_interval = 30
+    check_interval = CONFIRMATION_POLL_INITIAL
 
     while time.time() - start_time < timeout:
         try:
@@ -194,7 +180,9 @@ def wait_for_confirmation(client: SporeStackClient, initial_balance: int, timeou
         except SporeStackError as e:
             logger.warning(f"Error checking balance: {e}")
 
-        time.sleep(check_interval)
+        remaining = timeout - (time.time() - start_time)
+        time.sleep(max(0, min(check_interval * random.uniform(0.9, 1.1), remaining)))
+        check_interval = min(check_interval * 1.5, CONFIRMATION_POLL_MAX)
 
     print("\nTimeout waiting for confirmation.")
     print("The payment may still be processing. Check balance later with:")
@@ -273,7 +261,7 @@ def main():
 
         print("\n" + "=" * 60)
         print("Final balances:")
-        check_wallet_balance(wallet)
+        report_wallet_balance(wallet)
         check_sporestack_balance(client)
 
     else:
@@ -1,24 +1,39 @@
-"""Library modules for autonomous VPS provisioning."""
+"""Library modules for autonomous VPS provisioning.
 
-from lib.deployer import Deployer, DeployerError, SSHConnectionError, CommandError, generate_ssh_keypair
-from lib.provisioner import SporeStackClient, SporeStackError, ServerNotReadyError, InsufficientBalanceError
-from lib.wallet import BitcoinWallet, WalletError, InsufficientFundsError, create_wallet_interactive
+Names are resolved lazily (PEP 562) so that importing one submodule, e.g.
+``lib.config``, doesn't drag in paramiko, requests and bitcoinlib as well.
+"""
 
-__all__ = [
+import importlib
+
+_EXPORTS = {
     # Deployer
-    "Deployer",
-    "DeployerError",
-    "SSHConnectionError",
-    "CommandError",
-    "generate_ssh_keypair",
+    "Deployer": "lib.deployer",
+    "DeployerError": "lib.deployer",
+    "SSHConnectionError": "lib.deployer",
+    "CommandError": "lib.deployer",
+    "generate_ssh_keypair": "lib.deployer",
     # Provisioner
-    "SporeStackClient",
-    "SporeStackError",
-    "ServerNotReadyError",
-    "InsufficientBalanceError",
+    "SporeStackClient": "lib.provisioner",
+    "SporeStackError": "lib.provisioner",
+    "ServerNotReadyError": "lib.provisioner",
+    "InsufficientBalanceError": "lib.provisioner",
     # Wallet
-    "BitcoinWallet",
-    "WalletError",
-    "InsufficientFundsError",
-    "create_wallet_interactive",
-]
+    "BitcoinWallet": "lib.wallet",
+    "WalletError": "lib.wallet",
+    "InsufficientFundsError": "lib.wallet",
+    "create_wallet_interactive": "lib.wallet",
+    # Files
+    "write_file_atomic": "lib.files",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
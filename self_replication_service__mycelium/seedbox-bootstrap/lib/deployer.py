@@ -1,14 +1,16 @@
 """SSH-based deployment module for remote server provisioning."""
 
+import base64
 import logging
 import os
+import select
+import shlex
 import subprocess
 import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import paramiko
-from scp import SCPClient
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,11 @@ class Deployer:
     REMOTE_DATA_DIR = "/root/data"
     REMOTE_VIDEO_IDS_FILE = "/root/cc_video_ids.txt"
     REMOTE_COOKIES_FILE = "/root/yt_cookies.txt"
+    OUTPUT_CHUNK_SIZE = 32768
+    PROGRESS_LOG_INTERVAL = 2.0
+    ORCHESTRATOR_STOP_TIMEOUT = 15
+    ORCHESTRATOR_START_TIMEOUT = 60
+    ORCHESTRATOR_POLL_INTERVAL = 0.2
 
     def __init__(
         self,
@@ -52,8 +59,13 @@ class Deployer:
         self.known_hosts_policy = known_hosts_policy
 
         self.known_hosts_path = Path.home() / ".mycelium" / "known_hosts"
+        # OpenSSH multiplexing socket, shared by external ssh invocations such as log tailing so they skip the handshake
+        self.control_path = Path.home() / ".mycelium" / "ssh" / "cm-%C"
 
         self.client: Optional[paramiko.SSHClient] = None
+        self._sftp: Optional[paramiko.SFTPClient] = None
+        self._private_key: Optional[paramiko.PKey] = None
+        self._compress = True
         self.host: Optional[str] = None
         self.port: int = 22
         self.user: str = "root"
@@ -71,21 +83,90 @@ class Deployer:
         if stdout.channel.recv_exit_status() != 0:
             raise CommandError(f"Failed to write secret file: {stderr.read().decode()}")
 
+    def ssh_options(self) -> list:
+        """OpenSSH client options for this host, reusing a multiplexed master connection."""
+        return [
+            "-i", str(self.ssh_key_path),
+            "-p", str(self.port),
+            "-o", "StrictHostKeyChecking=yes",
+            "-o", f"UserKnownHostsFile={self.known_hosts_path}",
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={self.control_path}",
+            "-o", "ControlPersist=600",
+        ]
+
+    def _start_control_master(self) -> None:
+        """Open the OpenSSH master connection in the background, overlapping its handshake with deployment."""
+        self.control_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            subprocess.Popen(
+                ["ssh", *self.ssh_options(), "-M", "-N", "-f", f"{self.user}@{self.host}"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.debug(f"Could not start SSH control master: {e}")
+
+    _KEY_CLASSES = {
+        "Ed25519": paramiko.Ed25519Key,
+        "RSA": paramiko.RSAKey,
+        "ECDSA": paramiko.ECDSAKey,
+    }
+
+    # Algorithm names found in the public key blob of an OpenSSH-format private key
+    _OPENSSH_KEY_ALGORITHMS = {
+        b"ssh-ed25519": "Ed25519",
+        b"ssh-rsa": "RSA",
+        b"ecdsa-sha2-": "ECDSA",
+    }
+
+    def _detect_key_type(self, key_path: str) -> Optional[str]:
+        """Guess the key type from the PEM header, or None if it cannot be told cheaply."""
+        try:
+            with open(key_path) as f:
+                lines = f.read().strip().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return None
+        if not lines:
+            return None
+
+        header = lines[0]
+        if "BEGIN RSA PRIVATE KEY" in header:
+            return "RSA"
+        if "BEGIN EC PRIVATE KEY" in header:
+            return "ECDSA"
+        if "BEGIN OPENSSH PRIVATE KEY" in header:
+            # The public key blob near the start of the body is never encrypted
+            body = "".join(lines[1:6])
+            try:
+                blob = base64.b64decode(body[:len(body) // 4 * 4])
+            except ValueError:
+                return None
+            for algorithm, key_name in self._OPENSSH_KEY_ALGORITHMS.items():
+                if algorithm in blob:
+                    return key_name
+        return None
+
     def _load_private_key(self) -> paramiko.PKey:
-        """Load SSH private key, auto-detecting the key type."""
+        """Load SSH private key, dispatching on the key header and caching the result."""
+        if self._private_key is not None:
+            return self._private_key
+
         key_path = str(self.ssh_key_path)
 
-        key_classes = [
-            ("Ed25519", paramiko.Ed25519Key),
-            ("RSA", paramiko.RSAKey),
-            ("ECDSA", paramiko.ECDSAKey),
-        ]
+        detected = self._detect_key_type(key_path)
+        key_names = list(self._KEY_CLASSES)
+        if detected:
+            key_names.remove(detected)
+            key_names.insert(0, detected)
 
         last_error = None
-        for key_name, key_class in key_classes:
+        for key_name in key_names:
             try:
-                key = key_class.from_private_key_file(key_path)
+                key = self._KEY_CLASSES[key_name].from_private_key_file(key_path)
                 logger.debug(f"Loaded {key_name} key from {key_path}")
+                self._private_key = key
                 return key
             except paramiko.SSHException:
                 continue
@@ -99,6 +180,34 @@ class Deployer:
             f"Last error: {last_error}"
         )
 
+    def _open_client(self, compress: bool, timeout: int = 30) -> paramiko.SSHClient:
+        """Open one authenticated SSH connection to the current host."""
+        client = paramiko.SSHClient()
+
+        # TOFU host key pinning
+        self.known_hosts_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.known_hosts_path.exists():
+            client.load_host_keys(str(self.known_hosts_path))
+
+        host_known = client.get_host_keys().lookup(self.host) is not None
+        if host_known:
+            client.set_missing_host_key_policy(paramiko.RejectPolicy())
+        else:
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        client.connect(
+            hostname=self.host,
+            port=self.port,
+            username=self.user,
+            pkey=self._load_private_key(),
+            timeout=timeout,
+            allow_agent=False,
+            look_for_keys=False,
+            compress=compress,
+        )
+        client.save_host_keys(str(self.known_hosts_path))
+        return client
+
     def connect(
         self,
         host: str,
@@ -106,45 +215,31 @@ class Deployer:
         user: str = "root",
         timeout: int = 30,
         retry_count: int = 3,
-        retry_delay: int = 10
+        retry_delay: int = 10,
+        compress: bool = True
     ) -> None:
-        """Establish SSH connection to remote server."""
+        """Establish SSH connection to remote server.
+
+        compress enables zlib on the transport used for commands, code and config files.
+        Content uploads never use it (see deploy_content); pass False to turn it off
+        everywhere.
+        """
         self.host = host
         self.port = port
         self.user = user
+        self._compress = compress
 
-        self.client = paramiko.SSHClient()
-
-        # TOFU host key pinning
-        self.known_hosts_path.parent.mkdir(parents=True, exist_ok=True)
-        if self.known_hosts_path.exists():
-            self.client.load_host_keys(str(self.known_hosts_path))
-
-        host_known = self.client.get_host_keys().lookup(host) is not None
-        if host_known:
-            self.client.set_missing_host_key_policy(paramiko.RejectPolicy())
-        else:
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-        private_key = self._load_private_key()
+        # Fail fast on a bad key instead of retrying the connection
+        self._load_private_key()
 
         last_error = None
         for attempt in range(1, retry_count + 1):
             try:
                 logger.info(f"Connecting to {user}@{host}:{port} (attempt {attempt}/{retry_count})")
 
-                self.client.connect(
-                    hostname=host,
-                    port=port,
-                    username=user,
-                    pkey=private_key,
-                    timeout=timeout,
-                    allow_agent=False,
-                    look_for_keys=False,
-                )
-
-                self.client.save_host_keys(str(self.known_hosts_path))
+                self.client = self._open_client(compress, timeout)
                 logger.info(f"Connected to {host}")
+                self._start_control_master()
                 return
 
             except Exception as e:
@@ -157,19 +252,87 @@ class Deployer:
         raise SSHConnectionError(f"Failed to connect after {retry_count} attempts: {last_error}")
 
     def disconnect(self) -> None:
+        if self._sftp:
+            self._sftp.close()
+            self._sftp = None
         if self.client:
             self.client.close()
             self.client = None
             logger.info(f"Disconnected from {self.host}")
 
+    def _collect_output(
+        self,
+        channel: paramiko.Channel,
+        timeout: int,
+        stream: bool = False
+    ) -> Tuple[str, str, int]:
+        """Drain a command's stdout/stderr while it runs, logging lines as they arrive.
+
+        Reading only after the exit status lets verbose commands (apt, pip, git) fill the
+        channel window and stall. Lines are logged at INFO when stream is set, so long
+        phases show progress, and at DEBUG otherwise. Raises CommandError if no output or
+        exit status arrives within timeout seconds.
+        """
+        return self._collect_outputs([channel], timeout, stream)[0]
+
+    def _collect_outputs(
+        self,
+        channels: List[paramiko.Channel],
+        timeout: int,
+        stream: bool = False
+    ) -> List[Tuple[str, str, int]]:
+        """Drain several channels of one transport concurrently; see _collect_output()."""
+        log_level = logging.INFO if stream else logging.DEBUG
+        buffers = [(bytearray(), bytearray()) for _ in channels]
+        logged = [[0, 0] for _ in channels]
+        pending = set(range(len(channels)))
+
+        while True:
+            for i in list(pending):
+                channel = channels[i]
+                streams = (
+                    (channel.recv_ready, channel.recv),
+                    (channel.recv_stderr_ready, channel.recv_stderr),
+                )
+                for index, (ready, recv) in enumerate(streams):
+                    buffer = buffers[i][index]
+                    while ready():
+                        buffer += recv(self.OUTPUT_CHUNK_SIZE)
+                    end = buffer.rfind(b"\n") + 1
+                    if end > logged[i][index]:
+                        for line in buffer[logged[i][index]:end].decode("utf-8", "replace").splitlines():
+                            logger.log(log_level, f"[{self.host}] {line}")
+                        logged[i][index] = end
+
+                if channel.exit_status_ready() and not channel.recv_ready() and not channel.recv_stderr_ready():
+                    pending.discard(i)
+
+            if not pending:
+                break
+            waiting = [channels[i] for i in pending]
+            readable, _, _ = select.select(waiting, [], [], timeout)
+            if not readable and not any(channel.exit_status_ready() for channel in waiting):
+                for channel in waiting:
+                    channel.close()
+                raise CommandError(f"Command produced no output for {timeout}s")
+
+        return [
+            (stdout.decode("utf-8"), stderr.decode("utf-8"), channel.recv_exit_status())
+            for (stdout, stderr), channel in zip(buffers, channels)
+        ]
+
     def run_command(
         self,
         command: str,
         timeout: int = 300,
         check: bool = True,
-        background: bool = False
+        background: bool = False,
+        stream: bool = False
     ) -> Tuple[str, str, int]:
-        """Execute command on remote server. Returns (stdout, stderr, exit_code)."""
+        """Execute command on remote server. Returns (stdout, stderr, exit_code).
+
+        stream logs the command's output at INFO while it runs; see _collect_output().
+        """
         if not self.client:
             raise DeployerError("Not connected. Call connect() first.")
 
@@ -180,10 +343,7 @@ class Deployer:
         if background:
             return "", "", 0
 
-        exit_code = stdout.channel.recv_exit_status()
-
-        stdout_text = stdout.read().decode("utf-8")
-        stderr_text = stderr.read().decode("utf-8")
+        stdout_text, stderr_text, exit_code = self._collect_output(stdout.channel, timeout, stream)
 
         if check and exit_code != 0:
             raise CommandError(
@@ -193,55 +353,182 @@ class Deployer:
 
         return stdout_text, stderr_text, exit_code
 
-    def upload_file(self, local_path: str, remote_path: str) -> None:
+    def run_commands_parallel(
+        self,
+        commands: List[str],
+        timeout: int = 300,
+        check: bool = True
+    ) -> List[Tuple[str, str, int]]:
+        """Run independent commands concurrently, each on its own channel of the one SSH transport.
+
+        All commands are sent before any result is awaited, so N commands cost about one
+        round trip instead of N. Returns one (stdout, stderr, exit_code) per command, in order.
+        """
+        if not self.client:
+            raise DeployerError("Not connected. Call connect() first.")
+
+        transport = self.client.get_transport()
+        channels = []
+        for command in commands:
+            logger.debug(f"Running: {command}")
+            channel = transport.open_session()
+            channel.exec_command(command)
+            channels.append(channel)
+
+        results = self._collect_outputs(channels, timeout)
+
+        if check:
+            for command, (_, stderr_text, exit_code) in zip(commands, results):
+                if exit_code != 0:
+                    raise CommandError(
+                        f"Command failed with exit code {exit_code}: {command}\n"
+                        f"stderr: {stderr_text}"
+                    )
+
+        return results
+
+    def run_script(
+        self,
+        script: str,
+        timeout: int = 300,
+        check: bool = True,
+        stream: bool = False
+    ) -> Tuple[str, str, int]:
+        """Execute a multi-line shell script in one SSH exec by feeding it to 'bash -s' on stdin.
+
+        Saves a channel open and exit-status round-trip per command compared to
+        calling run_command() for every step. stream logs the output at INFO while the
+        script runs. Returns (stdout, stderr, exit_code).
+        """
+        if not self.client:
+            raise DeployerError("Not connected. Call connect() first.")
+
+        logger.debug(f"Running script:\n{script}")
+
+        stdin, stdout, stderr = self.client.exec_command("bash -s", timeout=timeout)
+        stdin.write(script.encode("utf-8"))
+        stdin.channel.shutdown_write()
+
+        stdout_text, stderr_text, exit_code = self._collect_output(stdout.channel, timeout, stream)
+
+        if check and exit_code != 0:
+            raise CommandError(
+                f"Script failed with exit code {exit_code}\n"
+                f"stderr: {stderr_text}"
+            )
+
+        return stdout_text, stderr_text, exit_code
+
+    def _get_sftp(self) -> paramiko.SFTPClient:
+        """Return the SFTP session on the existing SSH transport, opening it on first use."""
         if not self.client:
             raise DeployerError("Not connected. Call connect() first.")
+        if self._sftp is None:
+            self._sftp = self.client.open_sftp()
+        return self._sftp
 
+    def upload_file(self, local_path: str, remote_path: str) -> None:
         logger.info(f"Uploading {local_path} -> {remote_path}")
+        self._get_sftp().put(local_path, remote_path)
 
-        with SCPClient(self.client.get_transport()) as scp:
-            scp.put(local_path, remote_path)
+    def upload_directory(
+        self,
+        local_path: str,
+        remote_path: str,
+        sftp: Optional[paramiko.SFTPClient] = None,
+    ) -> None:
+        """Upload a directory over the existing SFTP session, or over sftp if given.
 
-    def upload_directory(self, local_path: str, remote_path: str) -> None:
-        """Upload a directory using rsync over SSH."""
+        Like rsync's quick check, files whose remote size and mtime already match are skipped.
+        Each file is written to a .partial name and renamed into place once complete, so the
+        remote side never sees a half-written file and an interrupted upload is simply redone.
+        """
         logger.info(f"Uploading directory {local_path} -> {remote_path}")
 
+        sftp = sftp or self._get_sftp()
         self.run_command(f"mkdir -p {remote_path}")
 
-        rsync_cmd = [
-            "rsync", "-avz", "--progress",
-            "-e", f"ssh -i {self.ssh_key_path} -p {self.port} -o StrictHostKeyChecking=yes -o UserKnownHostsFile={self.known_hosts_path}",
-            f"{local_path}/",
-            f"{self.user}@{self.host}:{remote_path}/"
-        ]
+        pending = []
+        skipped = 0
+        for root, dirs, files in os.walk(local_path):
+            rel_root = os.path.relpath(root, local_path)
+            remote_root = remote_path if rel_root == "." else f"{remote_path}/{Path(rel_root).as_posix()}"
 
-        logger.debug(f"Running: {' '.join(rsync_cmd)}")
-        result = subprocess.run(rsync_cmd, capture_output=True, text=True)
+            existing = {}
+            try:
+                existing = {attr.filename: attr for attr in sftp.listdir_attr(remote_root)}
+            except IOError:
+                sftp.mkdir(remote_root)
+
+            for name in files:
+                local_file = os.path.join(root, name)
+                local_stat = os.stat(local_file)
+                remote_attr = existing.get(name)
+                if (
+                    remote_attr is not None
+                    and remote_attr.st_size == local_stat.st_size
+                    and remote_attr.st_mtime == int(local_stat.st_mtime)
+                ):
+                    skipped += 1
+                    continue
+                pending.append((local_file, f"{remote_root}/{name}", local_stat))
+
+        total_bytes = sum(local_stat.st_size for _, _, local_stat in pending)
+        done_bytes = 0
+        last_report = time.monotonic()
+
+        def report_progress(sent: int, _size: int) -> None:
+            nonlocal last_report
+            now = time.monotonic()
+            if now - last_report >= self.PROGRESS_LOG_INTERVAL:
+                last_report = now
+                current = done_bytes + sent
+                logger.info(
+                    f"Uploaded {current / 1e6:.1f}/{total_bytes / 1e6:.1f} MB "
+                    f"({100 * current / max(total_bytes, 1):.0f}%)"
+                )
 
-        if result.returncode != 0:
-            raise DeployerError(f"rsync failed: {result.stderr}")
+        for local_file, remote_file, local_stat in pending:
+            logger.debug(f"Uploading {local_file} -> {remote_file}")
+            partial_file = f"{remote_file}.partial"
+            sftp.put(local_file, partial_file, callback=report_progress)
+            sftp.utime(partial_file, (int(local_stat.st_atime), int(local_stat.st_mtime)))
+            sftp.posix_rename(partial_file, remote_file)
+            done_bytes += local_stat.st_size
 
-        logger.info("Directory upload complete")
+        logger.info(f"Directory upload complete ({len(pending)} uploaded, {skipped} unchanged)")
 
     def download_file(self, remote_path: str, local_path: str) -> None:
-        if not self.client:
-            raise DeployerError("Not connected. Call connect() first.")
-
         logger.info(f"Downloading {remote_path} -> {local_path}")
+        self._get_sftp().get(remote_path, local_path)
 
-        with SCPClient(self.client.get_transport()) as scp:
-            scp.get(remote_path, local_path)
-
-    def _wait_for_apt_lock(self, timeout: int = 300) -> None:
-        """Wait for apt/dpkg locks to be released (e.g. after fresh VPS boot)."""
-        logger.info("Waiting for apt lock...")
-        self.run_command(
+    @staticmethod
+    def _apt_lock_wait_script(timeout: int = 300) -> str:
+        """Shell snippet that waits for apt/dpkg locks to be released (e.g. after fresh VPS boot)."""
+        return (
             f"timeout {timeout} bash -c "
             f"'while fuser /var/lib/dpkg/lock-frontend /var/lib/apt/lists/lock "
-            f"/var/lib/dpkg/lock >/dev/null 2>&1; do sleep 3; done'",
-            timeout=timeout + 10,
+            f"/var/lib/dpkg/lock >/dev/null 2>&1; do sleep 3; done'"
         )
 
+    def _apt_install_missing_script(self, packages: list) -> str:
+        """Shell snippet that apt-installs only the packages not yet installed.
+
+        Re-deploys skip apt entirely, and the package lists are only refreshed when
+        they are more than an hour old.
+        """
+        return "\n".join([
+            "missing=''",
+            f"for pkg in {' '.join(packages)}; do",
+            "  dpkg-query -W -f='${db:Status-Status}' \"$pkg\" 2>/dev/null | grep -qx installed || missing=\"$missing $pkg\"",
+            "done",
+            "if [ -n \"$missing\" ]; then",
+            f"  {self._apt_lock_wait_script()}",
+            "  if [ -z \"$(find /var/cache/apt/pkgcache.bin -mmin -60 2>/dev/null)\" ]; then apt-get update -y; fi",
+            "  apt-get install -y $missing",
+            "fi",
+        ])
+
     def _configure_github_access(self) -> None:
         """On IPv6-only VPS, add /etc/hosts overrides for the GitHub IPv6 proxy."""
         if ':' not in (self.host or ''):
@@ -265,9 +552,6 @@ class Deployer:
 
         self._configure_github_access()
 
-        self._wait_for_apt_lock()
-        self.run_command("apt-get update -y", timeout=120)
-
         packages = [
             "python3",
             "python3-pip",
@@ -279,41 +563,57 @@ class Deployer:
             "unzip",
         ]
 
-        self.run_command(
-            f"apt-get install -y {' '.join(packages)}",
-            timeout=300
-        )
-
-        # Install deno (required by yt-dlp for YouTube JS extraction)
-        _, _, deno_check = self.run_command("which deno", check=False)
-        if deno_check != 0:
-            logger.info("Installing deno...")
-            self.run_command(
-                "curl -fsSL https://deno.land/install.sh | DENO_INSTALL=/usr/local sh",
-                timeout=120
-            )
+        # Deno is required by yt-dlp for YouTube JS extraction
+        script = "\n".join([
+            "set -e",
+            self._apt_install_missing_script(packages),
+            "command -v deno >/dev/null || "
+            "curl -fsSL https://deno.land/install.sh | DENO_INSTALL=/usr/local sh",
+        ])
+        self.run_script(script, timeout=900, stream=True)
 
         logger.info("System dependencies installed")
 
     def setup_firewall(self, extra_ports: Optional[list] = None) -> None:
         """Configure UFW firewall: SSH, BitTorrent ports, plus any extra_ports."""
         logger.info("Configuring firewall...")
-        self.run_command("apt-get install -y ufw", timeout=60)
-        self.run_command("ufw --force reset", check=False)
-        self.run_command("ufw default deny incoming")
-        self.run_command("ufw default allow outgoing")
-        self.run_command("ufw allow 22/tcp comment 'SSH'")
-        self.run_command("ufw allow 6881:6889/udp comment 'BitTorrent DHT'")
-        self.run_command("ufw allow 6881:6999/tcp comment 'BitTorrent'")
-        self.run_command("ufw allow 8090/udp comment 'IPv8'")
-
-        if extra_ports:
-            for port in extra_ports:
-                self.run_command(f"ufw allow {port}")
-                logger.info(f"Allowed extra port: {port}")
-
-        self.run_command("ufw --force enable")
-        stdout, _, _ = self.run_command("ufw status verbose", check=False)
+
+        rules = [
+            "ufw allow 22/tcp comment 'SSH'",
+            "ufw allow 6881:6889/udp comment 'BitTorrent DHT'",
+            "ufw allow 6881:6999/tcp comment 'BitTorrent'",
+            "ufw allow 8090/udp comment 'IPv8'",
+        ]
+        rules.extend(f"ufw allow {port}" for port in extra_ports or [])
+
+        # Setup output goes to stderr so stdout carries only the final status. On re-deploys
+        # where ufw is already active with exactly these rules, the reset/re-add/reload is skipped.
+        script = "\n".join([
+            "set -e",
+            "{",
+            self._apt_install_missing_script(["ufw"]),
+            "desired=$(cat <<'UFW_RULES'",
+            *rules,
+            "UFW_RULES",
+            ")",
+            "status=$(ufw status verbose 2>/dev/null || true)",
+            "if echo \"$status\" | grep -q '^Status: active' \\",
+            "  && echo \"$status\" | grep -q '^Default: deny (incoming), allow (outgoing)' \\",
+            "  && [ \"$(ufw show added | tail -n +2)\" = \"$desired\" ]; then",
+            "  echo 'Firewall rules unchanged'",
+            "else",
+            "  ufw --force reset || true",
+            "  ufw default deny incoming",
+            "  ufw default allow outgoing",
+            *(f"  {rule}" for rule in rules),
+            "  ufw --force enable",
+            "fi",
+            "} >&2",
+            "ufw status verbose || true",
+        ])
+        stdout, _, _ = self.run_script(script, timeout=120)
+        for port in extra_ports or []:
+            logger.info(f"Allowed extra port: {port}")
         logger.info(f"Firewall status:\n{stdout}")
 
         logger.info("Firewall configured successfully")
@@ -326,7 +626,7 @@ class Deployer:
     ) -> None:
         """Clone and set up mycelium repository using sparse checkout from monorepo.
 
-        The repo is cloned directly into REMOTE_BASE_DIR with sparse checkout,
+        The repo is shallow-cloned directly into REMOTE_BASE_DIR with sparse checkout,
         keeping the git working tree intact so that 'git pull' works for auto-updates.
         Files live at REMOTE_BASE_DIR/self_replication_service__mycelium/mycelium/.
         """
@@ -335,37 +635,30 @@ class Deployer:
 
         logger.info(f"Deploying mycelium from {repo_url} (subpath: {subpath})")
 
-        self.run_command(f"mkdir -p {self.REMOTE_CONTENT_DIR}")
-        self.run_command(f"mkdir -p {self.REMOTE_LOG_DIR}")
-        self.run_command(f"mkdir -p {self.REMOTE_DATA_DIR}")
-
-        _, _, exit_code = self.run_command(
-            f"test -d {self.REMOTE_BASE_DIR}/.git",
-            check=False
-        )
-
-        if exit_code == 0:
-            logger.info("Repository exists, pulling updates...")
-            self.run_command(f"cd {self.REMOTE_BASE_DIR} && git pull origin {branch}")
-        else:
-            logger.info("Cloning repository with sparse checkout...")
-            self.run_command(f"rm -rf {self.REMOTE_BASE_DIR}")
-            self.run_command(
-                f"git clone --filter=blob:none --sparse -b {branch} {repo_url} {self.REMOTE_BASE_DIR}",
-                timeout=120
-            )
-            self.run_command(
-                f"cd {self.REMOTE_BASE_DIR} && git sparse-checkout set {subpath}"
-            )
-
-        logger.info("Creating virtual environment...")
-        self.run_command(f"python3 -m venv {self.REMOTE_VENV_DIR}")
-
-        logger.info("Installing Python requirements...")
-        self.run_command(
-            f"{self.REMOTE_VENV_DIR}/bin/pip install -r {self.REMOTE_MYCELIUM_DIR}/code/requirements.txt",
-            timeout=300
-        )
+        requirements = f"{self.REMOTE_MYCELIUM_DIR}/code/requirements.txt"
+        requirements_stamp = f"{self.REMOTE_VENV_DIR}/.requirements.sha256"
+
+        script = "\n".join([
+            "set -e",
+            f"mkdir -p {self.REMOTE_CONTENT_DIR} {self.REMOTE_LOG_DIR} {self.REMOTE_DATA_DIR}",
+            f"if [ -d {self.REMOTE_BASE_DIR}/.git ]; then",
+            "  echo 'Repository exists, fetching latest commit...' >&2",
+            f"  git -C {self.REMOTE_BASE_DIR} fetch --depth=1 origin {branch}",
+            f"  git -C {self.REMOTE_BASE_DIR} reset --hard FETCH_HEAD",
+            "else",
+            "  echo 'Cloning repository with sparse checkout...' >&2",
+            f"  rm -rf {self.REMOTE_BASE_DIR}",
+            f"  git clone --depth=1 --filter=blob:none --sparse -b {branch} {repo_url} {self.REMOTE_BASE_DIR}",
+            f"  cd {self.REMOTE_BASE_DIR} && git sparse-checkout set {subpath}",
+            "fi",
+            f"[ -x {self.REMOTE_VENV_DIR}/bin/python ] || python3 -m venv {self.REMOTE_VENV_DIR}",
+            # Reinstall only when requirements.txt changed since the last successful install
+            f"if ! sha256sum --status -c {requirements_stamp} 2>/dev/null; then",
+            f"  {self.REMOTE_VENV_DIR}/bin/pip install --prefer-binary --disable-pip-version-check -r {requirements}",
+            f"  sha256sum {requirements} > {requirements_stamp}",
+            "fi",
+        ])
+        self.run_script(script, timeout=600, stream=True)
 
         logger.info("Mycelium deployed successfully")
 
@@ -394,15 +687,37 @@ class Deployer:
         if not Path(content_dir).exists():
             raise DeployerError(f"Content directory not found: {content_dir}")
 
-        self.upload_directory(content_dir, self.REMOTE_CONTENT_DIR)
+        if not self._compress:
+            self.upload_directory(content_dir, self.REMOTE_CONTENT_DIR)
+        else:
+            # Media is already compressed, so zlib would only burn CPU on both ends. paramiko
+            # cannot turn compression off on a live transport, so use a second connection.
+            content_client = self._open_client(compress=False)
+            try:
+                self.upload_directory(content_dir, self.REMOTE_CONTENT_DIR, sftp=content_client.open_sftp())
+            finally:
+                content_client.close()
         logger.info("Content deployed successfully")
 
-    def set_environment_variable(self, name: str, value: str) -> None:
-        escaped_value = value.replace("'", "'\\''")
-        self.run_command(
-            f"sed -i '/^{name}=/d' /etc/environment && "
-            f"echo \"{name}='{escaped_value}'\" >> /etc/environment"
+    def set_environment_variables(self, env_vars: dict) -> None:
+        """Replace the given variables in /etc/environment in a single exec, sending the lines via stdin."""
+        if not env_vars:
+            return
+        if not self.client:
+            raise DeployerError("Not connected. Call connect() first.")
+
+        names = "|".join(env_vars)
+        payload = "".join(f"{name}={shlex.quote(value)}\n" for name, value in env_vars.items())
+        stdin, stdout, stderr = self.client.exec_command(
+            f"sed -i -E '/^({names})=/d' /etc/environment && cat >> /etc/environment"
         )
+        stdin.write(payload.encode())
+        stdin.channel.shutdown_write()
+        if stdout.channel.recv_exit_status() != 0:
+            raise CommandError(f"Failed to write /etc/environment: {stderr.read().decode()}")
+
+    def set_environment_variable(self, name: str, value: str) -> None:
+        self.set_environment_variables({name: value})
 
     def sporestack_token_deployed(self) -> bool:
         """Return True if the SporeStack token has already been deployed."""
@@ -429,6 +744,18 @@ class Deployer:
     ) -> None:
         logger.info("Starting orchestrator...")
 
+        code_dir = f"{self.REMOTE_MYCELIUM_DIR}/code"
+        wrapper_script = f"{code_dir}/scripts/orchestrator_wrapper.sh"
+
+        # Independent preparation steps, run concurrently over one round trip
+        (_, _, token_check), (_, chmod_stderr, chmod_exit) = self.run_commands_parallel([
+            f"test -f {self.REMOTE_DATA_DIR}/sporestack_token",
+            f"chmod +x {wrapper_script}",
+        ], check=False)
+        if chmod_exit != 0:
+            raise CommandError(f"Failed to make {wrapper_script} executable: {chmod_stderr}")
+        token_deployed = token_check == 0
+
         env_vars = {
             "MYCELIUM_BASE_DIR": self.REMOTE_BASE_DIR,
             "MYCELIUM_VENV_DIR": self.REMOTE_VENV_DIR,
@@ -441,7 +768,7 @@ class Deployer:
 
         if btc_mnemonic:
             self._write_secret_file(btc_mnemonic, f"{self.REMOTE_DATA_DIR}/btc_mnemonic_seed")
-        if sporestack_token and not self.sporestack_token_deployed():
+        if sporestack_token and not token_deployed:
             self._write_secret_file(sporestack_token, f"{self.REMOTE_DATA_DIR}/sporestack_token")
             logger.info("SporeStack token deployed")
         if log_endpoint:
@@ -460,28 +787,41 @@ class Deployer:
         env_vars["MYCELIUM_INHERITANCE_RATIO"]      = "0.4"
         if default_btc_address:
             env_vars["MYCELIUM_DEFAULT_BTC_ADDRESS"] = default_btc_address
-        for name, value in env_vars.items():
-            self.set_environment_variable(name, value)
-
-        self.run_command("pkill -f 'python.*main.py' || true", check=False)
-
-        code_dir = f"{self.REMOTE_MYCELIUM_DIR}/code"
-        wrapper_script = f"{code_dir}/scripts/orchestrator_wrapper.sh"
-        self.run_command(f"chmod +x {wrapper_script}")
-
-        env_string = " ".join(f"{k}='{v}'" for k, v in env_vars.items())
-
-        self.run_command(
-            f"cd {code_dir} && "
+        self.set_environment_variables(env_vars)
+
+
+        env_string = " ".join(f"{k}={shlex.quote(v)}" for k, v in env_vars.items())
+
+        # Stop any running orchestrator and wait for it to exit, then launch the new one and
+        # poll for the ready file main.py touches once startup is done, all in one exec
+        ready_file = f"{self.REMOTE_DATA_DIR}/orchestrator.ready"
+        stop_polls = int(self.ORCHESTRATOR_STOP_TIMEOUT / self.ORCHESTRATOR_POLL_INTERVAL)
+        start_polls = int(self.ORCHESTRATOR_START_TIMEOUT / self.ORCHESTRATOR_POLL_INTERVAL)
+        script = "\n".join([
+            "pkill -f orchestrator_wrapper.sh || true",
+            "pkill -f 'python.*main.py' || true",
+            f"for _ in $(seq {stop_polls}); do",
+            "  pgrep -f 'python.*main.py' >/dev/null || break",
+            f"  sleep {self.ORCHESTRATOR_POLL_INTERVAL}",
+            "done",
+            "pkill -9 -f 'python.*main.py' || true",
+            f"rm -f {ready_file}",
+            f"cd {code_dir}",
             f"nohup env PATH=\"{self.REMOTE_VENV_DIR}/bin:$PATH\" {env_string} bash {wrapper_script} "
             f"< /dev/null > {self.REMOTE_LOG_DIR}/wrapper.log 2>&1 &",
-            background=True
+            f"for _ in $(seq {start_polls}); do",
+            f"  test -f {ready_file} && exit 0",
+            f"  sleep {self.ORCHESTRATOR_POLL_INTERVAL}",
+            "done",
+            "exit 1",
+        ])
+        _, _, exit_code = self.run_script(
+            script,
+            timeout=self.ORCHESTRATOR_STOP_TIMEOUT + self.ORCHESTRATOR_START_TIMEOUT + 30,
+            check=False,
         )
 
-        time.sleep(3)
-        stdout, _, _ = self.run_command("pgrep -f 'python.*main.py' || echo 'not running'")
-
-        if "not running" in stdout:
+        if exit_code != 0:
             raise DeployerError("Orchestrator failed to start")
 
         logger.info("Orchestrator started successfully")
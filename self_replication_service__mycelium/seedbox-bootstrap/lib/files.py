@@ -0,0 +1,24 @@
+"""Small local file helpers shared by the bootstrap scripts."""
+
+import os
+from pathlib import Path
+
+
+def write_file_atomic(path: Path, content: str, mode: int = 0o600) -> None:
+    """Write content to path via a temp file and rename, created with mode from the start.
+
+    A crash mid-write leaves the previous file intact, and the file is never
+    visible with a wider mode than requested.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+
+    fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)  # O_CREAT's mode is masked by umask and ignored for an existing file
+        os.write(fd, content.encode())
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
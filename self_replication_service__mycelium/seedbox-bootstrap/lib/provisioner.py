@@ -1,10 +1,13 @@
 """SporeStack API client for VPS provisioning."""
 
 import logging
+import random
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from lib.config import CFG
 
@@ -31,6 +34,9 @@ class SporeStackClient:
 
     BASE_URL = "https://api.sporestack.com"
     DEFAULT_TIMEOUT = 30
+    # Flavor/OS/region slugs rarely change; they are shared by all clients in the process
+    SLUG_CACHE_TTL = 24 * 60 * 60
+    _slug_cache: Dict[str, Tuple[float, Any]] = {}
 
     DEFAULT_PROVIDER = CFG["provider"]
     DEFAULT_FLAVOR = CFG["flavor"]
@@ -41,12 +47,27 @@ class SporeStackClient:
 
     def __init__(self, token: str):
         self.token = token
+        # One keep-alive session for all calls, so balance polling reuses the TLS connection
         self.session = requests.Session()
+        # Transient gateway errors are retried for idempotent methods only (urllib3's default),
+        # so a launch or invoice POST is never sent twice
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
         })
 
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "SporeStackClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _request(
         self,
         method: str,
@@ -61,7 +82,7 @@ class SporeStackClient:
         try:
             response = self.session.request(method, url, **kwargs)
 
-            logger.debug(f"{method} {url} -> {response.status_code}")
+            logger.debug("%s %s -> %s", method, url, response.status_code)
 
             if response.status_code >= 400:
                 error_msg = response.text
@@ -162,8 +183,8 @@ class SporeStackClient:
             payload["user_data"] = user_data
 
         logger.info(
-            f"Launching server: {flavor} on {provider} "
-            f"with {operating_system} for {days or 'default billing period'} days in {region}"
+            "Launching server: %s on %s with %s for %s days in %s",
+            flavor, provider, operating_system, days or "default billing period", region,
         )
 
         try:
@@ -173,7 +194,7 @@ class SporeStackClient:
                 json=payload
             )
             machine_id = response.get("machine_id")
-            logger.info(f"Server launched: {machine_id}")
+            logger.info("Server launched: %s", machine_id)
             return machine_id
 
         except SporeStackError as e:
@@ -188,7 +209,7 @@ class SporeStackClient:
         return self._request("GET", f"/token/{self.token}/servers/{machine_id}")
 
     def delete_server(self, machine_id: str) -> bool:
-        logger.info(f"Deleting server: {machine_id}")
+        logger.info("Deleting server: %s", machine_id)
         self._request("DELETE", f"/token/{self.token}/servers/{machine_id}")
         return True
 
@@ -221,11 +242,18 @@ class SporeStackClient:
         self,
         machine_id: str,
         timeout: int = 300,
-        poll_interval: int = 10
+        initial_delay: float = 1.0,
+        max_delay: float = 15.0,
+        multiplier: float = 1.5
     ) -> Dict[str, Any]:
-        """Wait for server to have a usable IP address. Raises ServerNotReadyError on timeout."""
-        logger.info(f"Waiting for server {machine_id} to be ready...")
+        """Wait for server to have a usable IP address. Raises ServerNotReadyError on timeout.
+
+        Polls with jittered exponential backoff from initial_delay up to max_delay, so a
+        server that comes up quickly is noticed within seconds without hammering the API.
+        """
+        logger.info("Waiting for server %s to be ready...", machine_id)
         start_time = time.time()
+        delay = initial_delay
 
         while time.time() - start_time < timeout:
             server = self.get_server(machine_id)
@@ -235,24 +263,41 @@ class SporeStackClient:
             has_ipv4 = ipv4 and ipv4 != "0.0.0.0"
             has_ipv6 = ipv6 and ipv6 not in ("", "::")
             if has_ipv4 or has_ipv6:
-                logger.info(f"Server ready: {ipv4 or ipv6}")
+                logger.info("Server ready: %s", ipv4 or ipv6)
                 return server
 
-            logger.debug(f"Server not ready yet, waiting {poll_interval}s...")
-            time.sleep(poll_interval)
+            remaining = timeout - (time.time() - start_time)
+            sleep_for = min(delay + random.uniform(0, delay * 0.1), max(remaining, 0))
+            logger.debug("Server not ready yet, waiting %.1fs...", sleep_for)
+            time.sleep(sleep_for)
+            delay = min(delay * multiplier, max_delay)
 
         raise ServerNotReadyError(
             f"Server {machine_id} not ready after {timeout}s"
         )
 
+    def _get_slugs(self, endpoint: str) -> List[Dict[str, Any]]:
+        """GET a slug listing, served from the process-wide cache while younger than SLUG_CACHE_TTL."""
+        cached = SporeStackClient._slug_cache.get(endpoint)
+        if cached is not None and time.monotonic() - cached[0] < self.SLUG_CACHE_TTL:
+            return cached[1]
+        slugs = self._request("GET", endpoint)
+        SporeStackClient._slug_cache[endpoint] = (time.monotonic(), slugs)
+        return slugs
+
+    @classmethod
+    def invalidate_slugs(cls) -> None:
+        """Drop cached flavor/OS/region listings so the next call refetches them."""
+        cls._slug_cache.clear()
+
     def get_flavors(self) -> List[Dict[str, Any]]:
-        return self._request("GET", "/slugs/flavors")
+        return self._get_slugs("/slugs/flavors")
 
     def get_operating_systems(self) -> List[Dict[str, Any]]:
-        return self._request("GET", "/slugs/os")
+        return self._get_slugs("/slugs/os")
 
     def get_regions(self) -> List[Dict[str, Any]]:
-        return self._request("GET", "/slugs/regions")
+        return self._get_slugs("/slugs/regions")
 
     def get_quote(
         self,
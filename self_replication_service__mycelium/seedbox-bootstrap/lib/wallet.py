@@ -1,13 +1,22 @@
-"""Bitcoin wallet management for autonomous VPS provisioning."""
+"""Bitcoin wallet management for autonomous VPS provisioning.
+
+bitcoinlib is imported inside the methods that need it: loading it pulls in
+SQLAlchemy and the whole service layer, which short-lived scripts that only
+touch argparse or constants shouldn't pay for.
+"""
+
+from __future__ import annotations
 
 import logging
+from decimal import ROUND_DOWN, Decimal, InvalidOperation
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import parse_qs, urlparse
 
 import os
 
-from bitcoinlib.mnemonic import Mnemonic
-from bitcoinlib.wallets import Wallet, wallet_exists, wallet_delete
+if TYPE_CHECKING:
+    from bitcoinlib.wallets import Wallet
 
 # Sim-only: bitcoinlib's electrumx _parse_transaction KeyErrors on mempool txs.
 # Production uses HTTP providers and never hits this path.
@@ -21,6 +30,8 @@ if os.getenv("MYCELIUM_SIM_MODE", "").strip().lower() in ("1", "true", "yes"):
 
 logger = logging.getLogger(__name__)
 
+SATOSHIS_PER_BTC = 100_000_000
+
 
 class WalletError(Exception):
     """Base exception for wallet operations."""
@@ -31,10 +42,32 @@ class InsufficientFundsError(WalletError):
     pass
 
 
+def parse_bitcoin_uri(payment_uri: str) -> tuple[str, int] | None:
+    """Parse a BIP-21 bitcoin: URI and return (address, amount_sat) or None if invalid."""
+    uri = urlparse(payment_uri)
+    if uri.scheme != "bitcoin" or not uri.path:
+        return None
+
+    amount = parse_qs(uri.query).get("amount", [None])[0]
+    if amount is None:
+        return None
+
+    # Decimal avoids float imprecision: int(float("0.0006") * 1e8) truncates to 59999.
+    try:
+        amount_sat = int((Decimal(amount) * SATOSHIS_PER_BTC).to_integral_value(ROUND_DOWN))
+    except (InvalidOperation, ValueError, OverflowError):  # garbage, NaN, Infinity
+        return None
+    if amount_sat <= 0:
+        return None
+
+    return uri.path, amount_sat
+
+
 class BitcoinWallet:
     """Full Bitcoin wallet with spending capability."""
 
     DEFAULT_WALLET_DIR = Path.home() / ".mycelium" / "wallets"
+    _dir_ready: bool = False  # DEFAULT_WALLET_DIR created by this process
 
     def __init__(
         self,
@@ -47,7 +80,18 @@ class BitcoinWallet:
         self.db_uri = db_uri
         self._wallet: Optional[Wallet] = None
 
-        self.DEFAULT_WALLET_DIR.mkdir(parents=True, exist_ok=True)
+        # Derived from wallet state; reset whenever the underlying wallet changes
+        self._cached_address: Optional[str] = None
+        self._cached_xpub: Optional[str] = None
+        self._balance_cache: Optional[int] = None
+        # Spendable outputs as of the last scan(); None until a scan has run
+        self._utxo_cache: Optional[list[dict]] = None
+        # bitcoinlib Service reused for every broadcast from this wallet
+        self._service = None
+
+        if not BitcoinWallet._dir_ready:
+            self.DEFAULT_WALLET_DIR.mkdir(parents=True, exist_ok=True)
+            BitcoinWallet._dir_ready = True
 
     @property
     def wallet(self) -> Wallet:
@@ -55,21 +99,33 @@ class BitcoinWallet:
             raise WalletError("Wallet not loaded. Call create_new() or load() first.")
         return self._wallet
 
+    def _invalidate_cache(self) -> None:
+        self._cached_address = None
+        self._cached_xpub = None
+        self._balance_cache = None
+        self._utxo_cache = None
+
     def exists(self) -> bool:
+        from bitcoinlib.wallets import wallet_exists
+
         return wallet_exists(self.wallet_name, db_uri=self.db_uri)
 
     def create_new(self) -> str:
         """Create a new HD wallet. Returns the mnemonic phrase."""
+        from bitcoinlib.mnemonic import Mnemonic
+        from bitcoinlib.wallets import Wallet
+
         if self.exists():
             raise WalletError(
                 f"Wallet '{self.wallet_name}' already exists. "
                 "Use load() to open it or delete it first."
             )
 
-        logger.info(f"Creating new wallet: {self.wallet_name}")
+        logger.info("Creating new wallet: %s", self.wallet_name)
 
         mnemonic = Mnemonic().generate()
 
+        self._invalidate_cache()
         self._wallet = Wallet.create(
             self.wallet_name,
             keys=mnemonic,
@@ -86,23 +142,29 @@ class BitcoinWallet:
         return mnemonic
 
     def load(self) -> None:
+        from bitcoinlib.wallets import Wallet
+
         if not self.exists():
             raise WalletError(
                 f"Wallet '{self.wallet_name}' does not exist. "
                 "Use create_new() to create it."
             )
 
-        logger.info(f"Loading wallet: {self.wallet_name}")
+        logger.info("Loading wallet: %s", self.wallet_name)
+        self._invalidate_cache()
         self._wallet = Wallet(self.wallet_name, db_uri=self.db_uri)
 
     def restore_from_mnemonic(self, mnemonic: str) -> None:
+        from bitcoinlib.wallets import Wallet
+
         if self.exists():
             raise WalletError(
                 f"Wallet '{self.wallet_name}' already exists. "
                 "Delete it first with delete() method, then restore."
             )
 
-        logger.info(f"Restoring wallet from mnemonic: {self.wallet_name}")
+        logger.info("Restoring wallet from mnemonic: %s", self.wallet_name)
+        self._invalidate_cache()
         self._wallet = Wallet.create(
             self.wallet_name,
             keys=mnemonic,
@@ -115,39 +177,60 @@ class BitcoinWallet:
 
     def delete(self) -> None:
         """Delete the wallet. Ensure mnemonic is backed up first."""
+        from bitcoinlib.wallets import wallet_delete
+
         if self.exists():
-            logger.warning(f"Deleting wallet: {self.wallet_name}")
+            logger.warning("Deleting wallet: %s", self.wallet_name)
             wallet_delete(self.wallet_name, db_uri=self.db_uri, force=True)
             self._wallet = None
+            self._invalidate_cache()
 
     def scan(self) -> None:
         """Scan blockchain for transactions and update wallet state."""
         logger.info("Scanning blockchain for transactions...")
         self.wallet.scan()
         self.wallet.utxos_update()
-        logger.info(f"Scan complete. Balance: {self.get_balance_btc()} BTC")
+        # Scanning can mark the current receiving key as used
+        self._cached_address = None
+        self._balance_cache = self.wallet.balance()
+        self._utxo_cache = self.wallet.utxos()
+        logger.info("Scan complete. Balance: %s BTC", self.get_balance_btc())
 
     def get_balance_satoshis(self) -> int:
-        return self.wallet.balance()
+        if self._balance_cache is None:
+            self._balance_cache = self.wallet.balance()
+        return self._balance_cache
 
     def get_balance_btc(self) -> float:
         return self.get_balance_satoshis() / 100_000_000
 
     def get_receiving_address(self) -> str:
-        key = self.wallet.get_key()
-        return key.address
+        if self._cached_address is None:
+            self._cached_address = self.wallet.get_key().address
+        return self._cached_address
 
     def get_xpub(self) -> str:
         """Get the extended public key (xpub) for watch-only wallets."""
         from bitcoinlib.keys import HDKey
 
+        if self._cached_xpub is not None:
+            return self._cached_xpub
+
         main_key = self.wallet.main_key
         if main_key.wif:
             hdkey = HDKey(main_key.wif, network=self.network)
-            return hdkey.wif_public()
+            self._cached_xpub = hdkey.wif_public()
+            return self._cached_xpub
 
         raise WalletError("Could not extract extended public key from wallet")
 
+    def _get_service(self):
+        from bitcoinlib.services.services import Service
+
+        if self._service is None:
+            self._service = Service(network=self.network)
+        return self._service
+
     def send(
         self,
         address: str,
@@ -155,9 +238,16 @@ class BitcoinWallet:
         fee: Optional[int] = None
     ) -> str:
         """Send Bitcoin to an address. Returns txid."""
-        from bitcoinlib.services.services import Service
-
-        balance = self.get_balance_satoshis()
+        from bitcoinlib.services.services import ServiceError
+        from bitcoinlib.transactions import TransactionError
+        from bitcoinlib.wallets import WalletError as BitcoinlibWalletError
+
+        # Fail fast on the UTXO set from the last scan before asking bitcoinlib
+        # to reload outputs and run coin selection
+        if self._utxo_cache is not None:
+            balance = sum(utxo['value'] for utxo in self._utxo_cache)
+        else:
+            balance = self.get_balance_satoshis()
         if balance < amount_satoshis:
             raise InsufficientFundsError(
                 f"Insufficient funds. Balance: {balance} sat, "
@@ -165,48 +255,41 @@ class BitcoinWallet:
             )
 
         logger.info(
-            f"Sending {amount_satoshis} satoshis "
-            f"({amount_satoshis / 100_000_000:.8f} BTC) to {address}"
+            "Sending %d satoshis (%.8f BTC) to %s",
+            amount_satoshis, amount_satoshis / 100_000_000, address
         )
 
         try:
             tx = self.wallet.send_to(address, amount_satoshis, fee=fee, broadcast=False)
+        except (BitcoinlibWalletError, TransactionError) as e:
+            raise WalletError(f"Transaction failed: {e}")
 
-            if not tx.verified:
-                raise WalletError(f"Transaction verification failed: {tx.error}")
+        if not tx.verified:
+            raise WalletError(f"Transaction verification failed: {tx.error}")
 
-            srv = Service(network=self.network)
-            result = srv.sendrawtransaction(tx.raw_hex())
+        try:
+            result = self._get_service().sendrawtransaction(tx.raw_hex())
+        except ServiceError as e:
+            raise WalletError(f"Transaction failed: {e}")
 
-            if result and result.get('txid'):
-                logger.info(f"Transaction sent successfully: {tx.txid}")
-                return tx.txid
-            else:
-                raise WalletError(f"Broadcast failed: {result}")
+        if not (result and result.get('txid')):
+            raise WalletError(f"Broadcast failed: {result}")
 
-        except WalletError:
-            raise
-        except Exception as e:
-            raise WalletError(f"Transaction failed: {e}")
+        logger.info("Transaction sent successfully: %s", tx.txid)
+        if self._balance_cache is not None:
+            self._balance_cache -= amount_satoshis + (tx.fee or 0)
+        # Spent inputs are gone; wait for the next scan to rebuild the set
+        self._utxo_cache = None
+        return tx.txid
 
     def pay_sporestack_invoice(self, invoice: dict) -> str:
         """Pay a SporeStack invoice. Returns txid."""
         if 'payment_uri' in invoice:
             uri = invoice['payment_uri']
-            if uri.startswith('bitcoin:'):
-                parts = uri[8:].split('?')
-                address = parts[0]
-                amount_btc = None
-                if len(parts) > 1:
-                    params = dict(p.split('=') for p in parts[1].split('&'))
-                    amount_btc = float(params.get('amount', 0))
-
-                if amount_btc:
-                    amount_satoshis = int(amount_btc * 100_000_000)
-                else:
-                    raise WalletError("Invoice missing amount")
-            else:
-                raise WalletError(f"Unsupported payment URI format: {uri}")
+            parsed = parse_bitcoin_uri(uri)
+            if parsed is None:
+                raise WalletError(f"Invalid payment URI: {uri}")
+            address, amount_satoshis = parsed
         else:
             address = invoice.get('address')
             amount_satoshis = invoice.get('amount_satoshis') or invoice.get('amount')
@@ -214,7 +297,7 @@ class BitcoinWallet:
             if not address or not amount_satoshis:
                 raise WalletError("Invoice must contain 'address' and 'amount'")
 
-        logger.info(f"Paying SporeStack invoice: {amount_satoshis} sat to {address}")
+        logger.info("Paying SporeStack invoice: %s sat to %s", amount_satoshis, address)
         return self.send(address, amount_satoshis)
 
     def info(self) -> dict:
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+from uuid import uuid4
+
+import pytest
+
+from ipv8.messaging.payload_dataclass import DataClassPayloadWID
+from ipv8.messaging.serialization import default_serializer
+
+from democracy.funding.models import FundingCampaign, FundingPledge
+from democracy.models.issue import Issue
+from democracy.models.issue_vote import IssueVote
+from democracy.models.solution import Solution
+from democracy.models.solution_vote import SolutionVote
+from democracy.network.messages.base_message import BaseMessage, compile_message_schema
+from democracy.network.messages.funding_campaign_message import FundingCampaignMessage
+from democracy.network.messages.funding_pledge_message import FundingPledgeMessage
+from democracy.network.messages.issue_message import IssueMessage
+from democracy.network.messages.issue_vote_message import IssueVoteMessage
+from democracy.network.messages.solution_message import SolutionMessage
+from democracy.network.messages.solution_vote_message import SolutionVoteMessage
+from democracy.network.replication import build_replication_handlers
+from democracy.storage.sqlite_repository import SQLiteDemocracyRepository
+
+MESSAGE_MODELS: list[tuple[type[BaseMessage[Any]], Callable[[], Any]]] = [
+    (
+        IssueMessage,
+        lambda: Issue(title="Issue title", description="Issue text", creator_id=uuid4()),
+    ),
+    (IssueVoteMessage, lambda: IssueVote(voter_id=uuid4(), issue_id=uuid4())),
+    (
+        SolutionMessage,
+        lambda: Solution(
+            title="Solution title",
+            description="Solution text",
+            creator_id=uuid4(),
+            issue_id=uuid4(),
+        ),
+    ),
+    (SolutionVoteMessage, lambda: SolutionVote(voter_id=uuid4(), solution_id=uuid4())),
+    (
+        FundingCampaignMessage,
+        lambda: FundingCampaign(
+            solution_id=uuid4(),
+            solution_hash="ab" * 32,
+            developer_payout_address="bcrt1qexampleaddress",
+            asking_price_sats=100,
+            deadline_height=200,
+        ),
+    ),
+    (
+        FundingPledgeMessage,
+        lambda: FundingPledge(
+            campaign_id=uuid4(),
+            pledger_id=uuid4(),
+            txid="cd" * 32,
+            vout=0,
+            value_sats=50,
+            signed_pledge_psbt="cHNidP8BAAoCAAAAAQ==",
+        ),
+    ),
+]
+
+
+def _ipv8_message(message: BaseMessage[Any]) -> BaseMessage[Any]:
+    """Rebuild a message through ipv8's own DataClassPayload ``__new__``."""
+    fields = {name: getattr(message, name) for name in type(message).names}
+    rebuilt = DataClassPayloadWID.__new__(type(message), **fields)
+    rebuilt.__init__(**fields)
+    return rebuilt
+
+
+# =========================================================
+# compile_message_schema()
+# =========================================================
+def test_compile_message_schema_sets_ipv8_schema() -> None:
+    compile_message_schema(SolutionVoteMessage)
+
+    assert SolutionVoteMessage.msg_id == 4
+    assert SolutionVoteMessage.names == ["voter_id", "solution_id", "id", "created_at"]
+    assert len(SolutionVoteMessage.format_list) == len(SolutionVoteMessage.names)
+
+
+def test_compiled_message_round_trips_model() -> None:
+    compile_message_schema(SolutionVoteMessage)
+    vote = SolutionVote(voter_id=uuid4(), solution_id=uuid4())
+
+    packed = default_serializer.pack_serializable(SolutionVoteMessage.from_model(vote))
+    decoded, _ = default_serializer.unpack_serializable(SolutionVoteMessage, packed)
+
+    assert decoded.to_model() == vote
+
+
+def test_round_trip_cases_cover_every_replicated_message(tmp_path) -> None:
+    repository = SQLiteDemocracyRepository(tmp_path / "democracy.db")
+    try:
+        handlers = build_replication_handlers(repository)
+    finally:
+        repository.close()
+
+    handled = {handler.message_cls for handler in handlers}
+    assert handled == {message_cls for message_cls, _ in MESSAGE_MODELS}
+
+
+@pytest.mark.parametrize(
+    ("message_cls", "make_model"),
+    MESSAGE_MODELS,
+    ids=[message_cls.__name__ for message_cls, _ in MESSAGE_MODELS],
+)
+def test_compiled_message_matches_ipv8_new(
+    message_cls: type[BaseMessage[Any]], make_model: Callable[[], Any]
+) -> None:
+    compile_message_schema(message_cls)
+    model = make_model()
+    names, format_list = list(message_cls.names), list(message_cls.format_list)
+
+    compiled = message_cls.from_model(model)
+    reference = _ipv8_message(compiled)
+    packed = default_serializer.pack_serializable(compiled)
+    decoded, _ = default_serializer.unpack_serializable(message_cls, packed)
+
+    assert (message_cls.names, message_cls.format_list) == (names, format_list)
+    assert default_serializer.pack_serializable(reference) == packed
+    assert decoded == reference
+    assert decoded.to_model() == model
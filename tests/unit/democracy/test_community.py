@@ -1,7 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Coroutine, Iterator
 from uuid import uuid4
 
+import pytest
+
+from ipv8.community import CommunitySettings
+from ipv8.keyvault.crypto import default_eccrypto
+from ipv8.messaging.payload_headers import BinMemberAuthenticationPayload
+from ipv8.peer import Peer
+from ipv8.peerdiscovery.network import Network
+from ipv8.test.mocking.endpoint import AutoMockEndpoint
+
+from democracy.constants import FULL_INVENTORY_ANNOUNCE_ROUNDS
 from democracy.models.issue import Issue
 from democracy.network.community import DemocracyCommunity
 from democracy.network.messages.gossip_messages import (
@@ -10,7 +26,107 @@ from democracy.network.messages.gossip_messages import (
     IWantMessage,
 )
 from democracy.network.messages.issue_message import IssueMessage
+from democracy.network.messages.object_batch_message import (
+    MAX_PACKET_BYTES,
+    ObjectBatchMessage,
+    ObjectBatchSupportMessage,
+    batch_object_entries,
+    encode_object_entry,
+)
 from democracy.network.object_type import ObjectType
+from democracy.storage.sqlite_repository import SQLiteDemocracyRepository
+
+
+def _make_community(tmp_path: Path, name: str = "node") -> DemocracyCommunity:
+    settings = CommunitySettings(
+        my_peer=Peer(default_eccrypto.generate_key("curve25519")),
+        endpoint=AutoMockEndpoint(),
+        network=Network(),
+    )
+    settings.repository = SQLiteDemocracyRepository(tmp_path / f"{name}.db")
+    settings.data_changed = lambda: None
+    settings.communication_interval = 5.0
+    return DemocracyCommunity(settings)
+
+
+def _capture_sent(community: DemocracyCommunity) -> list[tuple[object, bytes]]:
+    sent: list[tuple[object, bytes]] = []
+    community.endpoint.send = lambda address, packet: sent.append((address, packet))
+    return sent
+
+
+def _deliver(
+    community: DemocracyCommunity,
+    source: DemocracyCommunity,
+    packet: bytes,
+) -> None:
+    # Call the registered handler directly, so exceptions are not swallowed by on_packet.
+    community.decode_map[packet[22]](source.my_peer.address, packet)
+
+
+def _make_issue(title: str = "Issue title") -> Issue:
+    return Issue(title=title, description="Issue description", creator_id=uuid4())
+
+
+def _issue_item(issue: Issue) -> GossipItem:
+    return GossipItem(object_type=ObjectType.ISSUE, object_uuid=issue.id)
+
+
+def _issue_entry(community: DemocracyCommunity, message: IssueMessage) -> bytes:
+    return encode_object_entry(
+        ObjectType.ISSUE,
+        community.serializer.pack_serializable(message),
+    )
+
+
+def _batch_packet(sender: DemocracyCommunity, entries: list[bytes]) -> bytes:
+    payload = ObjectBatchMessage(entries)
+    return sender.ezr_pack(payload.msg_id, payload)
+
+
+def _pack(sender: DemocracyCommunity, payload: object) -> bytes:
+    return sender.ezr_pack(payload.msg_id, payload)
+
+
+def _add_peer(community: DemocracyCommunity, port: int) -> Peer:
+    peer = Peer(default_eccrypto.generate_key("curve25519"), ("10.0.0.1", port))
+    community.network.add_verified_peer(peer)
+    community.network.discover_services(peer, [community.community_id])
+    return peer
+
+
+def _announced_items(
+    community: DemocracyCommunity,
+    sent: list[tuple[object, bytes]],
+) -> dict[object, set[GossipItem]]:
+    announced: dict[object, set[GossipItem]] = {}
+    for address, packet in sent:
+        assert packet[22] == IHaveMessage.msg_id
+        _, offset = community.serializer.unpack_serializable(
+            BinMemberAuthenticationPayload, packet, offset=23
+        )
+        payload, _ = community.serializer.unpack_serializable(
+            IHaveMessage, packet, offset=offset
+        )
+        announced.setdefault(address, set()).update(payload.decode_items())
+    return announced
+
+
+def _run(coroutine: Coroutine[Any, Any, None]) -> None:
+    # The community's task manager is bound to the default loop, which asyncio.run()
+    # would replace and close.
+    asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+def _announce_tick(community: DemocracyCommunity) -> None:
+    _run(community._announce_full_inventory())
+
+
+def _store_issues(community: DemocracyCommunity, count: int) -> list[Issue]:
+    issues = [_make_issue(f"Issue {index}") for index in range(count)]
+    for issue in issues:
+        community.repository.add_issue(issue)
+    return issues
 
 
 # =========================================================
@@ -62,3 +178,315 @@ def test_brief_falls_back_to_class_name_for_plain_objects() -> None:
         pass
 
     assert DemocracyCommunity._brief(PlainObject()) == "PlainObject"
+
+
+# =========================================================
+# on_object_batch_message()
+# =========================================================
+def test_object_batch_with_invalid_entry_stores_the_valid_entries(tmp_path) -> None:
+    sender = _make_community(tmp_path, "sender")
+    receiver = _make_community(tmp_path, "receiver")
+    valid = _make_issue("valid")
+    invalid = replace(IssueMessage.from_model(_make_issue("invalid")), id="not-a-uuid")
+    packet = _batch_packet(
+        sender,
+        [
+            _issue_entry(sender, IssueMessage.from_model(valid)),
+            _issue_entry(sender, invalid),
+        ],
+    )
+
+    _deliver(receiver, sender, packet)
+
+    assert receiver.repository.get_all_issues() == [valid]
+    assert receiver._known_items == {_issue_item(valid)}
+
+
+def test_object_batch_marks_items_known_only_after_commit(tmp_path, monkeypatch) -> None:
+    sender = _make_community(tmp_path, "sender")
+    receiver = _make_community(tmp_path, "receiver")
+    issue = _make_issue()
+    packet = _batch_packet(sender, [_issue_entry(sender, IssueMessage.from_model(issue))])
+
+    @contextmanager
+    def failing_transaction() -> Iterator[None]:
+        yield
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(receiver.repository, "transaction", failing_transaction)
+
+    with pytest.raises(RuntimeError):
+        _deliver(receiver, sender, packet)
+
+    assert receiver._known_items == set()
+
+
+# =========================================================
+# _send_objects()
+# =========================================================
+def test_iwant_from_batch_capable_peer_is_answered_with_full_batches(tmp_path) -> None:
+    requester = _make_community(tmp_path, "requester")
+    responder = _make_community(tmp_path, "responder")
+    issues = _store_issues(responder, 40)
+    sent = _capture_sent(responder)
+
+    _deliver(responder, requester, _pack(requester, ObjectBatchSupportMessage()))
+    _deliver(
+        responder,
+        requester,
+        _pack(requester, IWantMessage.from_items(map(_issue_item, issues))),
+    )
+
+    entries = [
+        _issue_entry(responder, IssueMessage.from_model(issue)) for issue in issues
+    ]
+    expected_batches = list(
+        batch_object_entries(entries, responder._max_object_batch_bytes)
+    )
+    packets = [packet for _, packet in sent]
+    assert 1 < len(packets) == len(expected_batches) < len(issues)
+    assert all(packet[22] == ObjectBatchMessage.msg_id for packet in packets)
+    assert all(len(packet) <= MAX_PACKET_BYTES for packet in packets)
+
+    for packet in packets:
+        _deliver(requester, responder, packet)
+
+    assert {issue.id for issue in requester.repository.get_all_issues()} == {
+        issue.id for issue in issues
+    }
+    assert requester._known_items == set(map(_issue_item, issues))
+
+
+def test_iwant_from_peer_without_batch_support_is_answered_per_object(tmp_path) -> None:
+    requester = _make_community(tmp_path, "requester")
+    responder = _make_community(tmp_path, "responder")
+    issues = _store_issues(responder, 3)
+    sent = _capture_sent(responder)
+
+    _deliver(
+        responder,
+        requester,
+        _pack(requester, IWantMessage.from_items(map(_issue_item, issues))),
+    )
+
+    assert [packet[22] for _, packet in sent] == [IssueMessage.msg_id] * 3
+
+
+def test_oversized_object_is_sent_as_plain_object_message(tmp_path) -> None:
+    requester = _make_community(tmp_path, "requester")
+    responder = _make_community(tmp_path, "responder")
+    issue = Issue(title="Large", description="x" * 2000, creator_id=uuid4())
+    responder.repository.add_issue(issue)
+    sent = _capture_sent(responder)
+
+    _deliver(responder, requester, _pack(requester, ObjectBatchSupportMessage()))
+    _deliver(
+        responder,
+        requester,
+        _pack(requester, IWantMessage.from_items([_issue_item(issue)])),
+    )
+
+    assert [packet[22] for _, packet in sent] == [IssueMessage.msg_id]
+
+
+def test_ihave_announces_batch_support_before_iwant(tmp_path) -> None:
+    requester = _make_community(tmp_path, "requester")
+    responder = _make_community(tmp_path, "responder")
+    issues = _store_issues(responder, 2)
+    sent = _capture_sent(requester)
+
+    _deliver(
+        requester,
+        responder,
+        _pack(responder, IHaveMessage.from_items(map(_issue_item, issues))),
+    )
+
+    assert [packet[22] for _, packet in sent] == [
+        ObjectBatchSupportMessage.msg_id,
+        IWantMessage.msg_id,
+    ]
+
+
+# =========================================================
+# _announce_full_inventory()
+# =========================================================
+def test_first_announce_round_sends_full_inventory_to_every_peer(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    peers = [_add_peer(community, port) for port in (1, 2)]
+    issues = _store_issues(community, 3)
+    sent = _capture_sent(community)
+
+    _announce_tick(community)
+
+    assert _announced_items(community, sent) == {
+        peer.address: set(map(_issue_item, issues)) for peer in peers
+    }
+
+
+def test_announce_rounds_between_full_rounds_send_only_new_items(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    peer = _add_peer(community, 1)
+    _store_issues(community, 3)
+    _announce_tick(community)
+    sent = _capture_sent(community)
+
+    _announce_tick(community)
+    assert sent == []
+
+    new_issue = _store_issues(community, 1)[0]
+    _announce_tick(community)
+
+    assert _announced_items(community, sent) == {peer.address: {_issue_item(new_issue)}}
+
+
+def test_new_peer_gets_full_inventory_between_full_rounds(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    _add_peer(community, 1)
+    issues = _store_issues(community, 3)
+    _announce_tick(community)
+    sent = _capture_sent(community)
+
+    new_peer = _add_peer(community, 2)
+    _announce_tick(community)
+
+    assert _announced_items(community, sent) == {
+        new_peer.address: set(map(_issue_item, issues))
+    }
+
+
+def test_full_inventory_is_reannounced_every_full_round(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    peer = _add_peer(community, 1)
+    issues = _store_issues(community, 3)
+    _announce_tick(community)
+    sent = _capture_sent(community)
+
+    for _ in range(FULL_INVENTORY_ANNOUNCE_ROUNDS - 1):
+        _announce_tick(community)
+    assert sent == []
+
+    _announce_tick(community)
+
+    assert _announced_items(community, sent) == {
+        peer.address: set(map(_issue_item, issues))
+    }
+
+
+def test_announce_round_forgets_peers_that_left(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    staying = _add_peer(community, 1)
+    leaving = _add_peer(community, 2)
+    _store_issues(community, 1)
+    _announce_tick(community)
+    assert set(community._announced_to) == {staying, leaving}
+
+    community.network.remove_peer(leaving)
+    _announce_tick(community)
+
+    assert set(community._announced_to) == {staying}
+
+
+# =========================================================
+# _known_items
+# =========================================================
+def test_known_item_skips_repository_lookup(tmp_path, monkeypatch) -> None:
+    community = _make_community(tmp_path)
+    item = _issue_item(_make_issue())
+    community._known_items.add(item)
+    handler = community._handlers_by_type[ObjectType.ISSUE]
+
+    def fail(*args: object) -> None:
+        raise AssertionError("repository queried for a known item")
+
+    monkeypatch.setattr(handler, "get_stored_model", fail)
+
+    assert community._has_object(item)
+
+
+def test_known_item_is_not_stored_again(tmp_path, monkeypatch) -> None:
+    community = _make_community(tmp_path)
+    issue = _make_issue()
+    community._known_items.add(_issue_item(issue))
+    handler = community._handlers_by_type[ObjectType.ISSUE]
+
+    def fail(*args: object) -> None:
+        raise AssertionError("repository written for a known item")
+
+    monkeypatch.setattr(handler, "store_remote", fail)
+
+    message = IssueMessage.from_model(issue)
+
+    assert community._store_object(message, ObjectType.ISSUE) is None
+
+
+def test_repository_hit_is_remembered_as_known(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    issue = _store_issues(community, 1)[0]
+
+    assert community._has_object(_issue_item(issue))
+    assert _issue_item(issue) in community._known_items
+
+
+def test_inventory_rebuild_drops_items_not_in_repository(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    stored = _store_issues(community, 2)
+    stale = _issue_item(_make_issue("stale"))
+    community._known_items.add(stale)
+
+    inventory = community._get_local_inventory()
+
+    assert set(inventory) == set(map(_issue_item, stored))
+    assert community._known_items == set(map(_issue_item, stored))
+    assert not community._has_object(stale)
+
+
+# =========================================================
+# _peers_cache
+# =========================================================
+def test_peers_cache_is_dropped_when_peer_added_and_rebuilt_on_multicast(
+    tmp_path,
+) -> None:
+    community = _make_community(tmp_path)
+    assert community._connected_peers() == []
+    sent = _capture_sent(community)
+
+    peer = _add_peer(community, 1)
+    assert community._peers_cache is None
+
+    community._multicast(IHaveMessage.from_items([_issue_item(_make_issue())]))
+
+    assert community._peers_cache == [peer]
+    assert [address for address, _ in sent] == [peer.address]
+
+
+def test_peers_cache_is_dropped_when_peer_removed(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    peer = _add_peer(community, 1)
+    assert community._connected_peers() == [peer]
+
+    community.network.remove_peer(peer)
+
+    assert community._peers_cache is None
+    assert community._connected_peers() == []
+
+
+def test_announce_tick_refreshes_peers_whose_services_arrived_late(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    peer = _add_peer(community, 1)
+    # Cached before the peer's services were known; ipv8 sends no notification when
+    # they arrive, so the cache stays stale until the next tick.
+    community._peers_cache = []
+    assert community._connected_peers() == []
+
+    _announce_tick(community)
+
+    assert community._connected_peers() == [peer]
+
+
+def test_unload_removes_peer_observer(tmp_path) -> None:
+    community = _make_community(tmp_path)
+    assert community in community.network.peer_observers
+
+    _run(community.unload())
+
+    assert community not in community.network.peer_observers
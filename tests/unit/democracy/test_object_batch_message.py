@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import pytest
+
+from ipv8.community import Community, CommunitySettings
+from ipv8.keyvault.crypto import default_eccrypto
+from ipv8.messaging.serialization import default_serializer
+from ipv8.peer import Peer
+from ipv8.peerdiscovery.network import Network
+from ipv8.test.mocking.endpoint import AutoMockEndpoint
+
+from democracy.network.messages import object_batch_message
+from democracy.network.messages.object_batch_message import (
+    ObjectBatchMessage,
+    ObjectBatchSupportMessage,
+    batch_object_entries,
+    decode_object_entry,
+    encode_object_entry,
+    max_object_batch_bytes,
+    object_entry_fits_batch,
+)
+from democracy.network.object_type import ObjectType
+
+
+class _PackingCommunity(Community):
+    community_id = b"\x01" * 20
+
+
+# =========================================================
+# max_object_batch_bytes()
+# =========================================================
+def test_max_object_batch_bytes_subtracts_key_and_signature() -> None:
+    assert max_object_batch_bytes(74, 64) - max_object_batch_bytes(100, 64) == 26
+    assert max_object_batch_bytes(74, 64) - max_object_batch_bytes(74, 128) == 64
+
+
+def test_full_batch_fits_in_one_signed_packet() -> None:
+    key = default_eccrypto.generate_key("curve25519")
+    community = _PackingCommunity(
+        CommunitySettings(
+            my_peer=Peer(key),
+            endpoint=AutoMockEndpoint(),
+            network=Network(),
+        )
+    )
+    max_batch_bytes = max_object_batch_bytes(
+        len(key.pub().key_to_bin()),
+        key.get_signature_length(),
+    )
+    # 1 list byte + 2 length bytes + entry bytes fills the budget exactly.
+    entry = bytes((int(ObjectType.ISSUE),)) + b"x" * (max_batch_bytes - 4)
+
+    payload = ObjectBatchMessage([entry])
+    packet = community.ezr_pack(payload.msg_id, payload)
+
+    assert max_batch_bytes == object_batch_message.MAX_OBJECT_BATCH_BYTES
+    assert len(packet) == object_batch_message.MAX_PACKET_BYTES
+
+
+# =========================================================
+# encode_object_entry() / decode_object_entry()
+# =========================================================
+def test_object_entry_round_trips_type_and_message() -> None:
+    entry = encode_object_entry(ObjectType.SOLUTION_VOTE, b"packed")
+
+    assert entry == bytes((int(ObjectType.SOLUTION_VOTE),)) + b"packed"
+    assert decode_object_entry(entry) == (ObjectType.SOLUTION_VOTE, b"packed")
+
+
+def test_decode_object_entry_rejects_empty_entry() -> None:
+    with pytest.raises(ValueError, match="empty"):
+        decode_object_entry(b"")
+
+
+def test_decode_object_entry_rejects_unknown_object_type() -> None:
+    with pytest.raises(ValueError):
+        decode_object_entry(bytes((7,)) + b"packed")
+
+
+# =========================================================
+# object_entry_fits_batch()
+# =========================================================
+def test_object_entry_fits_batch_counts_list_and_entry_headers() -> None:
+    assert object_entry_fits_batch(b"a" * 7, max_batch_bytes=10)
+    assert not object_entry_fits_batch(b"a" * 8, max_batch_bytes=10)
+
+
+# =========================================================
+# batch_object_entries()
+# =========================================================
+def test_batch_object_entries_returns_no_batches_for_empty_entries() -> None:
+    assert list(batch_object_entries([])) == []
+
+
+def test_batch_object_entries_splits_on_size_limit(monkeypatch) -> None:
+    monkeypatch.setattr(object_batch_message, "MAX_OBJECT_BATCH_BYTES", 25)
+    entries = [b"a" * 10, b"b" * 10, b"c" * 10]
+
+    # 1 list byte + 2 * (2 length bytes + 10 entry bytes) = 25 bytes fits two entries.
+    assert list(batch_object_entries(entries)) == [entries[:2], entries[2:]]
+
+
+def test_batch_object_entries_splits_on_entry_count_limit(monkeypatch) -> None:
+    monkeypatch.setattr(object_batch_message, "MAX_OBJECT_BATCH_ENTRIES", 2)
+    entries = [b"a", b"b", b"c", b"d", b"e"]
+
+    assert list(batch_object_entries(entries)) == [
+        [b"a", b"b"],
+        [b"c", b"d"],
+        [b"e"],
+    ]
+
+
+def test_batch_object_entries_sends_oversized_entry_alone(monkeypatch) -> None:
+    monkeypatch.setattr(object_batch_message, "MAX_OBJECT_BATCH_BYTES", 20)
+    entries = [b"a", b"b" * 50, b"c"]
+
+    assert list(batch_object_entries(entries)) == [[b"a"], [b"b" * 50], [b"c"]]
+
+
+def test_batch_object_entries_uses_given_size_limit() -> None:
+    entries = [b"a" * 10, b"b" * 10, b"c" * 10]
+
+    assert list(batch_object_entries(entries, max_batch_bytes=25)) == [
+        entries[:2],
+        entries[2:],
+    ]
+
+
+def test_batched_message_fits_size_limit() -> None:
+    entries = [bytes((int(ObjectType.ISSUE),)) + b"x" * 100 for _ in range(40)]
+
+    for batch in batch_object_entries(entries):
+        packed = default_serializer.pack_serializable(ObjectBatchMessage(batch))
+        assert len(packed) <= object_batch_message.MAX_OBJECT_BATCH_BYTES
+
+
+# =========================================================
+# ObjectBatchMessage
+# =========================================================
+def test_object_batch_message_round_trips_entries() -> None:
+    entries = [
+        encode_object_entry(ObjectType.ISSUE, b"first"),
+        encode_object_entry(ObjectType.FUNDING_PLEDGE, b"second"),
+    ]
+
+    packed = default_serializer.pack_serializable(ObjectBatchMessage(entries))
+    decoded, _ = default_serializer.unpack_serializable(ObjectBatchMessage, packed)
+
+    assert decoded.entries == entries
+    assert decoded.brief() == "OBJECTS(2 entries)"
+
+
+# =========================================================
+# ObjectBatchSupportMessage
+# =========================================================
+def test_object_batch_support_message_round_trips() -> None:
+    packed = default_serializer.pack_serializable(ObjectBatchSupportMessage())
+    decoded, _ = default_serializer.unpack_serializable(
+        ObjectBatchSupportMessage, packed
+    )
+
+    assert packed == b""
+    assert decoded.brief() == "OBJECTS_SUPPORTED"
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Iterator
+from uuid import uuid4
+
+import pytest
+
+from democracy.models.issue import Issue
+from democracy.models.issue_vote import IssueVote
+from democracy.models.solution import Solution
+from democracy.models.solution_vote import SolutionVote
+from democracy.models.vote_record_result import VoteRecordResult
+from democracy.storage.sqlite_repository import SQLiteDemocracyRepository
+
+
+@pytest.fixture
+def repository(tmp_path) -> Iterator[SQLiteDemocracyRepository]:
+    repository = SQLiteDemocracyRepository(tmp_path / "democracy.db")
+    yield repository
+    repository.close()
+
+
+def _make_issue(description: str = "Issue description") -> Issue:
+    return Issue(title="Issue title", description=description, creator_id=uuid4())
+
+
+def _make_solution(issue: Issue) -> Solution:
+    return Solution(
+        title="Solution title",
+        description="Solution description",
+        creator_id=uuid4(),
+        issue_id=issue.id,
+    )
+
+
+def _content_object_count(repository: SQLiteDemocracyRepository) -> int:
+    return repository._connection.execute(
+        "SELECT COUNT(*) FROM content_objects;"
+    ).fetchone()[0]
+
+
+# =========================================================
+# record_issue_vote() / record_solution_vote()
+# =========================================================
+def test_repeat_issue_vote_returns_already_voted(repository) -> None:
+    issue = _make_issue()
+    repository.add_issue(issue)
+    voter_id = uuid4()
+
+    first = repository.record_issue_vote(IssueVote(voter_id=voter_id, issue_id=issue.id))
+    repeat = repository.record_issue_vote(IssueVote(voter_id=voter_id, issue_id=issue.id))
+
+    assert first is VoteRecordResult.CREATED
+    assert repeat is VoteRecordResult.ALREADY_VOTED
+    assert len(repository.get_all_issue_votes()) == 1
+
+
+def test_repeat_solution_vote_returns_already_voted(repository) -> None:
+    issue = _make_issue()
+    solution = _make_solution(issue)
+    repository.add_issue(issue)
+    repository.add_solution(solution)
+    voter_id = uuid4()
+
+    first = repository.record_solution_vote(
+        SolutionVote(voter_id=voter_id, solution_id=solution.id)
+    )
+    repeat = repository.record_solution_vote(
+        SolutionVote(voter_id=voter_id, solution_id=solution.id)
+    )
+
+    assert first is VoteRecordResult.CREATED
+    assert repeat is VoteRecordResult.ALREADY_VOTED
+    assert len(repository.get_all_solution_votes()) == 1
+
+
+def test_issue_vote_with_duplicate_id_raises_integrity_error(repository) -> None:
+    issue = _make_issue()
+    repository.add_issue(issue)
+    vote = IssueVote(voter_id=uuid4(), issue_id=issue.id)
+    repository.record_issue_vote(vote)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.record_issue_vote(
+            IssueVote(id=vote.id, voter_id=uuid4(), issue_id=issue.id)
+        )
+
+
+def test_issue_vote_for_missing_issue_raises_integrity_error(repository) -> None:
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.record_issue_vote(IssueVote(voter_id=uuid4(), issue_id=uuid4()))
+
+
+def test_solution_vote_for_missing_solution_raises_integrity_error(repository) -> None:
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.record_solution_vote(
+            SolutionVote(voter_id=uuid4(), solution_id=uuid4())
+        )
+
+
+# =========================================================
+# transaction()
+# =========================================================
+def test_failed_write_in_transaction_rolls_back_only_its_own_writes(repository) -> None:
+    first = _make_issue("First description")
+    second = _make_issue("Second description")
+
+    with repository.transaction():
+        repository.add_issue(first)
+        with pytest.raises(sqlite3.IntegrityError):
+            # Stores a new description before the duplicate issue row fails.
+            repository.add_issue(
+                Issue(
+                    id=first.id,
+                    title="Duplicate",
+                    description="Rolled back description",
+                    creator_id=uuid4(),
+                )
+            )
+        with pytest.raises(sqlite3.IntegrityError):
+            repository.record_issue_vote(IssueVote(voter_id=uuid4(), issue_id=uuid4()))
+        repository.add_issue(second)
+
+    assert {issue.id for issue in repository.get_all_issues()} == {first.id, second.id}
+    assert _content_object_count(repository) == 2
+
+
+def test_exception_leaving_transaction_rolls_back_all_writes(repository) -> None:
+    with pytest.raises(RuntimeError):
+        with repository.transaction():
+            repository.add_issue(_make_issue())
+            raise RuntimeError("abort")
+
+    assert repository.get_all_issues() == []
+    assert _content_object_count(repository) == 0
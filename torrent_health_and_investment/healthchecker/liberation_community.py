@@ -1,6 +1,5 @@
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Set
-from collections import defaultdict
+from typing import Callable, Optional, Set, Tuple
 from hashlib import sha1
 
 from ipv8.community import Community, CommunitySettings
@@ -8,6 +7,9 @@ from ipv8.lazy_community import lazy_wrapper
 from ipv8.messaging.payload_dataclass import DataClassPayload, convert_to_payload
 from ipv8.peer import Peer
 
+_COMMUNITY_ID = sha1(b"liberation_community").digest()
+
+
 @dataclass
 class LiberatedContentPayload(DataClassPayload[1]):
     url: str
@@ -39,21 +41,25 @@ class LiberationCommunitySettings(CommunitySettings):
     pass
 
 
+def _noop_content_callback(peer: Peer, payload: LiberatedContentPayload) -> None:
+    pass
+
+
 class LiberationCommunity(Community):
 
-    community_id = sha1(b"liberation_community").digest()
+    community_id = _COMMUNITY_ID
 
     def __init__(self, settings: LiberationCommunitySettings) -> None:
         super().__init__(settings)
 
-        # Track which peers we've gossiped each infohash to (avoid re-sending)
-        self.sent_to_peers: Dict[bytes, Set[str]] = defaultdict(set)
+        # (peer mid, infohash) pairs we've already gossiped (avoid re-sending)
+        self.sent_to_peers: Set[Tuple[bytes, bytes]] = set()
 
         # Register message handlers
         self.add_message_handler(LiberatedContentPayload, self.on_liberated_content)
         self.add_message_handler(SeedboxInfoPayload, self.on_seedbox_info)
 
-        self.on_content_received_callback: Optional[Callable[[Peer, LiberatedContentPayload], None]] = None
+        self.on_content_received_callback: Callable[[Peer, LiberatedContentPayload], None] = _noop_content_callback
         self.on_seedbox_info_callback: Optional[Callable[[Peer, SeedboxInfoPayload], None]] = None
 
         self.logger.info("LiberationCommunity initialized (peer mid: %s)",
@@ -64,27 +70,36 @@ class LiberationCommunity(Community):
 
     @lazy_wrapper(LiberatedContentPayload)
     def on_liberated_content(self, peer: Peer, payload: LiberatedContentPayload) -> None:
-        if self.on_content_received_callback:
-            try:
-                self.on_content_received_callback(peer, payload)
-            except Exception as e:
-                self.logger.error("Error in content received callback: %s", e)
+        try:
+            self.on_content_received_callback(peer, payload)
+        except Exception as e:
+            self.logger.error("Error in content received callback: %s", e)
 
         # Extract infohash for deduplication
         try:
             infohash = payload.magnet_link.split("btih:")[1].split("&")[0]
         except (IndexError, AttributeError):
             infohash = None
+        if infohash:
+            try:
+                infohash = bytes.fromhex(infohash)
+            except ValueError:  # base32-encoded infohash
+                infohash = infohash.encode()
 
         # Gossip to other peers (except the sender)
         other_peers = [p for p in self.get_peers() if p.mid != peer.mid]
+        packet = None
         for other_peer in other_peers:
-            if infohash and infohash in self.sent_to_peers[other_peer.mid]:
+            key = (other_peer.mid, infohash)
+            if infohash and key in self.sent_to_peers:
                 continue
             try:
-                self.ez_send(other_peer, payload)
+                # Serialize and sign once, then reuse the packet for every peer
+                if packet is None:
+                    packet = self.ezr_pack(payload.msg_id, payload)
+                self.endpoint.send(other_peer.address, packet)
                 if infohash:
-                    self.sent_to_peers[other_peer.mid].add(infohash)
+                    self.sent_to_peers.add(key)
                 self.logger.debug("Gossiped to peer %s", other_peer.mid.hex()[:16])
             except Exception as e:
                 self.logger.warning("Failed to gossip to peer %s: %s",
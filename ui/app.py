@@ -207,7 +207,12 @@ class Application(QMainWindow):
         Immediate refresh (useful for local UI actions).
         """
         self.issues_page.load(self.democracy_service.get_all_issues_with_votes())
+        self._refresh_details()
 
+    def _refresh_details(self) -> None:
+        """
+        Reload the open issue and solution detail pages, leaving the issue list as is.
+        """
         current_id = self.issue_detail_page.current_issue_id
         if current_id:
             issue = self.democracy_service.get_issue_with_votes(current_id)
@@ -288,7 +293,7 @@ class Application(QMainWindow):
     def _on_vote(self, issue_id: UUID):
         """
         Handles voting on an issue. Checks if the user has already voted, and if not, records the vote.
-        Refreshes the issue list afterwards.
+        Updates the voted issue's row and the open detail pages afterwards.
 
         :param issue_id: ID of the selected issue.
         :return: None
@@ -297,14 +302,20 @@ class Application(QMainWindow):
         if vote is None:
             return  # already voted
 
-        self.refresh()
+        # Only this issue's vote count changed, so update its row instead of
+        # reloading the whole issue list.
+        issue = self.democracy_service.get_issue_with_votes(issue_id)
+        if issue:
+            self.issues_page.update_issue(issue)
+        self._refresh_details()
 
     def _on_solution_vote(self, _issue_id: UUID, solution_id: UUID) -> None:
         vote = self.democracy_service.vote_for_solution(self.user.id, solution_id)
         if vote is None:
             return
 
-        self.refresh()
+        # Solution votes do not show up in the issue list.
+        self._refresh_details()
 
     def _on_solution_details(self, issue_id: UUID, solution_id: UUID) -> None:
         solution = self.democracy_service.get_solution_with_votes(solution_id)
@@ -196,9 +196,15 @@ class FleetWidget(QWidget):
         self._node_count_lbl.setText(f"Nodes: {len(rows)}")
 
         total = len(rows)
-        safe = sum(1 for r in rows if r.get("vps_days_remaining", 0) > 60)
-        safeish = sum(1 for r in rows if 30 <= r.get("vps_days_remaining", 0) <= 60)
-        dying = sum(1 for r in rows if r.get("vps_days_remaining", 0) < 30)
+        safe = safeish = dying = 0
+        for r in rows:
+            days_remaining = r.get("vps_days_remaining", 0)
+            if days_remaining > 60:
+                safe += 1
+            elif days_remaining >= 30:
+                safeish += 1
+            elif days_remaining < 30:
+                dying += 1
 
         self._total_lbl.setText(f"Total: {total}")
         self._safe_lbl.setText(f"Safe: {safe}")
@@ -84,6 +84,9 @@ class IssuesOverviewWidget(QWidget):
     def load(self, issues: list[IssueWithVotes]) -> None:
         self.issue_table.load(issues)
 
+    def update_issue(self, issue: IssueWithVotes) -> None:
+        self.issue_table.update_issue(issue)
+
     def set_search_text(self, text: str) -> None:
         self.search_input.setText(text)
 
@@ -83,6 +83,9 @@ class IssueTableWidget(QWidget):
         self.model.set_issues(issues)
         self.table.resizeColumnsToContents()
 
+    def update_issue(self, issue: IssueWithVotes) -> None:
+        self.model.update_issue(issue)
+
     def set_search_text(self, text: str) -> None:
         self.proxy.set_search_text(text)
 
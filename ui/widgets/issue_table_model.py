@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
@@ -9,6 +9,9 @@ from PySide6.QtGui import QColor
 from democracy.constants import ISSUE_THRESHOLD
 from democracy.models.DTOs.issue_with_votes import IssueWithVotes
 
+_PASSED_COLOR = QColor("#34d399")
+_OPEN_COLOR = QColor("#cbd5e1")
+
 
 class IssueTableModel(QAbstractTableModel):
     HEADERS = ["Issue ID", "Title", "Creator", "Threshold", "Votes", "Progress", "Status"]
@@ -16,6 +19,13 @@ class IssueTableModel(QAbstractTableModel):
     def __init__(self, issues: Optional[List[IssueWithVotes]] = None, parent=None):
         super().__init__(parent)
         self._issues: List[IssueWithVotes] = issues or []
+        # Display strings per row, built once per issue instead of on every data() call
+        self._display_rows: List[Tuple[str, ...]] = [
+            self._display_values(issue) for issue in self._issues
+        ]
+        self._row_by_id: Dict[UUID, int] = {
+            issue.issue.id: row for row, issue in enumerate(self._issues)
+        }
 
     # --- Qt model basics ---
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
@@ -37,27 +47,13 @@ class IssueTableModel(QAbstractTableModel):
             return None
 
         col = index.column()
-        i = self._issues[index.row()]
-        issue = i.issue
-        progress = min(100, int((i.votes / ISSUE_THRESHOLD) * 100))
-        status = "Passed" if i.votes >= ISSUE_THRESHOLD else "Open"
-
-        # Raw values for this row
-        values = [
-            str(issue.id)[:8] + "...",
-            issue.title,
-            str(issue.creator_id)[:24] + "...",
-            ISSUE_THRESHOLD,
-            i.votes,
-            progress,
-            status,
-        ]
+        row = index.row()
 
         if role == Qt.ItemDataRole.DisplayRole:
-            return str(values[col])
+            return self._display_rows[row][col]
 
         if role == Qt.ItemDataRole.UserRole:
-            return issue.id
+            return self._issues[row].issue.id
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
             if col in (3, 4):  # threshold + votes
@@ -65,17 +61,90 @@ class IssueTableModel(QAbstractTableModel):
             return int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
 
         if role == Qt.ItemDataRole.ForegroundRole and index.column() == 6:
-            if status == "Passed":
-                return QColor("#34d399")
-            return QColor("#cbd5e1")
+            if self._display_rows[row][6] == "Passed":
+                return _PASSED_COLOR
+            return _OPEN_COLOR
 
         return None
 
+    @staticmethod
+    def _display_values(i: IssueWithVotes) -> Tuple[str, ...]:
+        issue = i.issue
+        progress = min(100, int((i.votes / ISSUE_THRESHOLD) * 100))
+        status = "Passed" if i.votes >= ISSUE_THRESHOLD else "Open"
+
+        return (
+            str(issue.id)[:8] + "...",
+            issue.title,
+            str(issue.creator_id)[:24] + "...",
+            str(ISSUE_THRESHOLD),
+            str(i.votes),
+            str(progress),
+            status,
+        )
+
     # --- Convenience API for your widget ---
     def set_issues(self, issues: List[IssueWithVotes]) -> None:
-        self.beginResetModel()
-        self._issues = list(issues)
-        self.endResetModel()
+        """
+        Replace the listed issues, touching only the rows that differ.
+
+        Refreshes usually change one vote count or add the newest issue at the top, so
+        the view is told about exactly those rows. Any other change (removed or
+        reordered issues) falls back to a full model reset.
+
+        The model keeps and updates the given list instead of copying it, like the other
+        table models; callers pass a freshly loaded list and do not reuse it.
+        """
+        old_ids = [i.issue.id for i in self._issues]
+        new_ids = [i.issue.id for i in issues]
+        added = len(new_ids) - len(old_ids)
+
+        self._row_by_id = {issue_id: row for row, issue_id in enumerate(new_ids)}
+
+        if added < 0 or new_ids[added:] != old_ids:
+            self.beginResetModel()
+            self._issues = issues
+            self._display_rows = [self._display_values(issue) for issue in issues]
+            self.endResetModel()
+            return
+
+        # Unchanged rows keep their display strings; only new and changed rows are built.
+        previous = self._issues
+        display_rows = [self._display_values(issue) for issue in issues[:added]]
+        changed_rows = []
+        for old_row, old_issue in enumerate(previous):
+            row = old_row + added
+            if issues[row] == old_issue:
+                display_rows.append(self._display_rows[old_row])
+            else:
+                display_rows.append(self._display_values(issues[row]))
+                changed_rows.append(row)
+
+        if added:
+            self.beginInsertRows(QModelIndex(), 0, added - 1)
+            self._issues = issues
+            self._display_rows = display_rows
+            self.endInsertRows()
+        else:
+            self._issues = issues
+            self._display_rows = display_rows
+
+        last_column = len(self.HEADERS) - 1
+        for row in changed_rows:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+    def update_issue(self, issue: IssueWithVotes) -> None:
+        """
+        Replace a single listed issue in place, e.g. after its vote count changed.
+        Issues that are not listed yet are ignored; the next full refresh adds them.
+        """
+        row = self._row_by_id.get(issue.issue.id)
+        if row is None:
+            return
+
+        self._issues[row] = issue
+        self._display_rows[row] = self._display_values(issue)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
 
     def issue_id_at(self, row: int) -> Optional[UUID]:
         if 0 <= row < len(self._issues):
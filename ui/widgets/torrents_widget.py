@@ -175,9 +175,13 @@ class TorrentsWidget(QWidget):
         self._model.load(rows)
 
         total = len(rows)
-        healthy = sum(1 for r in rows if r.get("total_peers", 0) > 0)
+        healthy = exploding = 0
+        for r in rows:
+            if r.get("total_peers", 0) > 0:
+                healthy += 1
+            if r.get("exploding_estimator", 0.0) > 0.5:
+                exploding += 1
         no_peers = total - healthy
-        exploding = sum(1 for r in rows if r.get("exploding_estimator", 0.0) > 0.5)
 
         self._total_lbl.setText(f"Total: {total}")
         self._healthy_lbl.setText(f"Healthy: {healthy}")